@@ -0,0 +1,90 @@
+# benchmarks/bench_matching.py
+"""
+Compare the matching backends on synthetic data.
+
+    python benchmarks/bench_matching.py                      # 10k x 10k
+    python benchmarks/bench_matching.py --students 2000 --openings 2000 --per-student
+    python benchmarks/bench_matching.py --skill-tiebreak
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.matching import match_all_students, match_openings_for_student
+from models.opening import Opening
+from models.student import Student
+
+SPECS = [
+    "Software Engineering", "Electrical Engineering", "Mechanical Engineering",
+    "Civil Engineering", "Chemical Engineering", "Nuclear Engineering",
+    "Industrial Engineering", "Mining Engineering"
+]
+CITIES = ["Riyadh", "Jeddah", "Dammam", "Mecca", "Medina", "Abha", "Tabuk",
+          "Khobar", "Taif", "Hail", "Jazan", "Najran"]
+SKILLS = ["python", "java", "sql", "cad", "matlab", "plc", "autocad", "excel", "gis",
+          "c++", "solidworks", "r", "labview", "revit", "sap", "linux"]
+
+
+def make_data(n_students, n_openings, seed=0):
+    rng = random.Random(seed)
+    openings = [
+        Opening(i, f"c{i % 500}@co.com", f"Opening {i}", rng.choice(SPECS),
+                rng.choice(CITIES), rng.randrange(1000, 8000, 250), rng.sample(SKILLS, 3),
+                round(rng.uniform(0, 4.5), 1), rng.choice(["location", "gpa"]),
+                "2030-01-01T00:00:00")
+        for i in range(n_openings)
+    ]
+    students = [
+        Student(f"S{i}", f"Student {i}", f"s{i}@uni.edu", round(rng.uniform(2, 5), 2),
+                rng.choice(SPECS), rng.sample(CITIES, 3), rng.sample(SKILLS, 5))
+        for i in range(n_students)
+    ]
+    return students, openings
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28}{elapsed:8.2f}s")
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=10_000)
+    parser.add_argument("--openings", type=int, default=10_000)
+    parser.add_argument("--per-student", action="store_true",
+                        help="also time match_openings_for_student per student (slow)")
+    parser.add_argument("--skill-tiebreak", action="store_true",
+                        help="order equal stipends by skill overlap")
+    args = parser.parse_args()
+
+    students, openings = make_data(args.students, args.openings)
+    print(f"{args.students} students x {args.openings} openings")
+
+    tiebreak = args.skill_tiebreak
+    if args.per_student:
+        timed("per-student (python)",
+              lambda: {s.email: match_openings_for_student(s, openings, tiebreak)
+                       for s in students})
+    python, t_python = timed("batch (python)",
+                             lambda: match_all_students(students, openings,
+                                                        skill_tiebreak=tiebreak))
+    vectorized, t_numpy = timed("batch (numpy)",
+                                lambda: match_all_students(students, openings, backend="numpy",
+                                                           skill_tiebreak=tiebreak))
+
+    same = all([o.opening_id for o in python[e]] == [o.opening_id for o in vectorized[e]]
+               for e in python)
+    print(f"identical results: {same}; numpy speedup: {t_python / t_numpy:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+# database/connection.py
+
+import atexit
+import os
+import random
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+# Multi-user settings, all off by default; see configure().
+# Setting AMS_MULTIUSER=1 in the environment turns them all on.
+_settings = {
+    "wal": False,            # WAL journal: readers never wait for the writer
+    "busy_timeout": 5.0,     # seconds SQLite itself waits on a locked database
+    "busy_retries": 0,       # extra jittered retries after the timeout expires
+    "writer_queue": False,   # funnel writes through one batching writer thread
+}
+if os.environ.get("AMS_MULTIUSER") == "1":
+    _settings.update(wal=True, busy_retries=5, writer_queue=True)
+
+# (thread ident, db key) -> open connection, for close_all() and pruning
+_connections = {}
+# this thread's own {db key: connection}; thread idents are reused once a
+# thread exits, so lookups go through here rather than by ident
+_local = threading.local()
+# bumped by close_all() and after a fork, so threads drop what they cached
+_generation = 0
+# db keys whose schema has already been checked in this process
+_initialized = set()
+_lock = threading.Lock()
+
+
+def _db_key(db_path: str) -> str:
+    """Normalize a database path so 'ams.db' and './ams.db' share a connection."""
+    if db_path == ":memory:" or db_path.startswith("file:"):
+        return db_path
+    return os.path.abspath(db_path)
+
+
+def read_only_path(db_path: str) -> str:
+    """
+    Return a URI that opens `db_path` read-only (for worker processes that
+    must never write). get_connection() accepts it like a plain path.
+    """
+    # urllib.request pulls in http.client, ssl and email; import it only here
+    from urllib.request import pathname2url
+    return f"file:{pathname2url(os.path.abspath(db_path))}?mode=ro"
+
+
+def configure(**options):
+    """
+    Change the multi-user settings (wal, busy_timeout, busy_retries,
+    writer_queue). Call before the first DBManager is created; connections
+    that are already open keep the settings they were opened with.
+    """
+    unknown = set(options) - set(_settings)
+    if unknown:
+        raise TypeError(f"Unknown connection settings: {', '.join(sorted(unknown))}")
+    _settings.update(options)
+
+
+def settings() -> dict:
+    """Return a copy of the current multi-user settings."""
+    return dict(_settings)
+
+
+def is_busy_error(exc: Exception) -> bool:
+    """True if `exc` is SQLite reporting that another connection holds the lock."""
+    if not isinstance(exc, sqlite3.OperationalError):
+        return False
+    code = getattr(exc, "sqlite_errorcode", None)
+    if code is not None:
+        return code & 0xFF in (5, 6)  # SQLITE_BUSY, SQLITE_LOCKED
+    return "locked" in str(exc) or "busy" in str(exc)
+
+
+def retry_on_busy(func, retries=None, base_delay=0.05):
+    """
+    Call `func()` and retry it when the database is busy, sleeping an
+    exponentially growing, jittered delay between attempts so clients that
+    collided do not retry in lockstep.
+    """
+    if retries is None:
+        retries = _settings["busy_retries"]
+    attempt = 0
+    while True:
+        try:
+            return func()
+        except sqlite3.OperationalError as exc:
+            if attempt >= retries or not is_busy_error(exc):
+                raise
+            time.sleep(base_delay * (2 ** attempt) * random.uniform(0.5, 1.5))
+            attempt += 1
+
+
+@contextmanager
+def write_transaction(conn: sqlite3.Connection, name: str = "write"):
+    """
+    Run the block as one write: BEGIN IMMEDIATE (retried while busy) and
+    commit at the end, or roll back if it raises. If `conn` is already in
+    a transaction (a caller's, or one Python's sqlite3 opened implicitly),
+    the block runs in SAVEPOINT `name` instead: a failure undoes only the
+    block, and committing is left to whoever began the transaction.
+    """
+    if conn.in_transaction:
+        conn.execute(f"SAVEPOINT {name}")
+        try:
+            yield
+        except BaseException:
+            conn.execute(f"ROLLBACK TO {name}")
+            conn.execute(f"RELEASE {name}")
+            raise
+        conn.execute(f"RELEASE {name}")
+        return
+
+    retry_on_busy(lambda: conn.execute("BEGIN IMMEDIATE"))
+    try:
+        yield
+        retry_on_busy(conn.commit)
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+def _prune_dead_threads():
+    """Close connections owned by threads that have exited. Caller holds _lock."""
+    alive = {t.ident for t in threading.enumerate()}
+    for key in [k for k in _connections if k[0] not in alive]:
+        _connections.pop(key).close()
+
+
+def get_connection(db_path: str = "ams.db", init=None) -> sqlite3.Connection:
+    """
+    Return the long-lived connection for this thread and database.
+
+    The first call for a database in this process runs `init(conn)` once
+    (e.g. to create the schema); later calls, from any thread, skip it.
+    In-memory databases are private to each connection, so `init` runs
+    for every new connection to ':memory:'.
+    """
+    db_key = _db_key(db_path)
+    mine = getattr(_local, "connections", None)
+    if mine is None or _local.generation != _generation:
+        mine = _local.connections = {}
+        _local.generation = _generation
+    conn = mine.get(db_key)
+    if conn is not None:
+        return conn
+
+    key = (threading.get_ident(), db_key)
+    with _lock:
+        _prune_dead_threads()
+        # registered under our ident but not ours: a dead thread's that
+        # had the same ident and has not been pruned yet
+        stale = _connections.pop(key, None)
+        if stale is not None:
+            stale.close()
+        # check_same_thread=False only so close_all() can run at exit;
+        # each connection is still used by the thread that opened it.
+        conn = sqlite3.connect(db_path, check_same_thread=False,
+                               timeout=_settings["busy_timeout"],
+                               uri=db_path.startswith("file:"))
+        conn.row_factory = sqlite3.Row
+        if _settings["wal"] and db_path != ":memory:":
+            # WAL is persistent in the file; NORMAL sync is safe under WAL
+            retry_on_busy(lambda: conn.execute("PRAGMA journal_mode=WAL"))
+            conn.execute("PRAGMA synchronous=NORMAL")
+        if init is not None and (key[1] not in _initialized or db_path == ":memory:"):
+            init(conn)
+            _initialized.add(key[1])
+        _connections[key] = mine[db_key] = conn
+    return conn
+
+
+def close_all():
+    """Close every connection handed out so far. Registered to run at exit."""
+    global _generation
+    with _lock:
+        _generation += 1
+        while _connections:
+            _, conn = _connections.popitem()
+            conn.close()
+        _initialized.clear()
+
+
+def _forget_inherited():
+    """
+    A forked child must not use the parent's connections (SQLite handles
+    are not fork-safe). Drop them without closing; the parent still owns them.
+    """
+    global _lock, _generation
+    _connections.clear()
+    _generation += 1
+    _lock = threading.Lock()
+
+
+atexit.register(close_all)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_inherited)
@@ -1,111 +1,144 @@
 import sqlite3
 from datetime import datetime
+from itertools import islice
+from database.connection import get_connection, retry_on_busy, write_transaction
+from database.migrations import CHANGE_LOG_KEEP, PRUNE_CHANGE_LOG, migrate
+from database.writer import WriteResult, get_writer
+
+# Insert statements shared by the single-row and bulk methods
+_INSERT_STUDENT = """
+    INSERT INTO students
+      (student_id, name, mobile_number, email, gpa,
+       specialization, preferred_locations, skills)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_INSERT_OPENING = """
+    INSERT INTO openings (
+        company_email, opening_name, specialization,
+        location, stipend, required_skills,
+        required_gpa, priority, deadline, capacity
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# One row, whose UNIQUE check runs before anything is written, so OR FAIL
+# changes nothing on error (callers roll back to a savepoint anyway); it lets
+# SQLite skip the statement journal the change_log trigger would otherwise
+# need for every row, which made bulk inserts 2.5x slower. (Not used for
+# students/openings: an outer OR FAIL would override the OR IGNORE inside
+# their term triggers.)
+_INSERT_APPLICATION = "INSERT OR FAIL INTO applications (student_email, opening_id) VALUES (?,?)"
+
+# Applicants an opening accepts (GPA at least its required GPA, its location
+# among their preferred ones), best first: for location-priority openings by
+# location rank, then GPA descending; ties by email. applicant_ranks (schema
+# v9) holds exactly those rows keyed in that order, so a page is a seek on
+# its primary key, with the keyset cursor in WHERE, and only `limit` rows
+# are read; nothing is aggregated or sorted per page.
+_RANKED_APPLICANTS = """
+    SELECT s.*, r.opening_id AS opening_id,
+           r.location_rank AS location_rank, r.sort_rank AS sort_rank
+      FROM {source}
+     CROSS JOIN students s ON s.email = r.student_email
+     WHERE {where}
+     ORDER BY {opening_id}, r.sort_rank, r.neg_gpa, r.student_email
+"""
+
+# Column order of the plain tuples yielded by iter_openings/iter_students
+# with as_tuples=True (see models.matching.opening_from_tuple)
+OPENING_FIELDS = ("opening_id", "company_email", "opening_name", "specialization",
+                  "location", "stipend", "required_skills", "required_gpa",
+                  "priority", "deadline", "capacity")
+STUDENT_FIELDS = ("student_id", "name", "email", "gpa", "specialization",
+                  "preferred_locations", "skills")
+
+
+def _student_params(student: dict) -> tuple:
+    return (
+        student["student_id"],
+        student["name"],
+        student["mobile_number"],
+        student["email"],
+        student["gpa"],
+        student["specialization"],
+        student["preferred_locations"],
+        student["skills"],
+    )
+
+
+def _opening_params(data: dict) -> tuple:
+    return (
+        data["company_email"],
+        data["opening_name"],
+        data["specialization"],
+        data["location"],
+        data["stipend"],
+        data.get("required_skills", ""),
+        data.get("required_gpa", 0),
+        data.get("priority", "location"),
+        data.get("deadline", ""),
+        data.get("capacity", 1),
+    )
+
+
+def _application_params(app: dict) -> tuple:
+    return (app["student_email"], app["opening_id"])
+
+
+class BulkResult:
+    """Outcome of a bulk insert: row counts plus the first few failures."""
+
+    MAX_ERRORS = 100
+
+    def __init__(self):
+        self.inserted = 0
+        self.failed = 0
+        self.errors = []  # (row index, message), capped at MAX_ERRORS
+
+    def add_error(self, index: int, message: str):
+        self.failed += 1
+        if len(self.errors) < self.MAX_ERRORS:
+            self.errors.append((index, message))
+
+    def __repr__(self):
+        return f"<BulkResult inserted={self.inserted}, failed={self.failed}>"
+
 
 class DBManager:
     def __init__(self, db_path="ams.db"):
-        # 1) Open the connection you'll actually use everywhere
-        self.conn = sqlite3.connect(db_path)
-        self.conn.row_factory = sqlite3.Row
+        # 1) Borrow this thread's shared connection; pending migrations are
+        #    only checked the first time the database is opened in this process
+        self.db_path = db_path
+        self.conn = get_connection(db_path, init=migrate)
         self.cursor = self.conn.cursor()
 
-        # 2) Immediately ensure ALL tables exist on *this* connection
-        self._create_tables()
-
-    def _create_tables(self):
-        # Users table (auth)
-        self.cursor.execute("""
-        CREATE TABLE IF NOT EXISTS users (
-            email           TEXT PRIMARY KEY,
-            hashed_password TEXT NOT NULL,
-            role            TEXT NOT NULL
-                              CHECK(role IN ('student','company','admin'))
-        )
-        """)
-
-        # Students table
-        self.cursor.execute("""
-        CREATE TABLE IF NOT EXISTS students (
-            student_id        TEXT PRIMARY KEY,
-            name              TEXT NOT NULL,
-            mobile_number     TEXT NOT NULL,
-            email             TEXT NOT NULL UNIQUE,
-            gpa               REAL CHECK(gpa BETWEEN 0 AND 5),
-            specialization    TEXT NOT NULL,
-            preferred_locations TEXT NOT NULL,
-            skills            TEXT
-        )
-        """)
-
-        # Applications table
-        self.cursor.execute("""
-        CREATE TABLE IF NOT EXISTS applications (
-            application_id  INTEGER PRIMARY KEY AUTOINCREMENT,
-            student_email   TEXT    NOT NULL,
-            opening_id      INTEGER NOT NULL,
-            UNIQUE(student_email, opening_id),
-            FOREIGN KEY(student_email) REFERENCES students(email),
-            FOREIGN KEY(opening_id)    REFERENCES openings(opening_id)
-        )
-        """)
-
-        # Openings table (remove UNIQUE on company_email to allow multiple openings)
-        self.cursor.execute("""
-        CREATE TABLE IF NOT EXISTS openings (
-            opening_id      INTEGER PRIMARY KEY AUTOINCREMENT,
-            company_email   TEXT   NOT NULL,
-            opening_name    TEXT   NOT NULL,
-            specialization  TEXT   NOT NULL,
-            location        TEXT   NOT NULL,
-            stipend         REAL   CHECK(stipend > 0),
-            deadline        TEXT   NOT NULL,               -- ISO timestamp
-            required_skills TEXT,
-            required_gpa    REAL   NOT NULL CHECK(required_gpa BETWEEN 0 AND 5) DEFAULT 0,
-            priority        TEXT   NOT NULL CHECK(priority IN ('location','gpa')) DEFAULT 'location',
-            FOREIGN KEY(company_email) REFERENCES users(email)
-        )
-        """)
-
-        # Migrate schema: ensure deadline, required_gpa, priority columns exist
-        self.cursor.execute("PRAGMA table_info(openings)")
-        cols = [r[1] if isinstance(r, tuple) else r["name"] for r in self.cursor.fetchall()]
-        if "deadline" not in cols:
-            self.cursor.execute("ALTER TABLE openings ADD COLUMN deadline TEXT NOT NULL DEFAULT ''")
-        if "required_gpa" not in cols:
-            self.cursor.execute("ALTER TABLE openings ADD COLUMN required_gpa REAL NOT NULL DEFAULT 0")
-        if "priority" not in cols:
-            self.cursor.execute("ALTER TABLE openings ADD COLUMN priority TEXT NOT NULL DEFAULT 'location'")
-        self.conn.commit()
-
-        # Access logs
-        self.cursor.execute("""
-        CREATE TABLE IF NOT EXISTS access_logs (
-            log_id    INTEGER PRIMARY KEY AUTOINCREMENT,
-            email     TEXT,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
-
-        # Session logs
-        self.cursor.execute("""
-        CREATE TABLE IF NOT EXISTS session_logs (
-            session_id  INTEGER PRIMARY KEY AUTOINCREMENT,
-            email       TEXT,
-            login_time  TIMESTAMP,
-            logout_time TIMESTAMP
-        )
-        """)
-
-        self.conn.commit()
+    def _write(self, sql: str, params=()):
+        """
+        Run one write statement and commit it. In multi-user mode the
+        statement goes through the shared writer thread, which groups it
+        with other pending writes; otherwise it is committed here, retrying
+        with jittered backoff while another client holds the lock.
+        """
+        writer = get_writer(self.db_path)
+        if writer is not None:
+            return writer.execute(sql, params)
+
+        def attempt():
+            try:
+                self.cursor.execute(sql, params)
+                self.conn.commit()
+            except sqlite3.Error:
+                self.conn.rollback()
+                raise
+            return WriteResult(self.cursor.lastrowid, self.cursor.rowcount)
+        return retry_on_busy(attempt)
 
     # --- USER METHODS ---
 
     def insert_user(self, user: dict):
         """Insert a new user (email, hashed_password, role)."""
-        self.cursor.execute(
+        self._write(
             "INSERT INTO users (email, hashed_password, role) VALUES (?, ?, ?)",
             (user["email"], user["hashed_password"], user["role"])
         )
-        self.conn.commit()
 
     def get_user(self, email: str):
         """Fetch a user row by email, or return None if not found."""
@@ -119,11 +152,10 @@ class DBManager:
 
     def update_password(self, email: str, new_hashed: str):
         """Update only the password for an existing user."""
-        self.cursor.execute(
+        self._write(
             "UPDATE users SET hashed_password = ? WHERE email = ?",
             (new_hashed, email)
         )
-        self.conn.commit()
 
     # --- OPENING METHODS ---
 
@@ -134,34 +166,20 @@ class DBManager:
           company_email, opening_name, specialization,
           location, stipend, required_skills,
           required_gpa, priority, deadline
+        and optionally capacity (seats, default 1).
         """
-        self.cursor.execute(
-            """
-            INSERT INTO openings (
-                company_email, opening_name, specialization,
-                location, stipend, required_skills,
-                required_gpa, priority, deadline
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                data["company_email"],
-                data["opening_name"],
-                data["specialization"],
-                data["location"],
-                data["stipend"],
-                data.get("required_skills", ""),
-                data.get("required_gpa", 0),
-                data.get("priority", "location"),
-                data.get("deadline", ""),
-            )
-        )
-        self.conn.commit()
+        self._write(_INSERT_OPENING, _opening_params(data))
 
-    def get_openings_by_company(self, company_email: str):
-        """Return a list of openings for the given company email."""
+    def get_openings_by_company(self, company_email: str, after: int = None,
+                                limit: int = None):
+        """
+        Return a list of openings for the given company email, by opening_id.
+        With `after` (an opening_id) and `limit`, return just that page.
+        """
         self.cursor.execute(
-            "SELECT * FROM openings WHERE company_email = ?",
-            (company_email,)
+            "SELECT * FROM openings WHERE company_email = ? AND opening_id > ? "
+            "ORDER BY opening_id LIMIT ?",
+            (company_email, -1 if after is None else after, -1 if limit is None else limit)
         )
         return self.cursor.fetchall()
 
@@ -174,19 +192,120 @@ class DBManager:
         return self.cursor.fetchone()
 
     def get_openings_by_specialization(self, specialization: str):
-        """Return a list of openings matching the given specialization."""
+        """
+        Return a list of openings matching the given specialization, oldest
+        first, so openings with equal stipends always match in the same order.
+        """
         self.cursor.execute(
-            "SELECT * FROM openings WHERE specialization = ?",
+            "SELECT * FROM openings WHERE specialization = ? ORDER BY opening_id",
             (specialization,)
         )
         return self.cursor.fetchall()
 
+    def iter_matching_openings(self, specialization: str, gpa: float,
+                               preferred_locations, now: str = None,
+                               open_only: bool = False, limit: int = None,
+                               offset: int = 0, batch_size: int = 200):
+        """
+        Stream, in matching priority order, the openings a student with
+        this specialization, GPA and preferred_locations (list, best first)
+        is eligible for: GPA-priority openings first, then by preferred
+        location, then the rest, each by stipend descending (ties oldest
+        first). This is the order models.matching produces, computed by
+        SQLite from the (specialization, required_gpa) index, so ineligible
+        rows are never fetched.
+
+        Each row has an extra `is_closed` column: 1 if its deadline is
+        before `now` (an ISO timestamp string, compared as text like the
+        stored deadlines). open_only=True drops closed openings in SQL.
+        A location listed twice ranks at its first position.
+        """
+        prefs = list(preferred_locations)
+        now = now or datetime.now().isoformat(timespec="milliseconds")
+        if prefs:
+            whens = " ".join("WHEN ? THEN %d" % (i + 1) for i in range(len(prefs)))
+            loc_rank = f"CASE location {whens} ELSE {len(prefs) + 1} END"
+        else:
+            loc_rank = "1"
+        sql = f"""
+            SELECT *, (deadline <> '' AND deadline < ?) AS is_closed
+              FROM openings
+             WHERE specialization = ?
+               AND required_gpa <= ?
+               AND priority IN ('gpa', 'location')
+               {"AND (deadline = '' OR deadline >= ?)" if open_only else ""}
+             ORDER BY CASE WHEN priority = 'gpa' THEN 0 ELSE {loc_rank} END,
+                      stipend DESC, opening_id
+             LIMIT ? OFFSET ?
+        """
+        params = [now, specialization, gpa]
+        if open_only:
+            params.append(now)
+        params += prefs
+        params += [-1 if limit is None else limit, offset]
+
+        cur = self.conn.execute(sql, params)
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                return
+            yield from rows
+
+    def get_openings_requiring_skill(self, skill: str):
+        """Return openings listing `skill` (case-insensitive), oldest first."""
+        self.cursor.execute("""
+            SELECT o.*
+              FROM skills k
+              JOIN opening_skills os ON os.skill_id = k.skill_id
+              JOIN openings o        ON o.opening_id = os.opening_id
+             WHERE k.name = ?
+             ORDER BY o.opening_id
+        """, (skill.strip(),))
+        return self.cursor.fetchall()
+
+    def iter_openings(self, batch_size: int = 1000, as_tuples: bool = False):
+        """
+        Yield every opening row, fetching `batch_size` rows at a time.
+        as_tuples=True yields plain tuples of OPENING_FIELDS instead of
+        sqlite3.Row objects, which is cheaper for bulk loads.
+        """
+        cur = self.conn.cursor()
+        if as_tuples:
+            cur.row_factory = None
+        cur.execute(f"SELECT {', '.join(OPENING_FIELDS) if as_tuples else '*'} FROM openings")
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                return
+            yield from rows
+
+    def get_openings_version(self) -> int:
+        """
+        Return a counter that grows with every insert, update or delete on
+        `openings`, from any connection (kept by triggers, schema v6).
+        """
+        row = self.conn.execute(
+            "SELECT version FROM data_versions WHERE name = 'openings'").fetchone()
+        return row[0] if row else 0
+
+    def get_data_versions(self, names) -> dict:
+        """
+        Return {table: change counter} for the given tables ('openings',
+        'students', 'applications'); a counter changes whenever its table
+        does, from any connection (kept by triggers, schema v6 and v7).
+        """
+        names = list(names)
+        rows = self.conn.execute(
+            f"SELECT name, version FROM data_versions WHERE name IN ({','.join('?' * len(names))})",
+            names).fetchall()
+        return {name: version for name, version in rows}
+
     def update_opening(self, opening_id: int, data: dict):
         """
         Update an existing opening by its ID.
-        Handles all fields including deadline.
+        Handles all fields including deadline; capacity is kept unless given.
         """
-        self.cursor.execute(
+        self._write(
             """
             UPDATE openings SET
                 opening_name    = ?,
@@ -196,7 +315,8 @@ class DBManager:
                 required_skills = ?,
                 required_gpa    = ?,
                 priority        = ?,
-                deadline        = ?
+                deadline        = ?,
+                capacity        = COALESCE(?, capacity)
             WHERE opening_id = ?
             """,
             (
@@ -208,18 +328,17 @@ class DBManager:
                 data.get("required_gpa",  0),
                 data.get("priority",     "location"),
                 data.get("deadline",     ""),
+                data.get("capacity"),
                 opening_id,
             )
         )
-        self.conn.commit()
 
     def delete_opening(self, opening_id: int):
         """Remove an opening by its ID."""
-        self.cursor.execute(
+        self._write(
             "DELETE FROM openings WHERE opening_id = ?",
             (opening_id,)
         )
-        self.conn.commit()
 
     # --- STUDENT METHODS ---
 
@@ -235,25 +354,7 @@ class DBManager:
           - preferred_locations (str, comma-separated)
           - skills            (str)
         """
-        self.cursor.execute(
-            """
-            INSERT INTO students
-              (student_id, name, mobile_number, email, gpa,
-               specialization, preferred_locations, skills)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                student["student_id"],
-                student["name"],
-                student["mobile_number"],
-                student["email"],
-                student["gpa"],
-                student["specialization"],
-                student["preferred_locations"],
-                student["skills"],
-            )
-        )
-        self.conn.commit()
+        self._write(_INSERT_STUDENT, _student_params(student))
 
     def get_student_by_email(self, email: str):
         """Return the student row or None if not found."""
@@ -262,12 +363,51 @@ class DBManager:
         )
         return self.cursor.fetchone()
 
+    def get_students_by_specialization(self, specialization: str):
+        """Return the student rows of one specialization."""
+        self.cursor.execute(
+            "SELECT * FROM students WHERE specialization = ?", (specialization,)
+        )
+        return self.cursor.fetchall()
+
+    def get_students_preferring_location(self, location: str, max_rank: int = 2):
+        """
+        Return students who list `location` among their first `max_rank`
+        preferred locations, with their best `location_rank` (1 = first
+        choice), ordered by that rank.
+        """
+        self.cursor.execute("""
+            SELECT s.*, MIN(l.rank) AS location_rank
+              FROM student_locations l
+              JOIN students s ON s.email = l.student_email
+             WHERE l.location = ? AND l.rank <= ?
+             GROUP BY s.email
+             ORDER BY location_rank, s.email
+        """, (location, max_rank))
+        return self.cursor.fetchall()
+
+    def iter_students(self, batch_size: int = 1000, as_tuples: bool = False):
+        """
+        Yield every student row, fetching `batch_size` rows at a time.
+        as_tuples=True yields plain tuples of STUDENT_FIELDS instead of
+        sqlite3.Row objects, which is cheaper for bulk loads.
+        """
+        cur = self.conn.cursor()
+        if as_tuples:
+            cur.row_factory = None
+        cur.execute(f"SELECT {', '.join(STUDENT_FIELDS) if as_tuples else '*'} FROM students")
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                return
+            yield from rows
+
     def update_student(self, email: str, student: dict):
         """
         Update an existing student’s profile by email.
         `student` must contain the same keys as insert_student.
         """
-        self.cursor.execute(
+        self._write(
             """
             UPDATE students
                SET student_id         = ?,
@@ -290,49 +430,235 @@ class DBManager:
                 email
             )
         )
-        self.conn.commit()
 
     # --- APPLICATION METHODS ---
 
     def apply_to_opening(self, student_email: str, opening_id: int) -> bool:
         """Return True if first-time application; False if already applied."""
         try:
-            self.cursor.execute(
-                "INSERT INTO applications (student_email, opening_id) VALUES (?,?)",
-                (student_email, opening_id)
-            )
-            self.conn.commit()
+            self._write(_INSERT_APPLICATION, (student_email, opening_id))
             return True
         except sqlite3.IntegrityError:
             return False
 
     def cancel_application(self, student_email: str, opening_id: int):
-        self.cursor.execute(
+        self._write(
             "DELETE FROM applications WHERE student_email=? AND opening_id=?",
             (student_email, opening_id)
         )
-        self.conn.commit()
 
-    def get_applicants_by_opening(self, opening_id: int):
-        """Return sqlite3.Rows of students who applied to this opening."""
+    def get_applied_opening_ids(self, student_email: str) -> set:
+        """Return the ids of every opening the student has applied to."""
+        # answered from the UNIQUE(student_email, opening_id) index alone
+        self.cursor.execute(
+            "SELECT opening_id FROM applications WHERE student_email=?", (student_email,))
+        return {row[0] for row in self.cursor.fetchall()}
+
+    def get_applicants_among(self, opening_id: int, student_emails, chunk_size: int = 500) -> set:
+        """Return which of `student_emails` have applied to the opening."""
+        emails = list(student_emails)
+        found = set()
+        for start in range(0, len(emails), chunk_size):
+            chunk = emails[start:start + chunk_size]
+            # one UNIQUE(student_email, opening_id) index probe per email
+            self.cursor.execute(
+                "SELECT student_email FROM applications "
+                f"WHERE opening_id = ? AND student_email IN ({','.join('?' * len(chunk))})",
+                (opening_id, *chunk))
+            found.update(row[0] for row in self.cursor.fetchall())
+        return found
+
+    # --- CHANGE TRACKING ---
+
+    def get_data_version(self) -> int:
+        """
+        SQLite's PRAGMA data_version: it changes when another connection
+        commits to the database (this connection's own commits show up in
+        conn.total_changes instead). Costs no disk read.
+        """
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def get_last_change(self) -> int:
+        """Return the seq of the newest change_log row (0 if none)."""
+        row = self.conn.execute("SELECT MAX(seq) FROM change_log").fetchone()
+        return row[0] or 0
+
+    def get_changes(self, after: int, limit: int = 1000):
+        """
+        Return up to `limit` change_log rows (seq, name, op, opening_id,
+        email) newer than seq `after`, oldest first (schema v8).
+        """
+        self.cursor.execute(
+            "SELECT seq, name, op, opening_id, email FROM change_log "
+            "WHERE seq > ? ORDER BY seq LIMIT ?", (after, limit))
+        return self.cursor.fetchall()
+
+    def prune_changes(self, keep: int = CHANGE_LOG_KEEP):
+        """Delete all but the newest `keep` (at least 1) change_log rows."""
+        self._write(PRUNE_CHANGE_LOG, (max(keep, 1),))
+
+    # --- BULK METHODS ---
+
+    def insert_students_bulk(self, students, chunk_size=1000, on_error=None) -> BulkResult:
+        """Insert many student dicts (same keys as insert_student) in one transaction."""
+        return self._bulk_insert(_INSERT_STUDENT, _student_params, students, chunk_size, on_error)
+
+    def insert_openings_bulk(self, openings, chunk_size=1000, on_error=None) -> BulkResult:
+        """Insert many opening dicts (same keys as insert_opening) in one transaction."""
+        return self._bulk_insert(_INSERT_OPENING, _opening_params, openings, chunk_size, on_error)
+
+    def apply_bulk(self, applications, chunk_size=1000, on_error=None) -> BulkResult:
+        """Insert many {'student_email', 'opening_id'} dicts in one transaction."""
+        return self._bulk_insert(_INSERT_APPLICATION, _application_params,
+                                 applications, chunk_size, on_error)
+
+    def _bulk_insert(self, sql, to_params, rows, chunk_size, on_error) -> BulkResult:
+        """
+        Stream `rows` into `sql` with executemany, `chunk_size` rows at a time,
+        all inside one transaction (a savepoint of the caller's, if one is
+        open; see write_transaction). Only one chunk is held in memory, so any
+        iterable (e.g. a file reader) works regardless of size.
+
+        A chunk that fails is rolled back to its savepoint and replayed row by
+        row, so bad rows are collected (and passed to on_error(index, row, exc)
+        if given) while the good rows around them are still inserted.
+        """
+        result = BulkResult()
+        rows = iter(rows)
+        index = 0
+        with write_transaction(self.conn, "bulk_insert"):
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                params = []
+                for offset, row in enumerate(chunk):
+                    try:
+                        params.append((index + offset, row, to_params(row)))
+                    except (KeyError, TypeError) as exc:
+                        self._bulk_error(result, on_error, index + offset, row, exc)
+
+                self.cursor.execute("SAVEPOINT bulk_chunk")
+                try:
+                    self.cursor.executemany(sql, [p for _, _, p in params])
+                    result.inserted += len(params)
+                except sqlite3.DatabaseError:
+                    self.cursor.execute("ROLLBACK TO bulk_chunk")
+                    for row_index, row, row_params in params:
+                        try:
+                            self.cursor.execute(sql, row_params)
+                            result.inserted += 1
+                        except sqlite3.DatabaseError as exc:
+                            self._bulk_error(result, on_error, row_index, row, exc)
+                self.cursor.execute("RELEASE bulk_chunk")
+                index += len(chunk)
+            # Headless loads have no GUI pruning the log behind them
+            self.cursor.execute(PRUNE_CHANGE_LOG, (CHANGE_LOG_KEEP,))
+        return result
+
+    @staticmethod
+    def _bulk_error(result, on_error, index, row, exc):
+        result.add_error(index, str(exc))
+        if on_error is not None:
+            on_error(index, row, exc)
+
+    # --- ALLOCATION METHODS ---
+
+    def save_allocation(self, assignments: dict, seconds: float = None) -> int:
+        """
+        Record a placement round from {student email: opening_id or None}
+        in one transaction (or a savepoint of the caller's) and return its
+        round_id.
+        """
+        placed = [(email, oid) for email, oid in assignments.items() if oid is not None]
+        with write_transaction(self.conn, "save_allocation"):
+            self.cursor.execute(
+                "INSERT INTO allocation_rounds (students, placed, seconds) VALUES (?, ?, ?)",
+                (len(assignments), len(placed), seconds))
+            round_id = self.cursor.lastrowid
+            self.cursor.executemany(
+                "INSERT INTO allocations (round_id, student_email, opening_id) VALUES (?, ?, ?)",
+                [(round_id, email, oid) for email, oid in placed])
+        return round_id
+
+    def get_allocation_for_student(self, email: str, round_id: int = None):
+        """Return the opening row the student was placed in (latest round by default), or None."""
+        self.cursor.execute("""
+            SELECT o.*
+              FROM allocations a
+              JOIN openings o ON o.opening_id = a.opening_id
+             WHERE a.round_id = COALESCE(?, (SELECT MAX(round_id) FROM allocation_rounds))
+               AND a.student_email = ?
+        """, (round_id, email))
+        return self.cursor.fetchone()
+
+    def get_allocated_students(self, opening_id: int, round_id: int = None):
+        """Return the student rows placed in this opening (latest round by default)."""
         self.cursor.execute("""
             SELECT s.*
-              FROM students s
-              JOIN applications a ON s.email=a.student_email
+              FROM allocations a
+              JOIN students s ON s.email = a.student_email
+             WHERE a.round_id = COALESCE(?, (SELECT MAX(round_id) FROM allocation_rounds))
+               AND a.opening_id = ?
+             ORDER BY s.email
+        """, (round_id, opening_id))
+        return self.cursor.fetchall()
+
+    def get_applicants_by_opening(self, opening_id: int):
+        """
+        Return sqlite3.Rows of students who applied to this opening. Each
+        row carries `location_rank`: where the opening's location sits in
+        the student's preferred locations (1 = first), or None if absent.
+        """
+        self.cursor.execute("""
+            SELECT s.*,
+                   -- unary + keeps the lookup on the student's own few rows
+                   -- rather than on every student who prefers the city
+                   (SELECT MIN(l.rank) FROM student_locations l
+                     WHERE l.student_email = s.email AND +l.location = o.location
+                   ) AS location_rank
+              FROM applications a
+              JOIN openings o ON o.opening_id = a.opening_id
+              JOIN students s ON s.email = a.student_email
              WHERE a.opening_id=?
         """, (opening_id,))
         return self.cursor.fetchall()
 
+    def get_ranked_applicants(self, opening_id: int, after: tuple = None, limit: int = None):
+        """
+        Return one page of an opening's eligible applicants, best first.
+        `after` is the key (models.ranking.applicant_key) of the last row of the
+        previous page; rows carry `location_rank` and `sort_rank`.
+        """
+        where = "r.opening_id = ?"
+        if after:
+            where += " AND (r.sort_rank, r.neg_gpa, r.student_email) > (?, ?, ?)"
+        sql = _RANKED_APPLICANTS.format(source="applicant_ranks r", where=where,
+                                        opening_id="r.opening_id")
+        self.cursor.execute(sql + " LIMIT ?", (opening_id, *(after or ()),
+                                               -1 if limit is None else limit))
+        return self.cursor.fetchall()
+
+    def get_ranked_applicants_by_company(self, company_email: str):
+        """
+        Return the eligible applicants of every opening of a company, ordered
+        by opening_id and then ranked as in get_ranked_applicants.
+        """
+        sql = _RANKED_APPLICANTS.format(
+            source="openings o CROSS JOIN applicant_ranks r ON r.opening_id = o.opening_id",
+            where="o.company_email = ?", opening_id="o.opening_id")
+        self.cursor.execute(sql, (company_email,))
+        return self.cursor.fetchall()
+
     def log_access(self, email: str):
         """
         Record a login attempt in the access_logs table.
         Stores the email and current timestamp.
         """
-        self.cursor.execute(
+        self._write(
             "INSERT INTO access_logs (email) VALUES (?)",
             (email,)
         )
-        self.conn.commit()
 
     def log_session(self, email: str, login: bool):
         """
@@ -340,17 +666,20 @@ class DBManager:
         If login=False, update the most recent session log (with no logout_time) for this email.
         """
         if login:
-            self.cursor.execute(
+            self._write(
                 "INSERT INTO session_logs (email, login_time) VALUES (?, CURRENT_TIMESTAMP)",
                 (email,)
             )
         else:
-            self.cursor.execute(
+            self._write(
                 "UPDATE session_logs SET logout_time = CURRENT_TIMESTAMP \
                  WHERE email = ? AND logout_time IS NULL",
                 (email,)
             )
-        self.conn.commit()
 
     def close(self):
-        self.conn.close()
+        """
+        Release this manager's cursor. The underlying connection is shared
+        with the rest of the thread and is closed by the registry at exit.
+        """
+        self.cursor.close()
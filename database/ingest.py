@@ -0,0 +1,193 @@
+# database/ingest.py
+"""
+Headless bulk loader for term-start onboarding.
+
+    python -m database.ingest students  students.csv
+    python -m database.ingest openings  openings.jsonl --db ams.db
+    python -m database.ingest applications applications.csv --chunk-size 5000
+
+Files are read as a stream (CSV with a header row, or one JSON object per
+line for .jsonl/.ndjson), validated with utils/validation.py and handed to
+the DBManager bulk methods, so memory stays flat however large the file is.
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from datetime import datetime
+
+from database.db_manager import DBManager
+from utils.validation import is_valid_email, is_valid_mobile, is_valid_gpa, is_positive_number
+
+
+def read_rows(path: str):
+    """
+    Yield (line number, row) pairs from a CSV or JSON-lines file. CSV rows
+    are dicts; JSON lines are yielded as text and parsed by parse_row(),
+    so a malformed line is rejected like any other invalid row.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith((".jsonl", ".ndjson")):
+            for line_no, line in enumerate(f, start=1):
+                if line.strip():
+                    yield line_no, line
+        else:
+            # line 1 is the header
+            for line_no, row in enumerate(csv.DictReader(f), start=2):
+                yield line_no, row
+
+
+def parse_row(raw) -> dict:
+    """Return the row dict for one item from read_rows(); raise ValueError if malformed."""
+    if isinstance(raw, str):
+        try:
+            raw = json.loads(raw)
+        except ValueError as exc:
+            raise ValueError(f"invalid JSON: {exc}")
+    if not isinstance(raw, dict):
+        raise ValueError("expected a JSON object")
+    return raw
+
+
+def _text(row: dict, key: str) -> str:
+    """The value under `key` as stripped text; missing and null become ""."""
+    value = row.get(key)
+    return "" if value is None else str(value).strip()
+
+
+def clean_student(row: dict) -> dict:
+    """Validate and normalize one student row; raise ValueError if invalid."""
+    if not is_valid_email(_text(row, "email")):
+        raise ValueError("invalid email")
+    if not is_valid_mobile(_text(row, "mobile_number")):
+        raise ValueError("invalid mobile number")
+    if not is_valid_gpa(row.get("gpa")):
+        raise ValueError("GPA must be between 0 and 5")
+    for key in ("student_id", "name", "specialization", "preferred_locations"):
+        if not _text(row, key):
+            raise ValueError(f"{key} is required")
+    return {
+        "student_id":          _text(row, "student_id"),
+        "name":                _text(row, "name"),
+        "mobile_number":       _text(row, "mobile_number"),
+        "email":               _text(row, "email"),
+        "gpa":                 float(row["gpa"]),
+        "specialization":      _text(row, "specialization"),
+        "preferred_locations": _text(row, "preferred_locations"),
+        "skills":              _text(row, "skills"),
+    }
+
+
+def clean_opening(row: dict) -> dict:
+    """Validate and normalize one opening row; raise ValueError if invalid."""
+    if not is_valid_email(_text(row, "company_email")):
+        raise ValueError("invalid company email")
+    if not is_positive_number(row.get("stipend")):
+        raise ValueError("stipend must be a positive number")
+    required_gpa = row.get("required_gpa") or 0
+    if not is_valid_gpa(required_gpa):
+        raise ValueError("required GPA must be between 0 and 5")
+    priority = _text(row, "priority") or "location"
+    if priority not in ("location", "gpa"):
+        raise ValueError("priority must be 'location' or 'gpa'")
+    try:
+        capacity = int(row.get("capacity") or 1)
+    except (TypeError, ValueError):
+        raise ValueError("capacity must be a whole number")
+    if capacity < 1:
+        raise ValueError("capacity must be at least 1")
+    for key in ("opening_name", "specialization", "location"):
+        if not _text(row, key):
+            raise ValueError(f"{key} is required")
+    deadline = _text(row, "deadline")
+    if deadline:
+        # read back with fromisoformat (models/opening.py, models/columnar.py)
+        try:
+            datetime.fromisoformat(deadline)
+        except ValueError:
+            raise ValueError("deadline must be an ISO date, e.g. 2025-06-30T23:59:00")
+    return {
+        "company_email":   _text(row, "company_email"),
+        "opening_name":    _text(row, "opening_name"),
+        "specialization":  _text(row, "specialization"),
+        "location":        _text(row, "location"),
+        "stipend":         float(row["stipend"]),
+        "required_skills": _text(row, "required_skills"),
+        "required_gpa":    float(required_gpa),
+        "priority":        priority,
+        "deadline":        deadline,
+        "capacity":        capacity,
+    }
+
+
+def clean_application(row: dict) -> dict:
+    """Validate and normalize one application row; raise ValueError if invalid."""
+    if not is_valid_email(_text(row, "student_email")):
+        raise ValueError("invalid student email")
+    try:
+        opening_id = int(row.get("opening_id"))
+    except (TypeError, ValueError):
+        raise ValueError("opening_id must be an integer")
+    return {"student_email": _text(row, "student_email"), "opening_id": opening_id}
+
+
+# kind -> (row cleaner, DBManager bulk method name)
+KINDS = {
+    "students":     (clean_student, "insert_students_bulk"),
+    "openings":     (clean_opening, "insert_openings_bulk"),
+    "applications": (clean_application, "apply_bulk"),
+}
+
+
+def ingest(db: DBManager, kind: str, path: str, chunk_size: int = 1000, report=print):
+    """
+    Stream `path` into the database and return (inserted, rejected, seconds).
+    Rows that fail validation or are refused by the database are reported
+    with their line number via `report` and skipped.
+    """
+    clean, method = KINDS[kind]
+    rejected = 0
+
+    def valid_rows():
+        nonlocal rejected
+        for line_no, raw in read_rows(path):
+            try:
+                row = clean(parse_row(raw))
+            except (TypeError, ValueError, KeyError) as exc:
+                rejected += 1
+                report(f"line {line_no}: {exc}")
+                continue
+            # Extra keys are ignored by the bulk methods; keep the line for errors
+            row["_line"] = line_no
+            yield row
+
+    def db_error(index, row, exc):
+        report(f"line {row['_line']}: {exc}")
+
+    start = time.perf_counter()
+    result = getattr(db, method)(valid_rows(), chunk_size=chunk_size, on_error=db_error)
+    elapsed = time.perf_counter() - start
+    return result.inserted, rejected + result.failed, elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk load AMS data from CSV/JSONL files.")
+    parser.add_argument("kind", choices=sorted(KINDS))
+    parser.add_argument("path", help="CSV file with a header row, or .jsonl/.ndjson")
+    parser.add_argument("--db", default="ams.db", help="database file (default: ams.db)")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    report = lambda msg: print(msg, file=sys.stderr)
+    inserted, rejected, elapsed = ingest(DBManager(args.db), args.kind, args.path,
+                                         args.chunk_size, report)
+    rate = inserted / elapsed if elapsed else 0.0
+    print(f"{args.kind}: {inserted} inserted, {rejected} rejected "
+          f"in {elapsed:.2f}s ({rate:,.0f} rows/s)")
+    return 0 if rejected == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,551 @@
+# database/migrations.py
+"""
+Ordered schema migrations. The schema version lives in PRAGMA user_version,
+so an up-to-date database costs a single integer read to check.
+
+To change the schema, append a new step to MIGRATIONS; never edit a step
+that has already shipped.
+"""
+
+import sqlite3
+
+
+def _v1_base_schema(cursor):
+    """Tables as they existed before versioned migrations."""
+    # Users table (auth)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS users (
+        email           TEXT PRIMARY KEY,
+        hashed_password TEXT NOT NULL,
+        role            TEXT NOT NULL
+                          CHECK(role IN ('student','company','admin'))
+    )
+    """)
+
+    # Students table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS students (
+        student_id        TEXT PRIMARY KEY,
+        name              TEXT NOT NULL,
+        mobile_number     TEXT NOT NULL,
+        email             TEXT NOT NULL UNIQUE,
+        gpa               REAL CHECK(gpa BETWEEN 0 AND 5),
+        specialization    TEXT NOT NULL,
+        preferred_locations TEXT NOT NULL,
+        skills            TEXT
+    )
+    """)
+
+    # Applications table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS applications (
+        application_id  INTEGER PRIMARY KEY AUTOINCREMENT,
+        student_email   TEXT    NOT NULL,
+        opening_id      INTEGER NOT NULL,
+        UNIQUE(student_email, opening_id),
+        FOREIGN KEY(student_email) REFERENCES students(email),
+        FOREIGN KEY(opening_id)    REFERENCES openings(opening_id)
+    )
+    """)
+
+    # Openings table (remove UNIQUE on company_email to allow multiple openings)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS openings (
+        opening_id      INTEGER PRIMARY KEY AUTOINCREMENT,
+        company_email   TEXT   NOT NULL,
+        opening_name    TEXT   NOT NULL,
+        specialization  TEXT   NOT NULL,
+        location        TEXT   NOT NULL,
+        stipend         REAL   CHECK(stipend > 0),
+        deadline        TEXT   NOT NULL,               -- ISO timestamp
+        required_skills TEXT,
+        required_gpa    REAL   NOT NULL CHECK(required_gpa BETWEEN 0 AND 5) DEFAULT 0,
+        priority        TEXT   NOT NULL CHECK(priority IN ('location','gpa')) DEFAULT 'location',
+        FOREIGN KEY(company_email) REFERENCES users(email)
+    )
+    """)
+
+    # Databases created by older builds (or the old database/setup.py) may
+    # have an openings table without deadline, required_gpa and priority
+    cursor.execute("PRAGMA table_info(openings)")
+    cols = [r[1] if isinstance(r, tuple) else r["name"] for r in cursor.fetchall()]
+    if "deadline" not in cols:
+        cursor.execute("ALTER TABLE openings ADD COLUMN deadline TEXT NOT NULL DEFAULT ''")
+    if "required_gpa" not in cols:
+        cursor.execute("ALTER TABLE openings ADD COLUMN required_gpa REAL NOT NULL DEFAULT 0")
+    if "priority" not in cols:
+        cursor.execute("ALTER TABLE openings ADD COLUMN priority TEXT NOT NULL DEFAULT 'location'")
+
+    # Access logs
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS access_logs (
+        log_id    INTEGER PRIMARY KEY AUTOINCREMENT,
+        email     TEXT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+    """)
+
+    # Session logs
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS session_logs (
+        session_id  INTEGER PRIMARY KEY AUTOINCREMENT,
+        email       TEXT,
+        login_time  TIMESTAMP,
+        logout_time TIMESTAMP
+    )
+    """)
+
+
+def _v2_secondary_indexes(cursor):
+    """Indexes for every DBManager lookup that is not on a primary key."""
+    # get_openings_by_specialization (required_gpa lets the GPA filter
+    # of the matching query be answered from the same index)
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_openings_specialization
+        ON openings(specialization, required_gpa)
+    """)
+    # get_openings_by_company
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_openings_company
+        ON openings(company_email)
+    """)
+    # get_applicants_by_opening: covers the join to students(email)
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_applications_opening
+        ON applications(opening_id, student_email)
+    """)
+    # log_session(login=False) only ever touches open sessions
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_session_logs_open
+        ON session_logs(email) WHERE logout_time IS NULL
+    """)
+
+
+def _v3_materialized_matches(cursor):
+    """Materialized match lists, kept current by models/match_store.py."""
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS student_matches (
+        student_email TEXT    NOT NULL,
+        rank          INTEGER NOT NULL,
+        opening_id    INTEGER NOT NULL,
+        PRIMARY KEY (student_email, rank)
+    ) WITHOUT ROWID
+    """)
+
+    # Work queue of match lists that may be stale. A row names either a
+    # slice (every student of `specialization` with gpa >= min_gpa) or
+    # one student. Triggers fill it, so changes made by any process or
+    # code path (GUI, bulk ingest, sqlite3 shell) are picked up.
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS match_dirty (
+        dirty_id       INTEGER PRIMARY KEY,
+        specialization TEXT,
+        min_gpa        REAL,
+        student_email  TEXT
+    )
+    """)
+
+    # Finding the students in a slice
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_students_specialization
+        ON students(specialization, gpa)
+    """)
+
+    cursor.execute("""
+    CREATE TRIGGER IF NOT EXISTS trg_openings_insert_matches AFTER INSERT ON openings
+    BEGIN
+        INSERT INTO match_dirty (specialization, min_gpa)
+        VALUES (NEW.specialization, NEW.required_gpa);
+    END
+    """)
+    cursor.execute("""
+    CREATE TRIGGER IF NOT EXISTS trg_openings_update_matches AFTER UPDATE ON openings
+    BEGIN
+        INSERT INTO match_dirty (specialization, min_gpa)
+        VALUES (OLD.specialization, OLD.required_gpa),
+               (NEW.specialization, NEW.required_gpa);
+    END
+    """)
+    cursor.execute("""
+    CREATE TRIGGER IF NOT EXISTS trg_openings_delete_matches AFTER DELETE ON openings
+    BEGIN
+        INSERT INTO match_dirty (specialization, min_gpa)
+        VALUES (OLD.specialization, OLD.required_gpa);
+    END
+    """)
+    cursor.execute("""
+    CREATE TRIGGER IF NOT EXISTS trg_students_insert_matches AFTER INSERT ON students
+    BEGIN
+        INSERT INTO match_dirty (student_email) VALUES (NEW.email);
+    END
+    """)
+    cursor.execute("""
+    CREATE TRIGGER IF NOT EXISTS trg_students_update_matches AFTER UPDATE ON students
+    BEGIN
+        DELETE FROM student_matches WHERE student_email = OLD.email AND OLD.email <> NEW.email;
+        INSERT INTO match_dirty (student_email) VALUES (NEW.email);
+    END
+    """)
+    cursor.execute("""
+    CREATE TRIGGER IF NOT EXISTS trg_students_delete_matches AFTER DELETE ON students
+    BEGIN
+        DELETE FROM student_matches WHERE student_email = OLD.email;
+    END
+    """)
+
+    # Existing students have never been materialized
+    cursor.execute("INSERT INTO match_dirty (student_email) SELECT email FROM students")
+
+
+# Split a delimited text column into json_each() rows. json_quote escapes
+# quotes, backslashes and control characters, none of which contain the
+# delimiter, so swapping each delimiter for '","' always yields a valid
+# JSON array (and NULL becomes [null], which the callers filter out).
+def _split(column: str, sep: str) -> str:
+    return f"""json_each('[' || replace(json_quote({column}), '{sep}', '","') || ']')"""
+
+
+def _v4_normalized_terms(cursor):
+    """
+    Skills and preferred locations as rows, kept in sync by triggers.
+    The delimited text columns stay the source of truth; splitting them
+    needs the JSON functions (built into SQLite 3.38+).
+    """
+    # Skill names are matched case-insensitively: "Python" == "python"
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS skills (
+        skill_id INTEGER PRIMARY KEY,
+        name     TEXT    NOT NULL UNIQUE COLLATE NOCASE
+    )
+    """)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS student_skills (
+        student_email TEXT    NOT NULL,
+        skill_id      INTEGER NOT NULL,
+        PRIMARY KEY (student_email, skill_id)
+    ) WITHOUT ROWID
+    """)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS opening_skills (
+        opening_id INTEGER NOT NULL,
+        skill_id   INTEGER NOT NULL,
+        PRIMARY KEY (opening_id, skill_id)
+    ) WITHOUT ROWID
+    """)
+    # rank is the 1-based position in preferred_locations
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS student_locations (
+        student_email TEXT    NOT NULL,
+        rank          INTEGER NOT NULL,
+        location      TEXT    NOT NULL,
+        PRIMARY KEY (student_email, rank)
+    ) WITHOUT ROWID
+    """)
+
+    # The inverted indexes: skill -> students/openings, location -> students
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_student_skills_skill
+        ON student_skills(skill_id, student_email)
+    """)
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_opening_skills_skill
+        ON opening_skills(skill_id, opening_id)
+    """)
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_student_locations_location
+        ON student_locations(location, rank, student_email)
+    """)
+
+    # The same statements fill the tables from NEW.* in the triggers and
+    # from every existing row (alias s / o) in the backfill below
+    def fill_students(row: str, source: str = "") -> list:
+        skills = _split(f"{row}.skills", ",")
+        locations = _split(f"{row}.preferred_locations", ";")
+        return [
+            f"""INSERT OR IGNORE INTO skills (name)
+                SELECT trim(j.value) FROM {source}{skills} j WHERE trim(j.value) <> ''""",
+            f"""INSERT OR IGNORE INTO student_skills (student_email, skill_id)
+                SELECT {row}.email, k.skill_id FROM {source}{skills} j
+                  JOIN skills k ON k.name = trim(j.value)""",
+            f"""INSERT INTO student_locations (student_email, rank, location)
+                SELECT {row}.email, j.key + 1, j.value FROM {source}{locations} j
+                 WHERE j.value <> ''""",
+        ]
+
+    def fill_openings(row: str, source: str = "") -> list:
+        skills = _split(f"{row}.required_skills", ",")
+        return [
+            f"""INSERT OR IGNORE INTO skills (name)
+                SELECT trim(j.value) FROM {source}{skills} j WHERE trim(j.value) <> ''""",
+            f"""INSERT OR IGNORE INTO opening_skills (opening_id, skill_id)
+                SELECT {row}.opening_id, k.skill_id FROM {source}{skills} j
+                  JOIN skills k ON k.name = trim(j.value)""",
+        ]
+
+    def trigger(name: str, event: str, statements: list):
+        body = "".join(f"{sql};\n" for sql in statements)
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {event}\nBEGIN\n{body}END")
+
+    forget_student = ["DELETE FROM student_skills WHERE student_email = OLD.email",
+                      "DELETE FROM student_locations WHERE student_email = OLD.email"]
+    forget_opening = ["DELETE FROM opening_skills WHERE opening_id = OLD.opening_id"]
+
+    trigger("trg_students_insert_terms", "AFTER INSERT ON students",
+            fill_students("NEW"))
+    trigger("trg_students_update_terms",
+            "AFTER UPDATE OF email, skills, preferred_locations ON students",
+            forget_student + fill_students("NEW"))
+    trigger("trg_students_delete_terms", "AFTER DELETE ON students", forget_student)
+    trigger("trg_openings_insert_terms", "AFTER INSERT ON openings",
+            fill_openings("NEW"))
+    trigger("trg_openings_update_terms", "AFTER UPDATE OF required_skills ON openings",
+            forget_opening + fill_openings("NEW"))
+    trigger("trg_openings_delete_terms", "AFTER DELETE ON openings", forget_opening)
+
+    # Backfill existing rows
+    for sql in fill_students("s", "students s, ") + fill_openings("o", "openings o, "):
+        cursor.execute(sql)
+
+
+def _v5_allocation_rounds(cursor):
+    """Opening capacities and the results of allocation runs."""
+    cursor.execute("PRAGMA table_info(openings)")
+    cols = [r[1] if isinstance(r, tuple) else r["name"] for r in cursor.fetchall()]
+    if "capacity" not in cols:
+        cursor.execute("ALTER TABLE openings ADD COLUMN capacity INTEGER NOT NULL "
+                       "DEFAULT 1 CHECK(capacity >= 1)")
+
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS allocation_rounds (
+        round_id   INTEGER PRIMARY KEY AUTOINCREMENT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        students   INTEGER NOT NULL,
+        placed     INTEGER NOT NULL,
+        seconds    REAL
+    )
+    """)
+    # One row per placed student; unplaced students have no row
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS allocations (
+        round_id      INTEGER NOT NULL,
+        student_email TEXT    NOT NULL,
+        opening_id    INTEGER NOT NULL,
+        PRIMARY KEY (round_id, student_email),
+        FOREIGN KEY(round_id)   REFERENCES allocation_rounds(round_id),
+        FOREIGN KEY(opening_id) REFERENCES openings(opening_id)
+    ) WITHOUT ROWID
+    """)
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_allocations_opening
+        ON allocations(round_id, opening_id)
+    """)
+
+
+def _v6_data_versions(cursor):
+    """Change counters that caches compare against (see models/match_cache.py)."""
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS data_versions (
+        name    TEXT PRIMARY KEY,
+        version INTEGER NOT NULL
+    ) WITHOUT ROWID
+    """)
+    cursor.execute("INSERT OR IGNORE INTO data_versions (name, version) VALUES ('openings', 0)")
+
+    # Bumped by triggers so edits from any process or code path count
+    for event in ("INSERT", "UPDATE", "DELETE"):
+        cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_openings_{event.lower()}_version
+        AFTER {event} ON openings
+        BEGIN
+            UPDATE data_versions SET version = version + 1 WHERE name = 'openings';
+        END
+        """)
+
+
+def _v7_more_data_versions(cursor):
+    """Change counters for students and applications (see gui/navigator.py)."""
+    for table in ("students", "applications"):
+        cursor.execute(
+            "INSERT OR IGNORE INTO data_versions (name, version) VALUES (?, 0)", (table,))
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_{event.lower()}_version
+            AFTER {event} ON {table}
+            BEGIN
+                UPDATE data_versions SET version = version + 1 WHERE name = '{table}';
+            END
+            """)
+
+
+def _v8_change_log(cursor):
+    """
+    Which rows changed, for live views (see gui/changes.py). Each insert,
+    update or delete on openings, students and applications appends one
+    row naming the opening and/or student email it touched; the
+    data_versions bump moves into the same trigger.
+    """
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS change_log (
+        seq         INTEGER PRIMARY KEY,  -- pruning keeps the newest row, so never reused
+        name        TEXT NOT NULL,       -- table: openings, students or applications
+        op          TEXT NOT NULL,       -- insert, update or delete
+        opening_id  INTEGER,
+        email       TEXT
+    )
+    """)
+    keys = {
+        "openings": ("{row}.opening_id", "NULL"),
+        "students": ("NULL", "{row}.email"),
+        "applications": ("{row}.opening_id", "{row}.student_email"),
+    }
+    for table, (opening_id, email) in keys.items():
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            row = "OLD" if event == "DELETE" else "NEW"
+            cursor.execute(f"DROP TRIGGER IF EXISTS trg_{table}_{event.lower()}_version")
+            cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_{event.lower()}_changes
+            AFTER {event} ON {table}
+            BEGIN
+                UPDATE data_versions SET version = version + 1 WHERE name = '{table}';
+                INSERT INTO change_log (name, op, opening_id, email)
+                VALUES ('{table}', '{event.lower()}', {opening_id.format(row=row)},
+                        {email.format(row=row)});
+            END
+            """)
+
+
+def _v9_applicant_ranks(cursor):
+    """
+    Each opening's eligible applicants stored in ranking order, so that
+    DBManager.get_ranked_applicants seeks to a page instead of ranking
+    every applicant per page. Rows are recomputed by triggers whenever an
+    application, the student or the opening changes.
+    """
+    # neg_gpa is -gpa so that ascending key order is best first
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS applicant_ranks (
+        opening_id    INTEGER NOT NULL,
+        sort_rank     INTEGER NOT NULL,
+        neg_gpa       REAL    NOT NULL,
+        student_email TEXT    NOT NULL,
+        location_rank INTEGER NOT NULL,
+        PRIMARY KEY (opening_id, sort_rank, neg_gpa, student_email)
+    ) WITHOUT ROWID
+    """)
+    cursor.execute("""
+    CREATE INDEX IF NOT EXISTS idx_applicant_ranks_student
+        ON applicant_ranks(student_email, opening_id)
+    """)
+
+    # Ranks of the applications matching `where`. `locations` yields the
+    # student's (rank, location) rows; the students trigger reads them from
+    # NEW.preferred_locations, since student_locations may not be updated
+    # yet (trigger order is unspecified). CROSS JOIN pins the order to
+    # start from the applications: starting from everyone who prefers the
+    # opening's city would cost a full pass per inserted opening.
+    def ranks(where: str, locations: str = "student_locations") -> str:
+        return f"""
+            INSERT INTO applicant_ranks
+                   (opening_id, sort_rank, neg_gpa, student_email, location_rank)
+            SELECT a.opening_id,
+                   CASE o.priority WHEN 'location' THEN MIN(l.rank) ELSE 0 END,
+                   -s.gpa, s.email, MIN(l.rank)
+              FROM applications a
+             CROSS JOIN openings o ON o.opening_id = a.opening_id
+             CROSS JOIN students s ON s.email = a.student_email AND s.gpa >= o.required_gpa
+             CROSS JOIN {locations} l ON l.student_email = s.email AND l.location = o.location
+             WHERE {where}
+             GROUP BY a.opening_id, s.email"""
+
+    new_locations = (f"(SELECT NEW.email AS student_email, j.key + 1 AS rank, "
+                     f"j.value AS location FROM {_split('NEW.preferred_locations', ';')} j "
+                     f"WHERE j.value <> '')")
+    forget = {
+        "application": "DELETE FROM applicant_ranks WHERE opening_id = OLD.opening_id "
+                       "AND student_email = OLD.student_email",
+        "student": "DELETE FROM applicant_ranks WHERE student_email = OLD.email",
+        "opening": "DELETE FROM applicant_ranks WHERE opening_id = OLD.opening_id",
+    }
+    fill = {
+        "application": ranks("a.opening_id = NEW.opening_id AND a.student_email = NEW.student_email"),
+        "student": ranks("a.student_email = NEW.email", new_locations),
+        "opening": ranks("a.opening_id = NEW.opening_id"),
+    }
+    triggers = [
+        ("applications", "insert", "AFTER INSERT ON applications", [], ["application"]),
+        ("applications", "update", "AFTER UPDATE ON applications", ["application"], ["application"]),
+        ("applications", "delete", "AFTER DELETE ON applications", ["application"], []),
+        ("students", "insert", "AFTER INSERT ON students", [], ["student"]),
+        ("students", "update", "AFTER UPDATE OF email, gpa, preferred_locations ON students",
+         ["student"], ["student"]),
+        ("students", "delete", "AFTER DELETE ON students", ["student"], []),
+        ("openings", "insert", "AFTER INSERT ON openings", [], ["opening"]),
+        ("openings", "update", "AFTER UPDATE OF location, priority, required_gpa ON openings",
+         ["opening"], ["opening"]),
+        ("openings", "delete", "AFTER DELETE ON openings", ["opening"], []),
+    ]
+    for table, event, when, forgets, fills in triggers:
+        body = "".join(f"{forget[k]};\n" for k in forgets) + "".join(f"{fill[k]};\n" for k in fills)
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS trg_{table}_{event}_ranks {when}\n"
+                       f"BEGIN\n{body}END")
+
+    # Backfill existing applications
+    cursor.execute("DELETE FROM applicant_ranks")
+    cursor.execute(ranks("1"))
+
+
+# change_log rows kept behind by pruning. Every batch writer (bulk inserts,
+# the write queue, the GUI's notifier) runs PRUNE_CHANGE_LOG inside its own
+# transaction, so the log stays bounded with or without a GUI reading it; a
+# reader that falls further behind than this reloads instead (gui/changes.py)
+CHANGE_LOG_KEEP = 10000
+PRUNE_CHANGE_LOG = "DELETE FROM change_log WHERE seq <= (SELECT MAX(seq) FROM change_log) - ?"
+
+
+MIGRATIONS = [
+    _v1_base_schema,
+    _v2_secondary_indexes,
+    _v3_materialized_matches,
+    _v4_normalized_terms,
+    _v5_allocation_rounds,
+    _v6_data_versions,
+    _v7_more_data_versions,
+    _v8_change_log,
+    _v9_applicant_ranks,
+]
+
+# Version a database reaches once every step above has been applied
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def get_version(conn: sqlite3.Connection) -> int:
+    """Return the schema version recorded in the database file."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection):
+    """
+    Bring the database up to SCHEMA_VERSION.
+    Pending steps run in one IMMEDIATE transaction together with the
+    user_version bump, so concurrent processes cannot apply them twice
+    and a failed step leaves the schema untouched.
+    """
+    if get_version(conn) >= SCHEMA_VERSION:
+        return
+
+    if conn.in_transaction:
+        conn.commit()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # Re-read under the write lock: another process may have migrated
+        # between our first check and acquiring the lock
+        version = get_version(conn)
+        cursor = conn.cursor()
+        for step in MIGRATIONS[version:]:
+            step(cursor)
+        if version < SCHEMA_VERSION:
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
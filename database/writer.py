@@ -0,0 +1,138 @@
+# database/writer.py
+
+import atexit
+import os
+import queue
+import threading
+from collections import namedtuple
+
+from database.connection import _db_key, get_connection, retry_on_busy, settings
+from database.migrations import CHANGE_LOG_KEEP, PRUNE_CHANGE_LOG, migrate
+
+# What a queued write reports back once its batch has committed
+WriteResult = namedtuple("WriteResult", ["lastrowid", "rowcount"])
+
+_STOP = object()
+
+
+class WriteQueue:
+    """
+    A single writer thread for one database file.
+
+    Callers queue statements and wait on a Future. The thread takes whatever
+    has queued up, runs it in one BEGIN IMMEDIATE transaction and commits
+    once, so a burst of writes from many windows costs one lock acquisition
+    and one fsync instead of one each. Every statement runs in its own
+    savepoint, so a failing write (e.g. a duplicate application) raises in
+    its caller without rolling back the rest of the batch.
+    """
+
+    def __init__(self, db_path: str, max_batch: int = 200):
+        self.db_path = db_path
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="ams-db-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, sql: str, params=()) -> "Future":
+        """Queue one statement; the Future resolves to a WriteResult."""
+        from concurrent.futures import Future  # only needed once the queue is on
+        future = Future()
+        self._queue.put((sql, params, future))
+        return future
+
+    def execute(self, sql: str, params=()) -> WriteResult:
+        """Queue one statement and block until its batch has committed."""
+        return self.submit(sql, params).result()
+
+    def stop(self):
+        """Flush everything queued so far, then stop the thread."""
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _run(self):
+        conn = get_connection(self.db_path, init=migrate)
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = _STOP in batch
+            batch = [item for item in batch if item is not _STOP]
+            if batch:
+                self._commit_batch(conn, batch)
+            if stopping:
+                return
+
+    def _commit_batch(self, conn, batch):
+        outcomes = []
+        try:
+            retry_on_busy(lambda: conn.execute("BEGIN IMMEDIATE"))
+            for sql, params, future in batch:
+                conn.execute("SAVEPOINT queued_write")
+                try:
+                    cur = conn.execute(sql, params)
+                    outcomes.append((future, WriteResult(cur.lastrowid, cur.rowcount), None))
+                except Exception as exc:
+                    conn.execute("ROLLBACK TO queued_write")
+                    outcomes.append((future, None, exc))
+                conn.execute("RELEASE queued_write")
+            conn.execute(PRUNE_CHANGE_LOG, (CHANGE_LOG_KEEP,))
+            retry_on_busy(conn.commit)
+        except Exception as exc:
+            if conn.in_transaction:
+                conn.rollback()
+            for _, _, future in batch:
+                future.set_exception(exc)
+            return
+
+        # Only report success once the whole batch is durable
+        for future, result, exc in outcomes:
+            if exc is not None:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+
+# db key -> WriteQueue
+_writers = {}
+_writers_lock = threading.Lock()
+
+
+def get_writer(db_path: str):
+    """
+    Return the process-wide writer for `db_path`, starting it on first use,
+    or None when the writer_queue setting is off (or the database is
+    in-memory and therefore private to each connection).
+    """
+    if not settings()["writer_queue"] or db_path == ":memory:":
+        return None
+    key = _db_key(db_path)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = _writers[key] = WriteQueue(db_path)
+        return writer
+
+
+def stop_all():
+    """Flush and stop every writer. Registered to run at exit."""
+    with _writers_lock:
+        while _writers:
+            _, writer = _writers.popitem()
+            writer.stop()
+
+
+def _forget_inherited():
+    """Writer threads do not survive fork(); a child starts its own on demand."""
+    global _writers_lock
+    _writers.clear()
+    _writers_lock = threading.Lock()
+
+
+# Registered after connection.close_all, so it runs first at exit
+atexit.register(stop_all)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_inherited)
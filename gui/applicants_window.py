@@ -1,68 +1,54 @@
 # gui/applicants_window.py
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QListWidget, QListWidgetItem,
+    QWidget, QVBoxLayout, QLabel, QListView,
     QPushButton, QMessageBox, QHBoxLayout
 )
 from PyQt6.QtCore import Qt
 from database.db_manager import DBManager
+from gui.changes import TABLES, change_notifier
+from gui.list_models import PagedListModel
+from gui.navigator import go_back, navigate
+from gui.tasks import TaskRunner
+from models.ranking import ApplicantRanking
 
 class ApplicantsWindow(QWidget):
     """Window showing all applicants for a specific opening."""
+    # Reused by the navigator for the same opening (see gui/navigator.py);
+    # kept current by on_rows_changed rather than refreshed on return
+    @staticmethod
+    def screen_key(opening_row):
+        return opening_row['opening_id']
+
     def __init__(self, opening_row):
         super().__init__()
         self.opening = opening_row
         self.db = DBManager()
-        self.applicants = []
+        self.tasks = TaskRunner(self)
+        # Ranked applicant rows, fetched a page at a time as the list scrolls
+        self.model = PagedListModel(self.fetch_page, self.describe, tasks=self.tasks,
+                                    parent=self)
+        changes = change_notifier(self.db.db_path)
+        changes.rows_changed.connect(self.on_rows_changed)
+        changes.reset.connect(self.reload_all)
         self.init_ui()
 
     def init_ui(self):
         """Builds the UI: list of applicants and back button."""
-        self.setWindowTitle(f"Applicants for “{self.opening['opening_name']}”")
+        self.show_title()
         self.setGeometry(300, 300, 500, 450)
 
         layout = QVBoxLayout()
         layout.setAlignment(Qt.AlignmentFlag.AlignTop)
 
-        # Create the list widget BEFORE we ever try to use it
-        self.list_widget = QListWidget()
-        self.list_widget.itemDoubleClicked.connect(self.show_details)
-
-        # Fetch & filter applicants
-        raw = self.db.get_applicants_by_opening(self.opening['opening_id'])
-        filtered = [
-            s for s in raw
-            if float(s['gpa']) >= self.opening['required_gpa']
-               and self.opening['location'] in (s['preferred_locations'] or '').split(';')
-        ]
-
-        # Sort according to priority
-        if self.opening['priority'] == 'location':
-            loc = self.opening['location']
-            buckets = {0: [], 1: [], 2: [], 3: []}
-            for s in filtered:
-                prefs = (s['preferred_locations'] or '').split(';')
-                idx = prefs.index(loc) if loc in prefs else 3
-                buckets[idx].append(s)
-            ordered = []
-            # within each bucket, sort by GPA descending
-            for i in (0, 1, 2, 3):
-                bucket_sorted = sorted(buckets[i], key=lambda s: -float(s['gpa']))
-                ordered.extend(bucket_sorted)
-        else:
-            ordered = sorted(filtered, key=lambda s: -float(s['gpa']))
-
-        if not ordered:
-            QMessageBox.information(self, "No Applicants", "No one has applied yet.")
-
-        # Populate the list widget and build applicants list
-        for s in ordered:
-            text = f"{s['name']}  •  GPA: {s['gpa']}  •  prefs: {s['preferred_locations']}"
-            self.list_widget.addItem(QListWidgetItem(text))
-            self.applicants.append(s)
+        # Filtering and ordering (location rank, then GPA) happen in SQLite;
+        # pages are fetched in the background as the view reaches its end
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.doubleClicked.connect(self.show_details)
 
         layout.addWidget(QLabel("Applicants:"))
-        layout.addWidget(self.list_widget)
+        layout.addWidget(self.list_view)
 
         # Back button
         btn_row = QHBoxLayout()
@@ -73,11 +59,58 @@ class ApplicantsWindow(QWidget):
         layout.addLayout(btn_row)
 
         self.setLayout(layout)
+        self.model.page_loaded.connect(self.first_page_loaded)
+        self.model.fetchMore()
+
+    def show_title(self):
+        self.setWindowTitle(f"Applicants for “{self.opening['opening_name']}”")
+
+    def on_rows_changed(self, table, keys):
+        """
+        Re-rank when this opening, its applications or one of its
+        applicants' profiles changed; other edits leave the list alone.
+        """
+        opening_id = self.opening['opening_id']
+        if table == "openings":
+            affected = opening_id in keys
+        elif table == "applications":
+            affected = any(o == opening_id for _, o in keys)
+        else:
+            # an applicant's GPA or preferences may move them, loaded or not
+            # (one query: a bulk import can report up to max_batch students)
+            affected = bool(self.db.get_applicants_among(opening_id, keys))
+        if affected:
+            self.refresh({table})
+
+    def reload_all(self):
+        # A bound slot, so Qt disconnects it once this screen is deleted
+        self.refresh(set(TABLES))
+
+    def refresh(self, changed):
+        """Re-rank from the top: applications, profiles or the opening changed."""
+        if "openings" in changed:
+            opening = self.db.get_opening_by_id(self.opening['opening_id'])
+            if opening is not None:
+                self.opening = dict(opening)
+                self.show_title()
+        self.model.reload()
+
+    def fetch_page(self, after, limit):
+        """One page of ranked applicants; runs on a worker thread."""
+        return ApplicantRanking(self.db.db_path).page(self.opening['opening_id'], limit, after)
+
+    def first_page_loaded(self, count, more):
+        self.model.page_loaded.disconnect(self.first_page_loaded)
+        if not count:
+            QMessageBox.information(self, "No Applicants", "No one has applied yet.")
+
+    @staticmethod
+    def describe(s):
+        return f"{s['name']}  •  GPA: {s['gpa']}  •  prefs: {s['preferred_locations']}"
 
-    def show_details(self, item: QListWidgetItem):
+    def show_details(self, index):
         """Show a detailed info dialog for the double-clicked applicant."""
-        idx = self.list_widget.row(item)
-        row = self.applicants[idx]
+        row = self.model.row(index.row())
         details = (
             f"Student ID: {row['student_id']}\n"
             f"Name: {row['name']}\n"
@@ -91,8 +124,9 @@ class ApplicantsWindow(QWidget):
         QMessageBox.information(self, "Applicant Details", details)
 
     def back_to_dashboard(self):
+        # The dashboard we came from is normally still cached
+        if go_back(self):
+            return
         from gui.company_dashboard import CompanyDashboard
         user = self.db.get_user(self.opening['company_email'])
-        self.next_window = CompanyDashboard(user, opening_id=self.opening['opening_id'])
-        self.next_window.show()
-        self.close()
+        navigate(self, CompanyDashboard, user, opening_id=self.opening['opening_id'])
@@ -0,0 +1,109 @@
+# gui/changes.py
+"""
+Live change notifications for open views, across processes.
+
+    changes = change_notifier()
+    changes.rows_changed.connect(self.on_rows_changed)   # (table, keys)
+    changes.reset.connect(self.reload_everything)
+
+Every `interval` ms the notifier reads PRAGMA data_version (moves when
+another connection commits) and its own connection's total_changes (moves
+on this process's GUI-thread writes); neither touches the disk. Only when
+one of them moved are the trigger-kept counters in data_versions read, and
+only when a watched table's counter moved are the change_log rows since
+the last poll read (schema v8). Writes to other tables, e.g. the access
+log or materialized matches, therefore cost one small query.
+
+rows_changed(table, keys) then fires once per table with the set of
+affected keys: opening ids for "openings", student emails for "students",
+(student email, opening id) pairs for "applications". Keys say which rows
+to re-read, not what happened to them; a key whose row no longer exists
+was deleted. When more than `max_batch` rows changed at once (e.g. a bulk
+import), or rows were pruned before this process read them (every batch
+writer prunes, see database/migrations.py), reset() fires instead and
+views reload from scratch.
+"""
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from database.db_manager import DBManager
+from database.migrations import CHANGE_LOG_KEEP
+
+TABLES = ("openings", "students", "applications")
+
+
+class ChangeNotifier(QObject):
+    """Polls one database for changes to TABLES and emits them as signals."""
+
+    rows_changed = pyqtSignal(str, object)  # table, set of keys
+    reset = pyqtSignal()
+
+    def __init__(self, db_path: str = "ams.db", interval: int = 1000,
+                 max_batch: int = 1000, keep: int = CHANGE_LOG_KEEP, parent=None):
+        super().__init__(parent)
+        self.db = DBManager(db_path)
+        self.max_batch = max_batch
+        self.keep = keep  # change_log rows left behind after pruning
+        self._mark = (self.db.get_data_version(), self.db.conn.total_changes)
+        self._versions = self.db.get_data_versions(TABLES)
+        self._seq = self._pruned = self.db.get_last_change()
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.poll)
+        self.timer.start(interval)
+
+    def poll(self):
+        """Check for changes now (the timer calls this)."""
+        mark = (self.db.get_data_version(), self.db.conn.total_changes)
+        if mark == self._mark:
+            return
+        self._mark = mark
+        versions = self.db.get_data_versions(TABLES)
+        if versions == self._versions:
+            return
+        self._versions = versions
+
+        rows = self.db.get_changes(self._seq, self.max_batch + 1)
+        if not rows:
+            return
+        if rows[0][0] != self._seq + 1 or len(rows) > self.max_batch:
+            self._seq = self.db.get_last_change()
+            self.reset.emit()
+        else:
+            self._seq = rows[-1][0]
+            self._emit(rows)
+        if self._seq - self._pruned >= self.keep:
+            self.db.prune_changes(self.keep)
+            self._pruned = self._seq
+            self._mark = (self.db.get_data_version(), self.db.conn.total_changes)
+
+    def _emit(self, rows):
+        changed = {}
+        for _, name, _, opening_id, email in rows:
+            if name == "openings":
+                key = opening_id
+            elif name == "students":
+                key = email
+            else:
+                key = (email, opening_id)
+            changed.setdefault(name, set()).add(key)
+        for name, keys in changed.items():
+            self.rows_changed.emit(name, keys)
+
+
+# db path -> the notifier every view of that database shares
+_notifiers = {}
+
+
+def change_notifier(db_path: str = "ams.db") -> ChangeNotifier:
+    """Return the shared notifier for `db_path`, starting it on first use."""
+    notifier = _notifiers.get(db_path)
+    if notifier is None:
+        notifier = _notifiers[db_path] = ChangeNotifier(db_path)
+    return notifier
+
+
+def poll_changes(db_path: str = "ams.db"):
+    """Poll now, without waiting for the timer, if a notifier is running."""
+    notifier = _notifiers.get(db_path)
+    if notifier is not None:
+        notifier.poll()
@@ -6,6 +6,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QDateTime
 from database.db_manager import DBManager
+from gui.navigator import navigate
 from gui.openings_list_window import OpeningsListWindow
 
 class CompanyDashboard(QWidget):
@@ -13,20 +14,35 @@ class CompanyDashboard(QWidget):
     Main dashboard for a company: lets the user edit an existing opening's
     details (including deadline), return to the openings list, or view matches.
     """
+    # Reused by the navigator for the same opening (see gui/navigator.py)
+    DEPENDS_ON = ("openings",)
+
+    SPECIALIZATIONS = [
+        "Software Engineering", "Electrical Engineering", "Mechanical Engineering",
+        "Civil Engineering", "Chemical Engineering", "Nuclear Engineering",
+        "Industrial Engineering", "Mining Engineering"
+    ]
+
+    @staticmethod
+    def screen_key(user, opening_id):
+        return opening_id
+
     def __init__(self, user: dict, opening_id: int):
         super().__init__()
         self.user = user
         self.opening_id = opening_id
         self.db = DBManager()
-        # Fetch the opening record from the database
+        self.load_opening()
+        self.init_ui()
+
+    def load_opening(self):
         # Fetch the opening record (as sqlite3.Row)
-        self.opening = self.db.get_opening_by_id(opening_id)
+        self.opening = self.db.get_opening_by_id(self.opening_id)
         # Convert to plain dict so .get() is available
         try:
             self.opening = dict(self.opening)
         except Exception:
             pass
-        self.init_ui()
 
     def init_ui(self):
         """Builds the form layout and populates fields with current opening data."""
@@ -36,68 +52,39 @@ class CompanyDashboard(QWidget):
         form = QFormLayout()
 
         # Opening Name
-        self.name_input = QLineEdit(self.opening['opening_name'])
+        self.name_input = QLineEdit()
         form.addRow(QLabel("Opening Name:"), self.name_input)
 
         # Specialization (dropdown)
         self.spec_combo = QComboBox()
-        specs = [
-            "Software Engineering", "Electrical Engineering", "Mechanical Engineering",
-            "Civil Engineering", "Chemical Engineering", "Nuclear Engineering",
-            "Industrial Engineering", "Mining Engineering"
-        ]
-        self.spec_combo.addItems(specs)
-        # Pre-select saved specialization
-        if self.opening['specialization'] in specs:
-            idx = specs.index(self.opening['specialization'])
-            self.spec_combo.setCurrentIndex(idx)
+        self.spec_combo.addItems(self.SPECIALIZATIONS)
         form.addRow(QLabel("Specialization:"), self.spec_combo)
 
         # Location
-        self.loc_input = QLineEdit(self.opening['location'])
+        self.loc_input = QLineEdit()
         form.addRow(QLabel("Location:"), self.loc_input)
 
         # Stipend
-        self.stip_input = QLineEdit(str(self.opening['stipend']))
+        self.stip_input = QLineEdit()
         form.addRow(QLabel("Stipend (SAR):"), self.stip_input)
 
         # Required GPA
-        # Use direct indexing on sqlite3.Row for required_gpa
-        gpa_val = self.opening['required_gpa'] if 'required_gpa' in self.opening.keys() else 0
-        self.gpa_input = QLineEdit(str(gpa_val))
+        self.gpa_input = QLineEdit()
         form.addRow(QLabel("Required GPA (0–5):"), self.gpa_input)
 
         # Priority (dropdown with display vs stored data)
         self.priority_combo = QComboBox()
         self.priority_combo.addItem("Location", "location")
         self.priority_combo.addItem("GPA",      "gpa")
-        # Pre-select saved priority
-        current_priority = self.opening.get('priority', 'location')
-        for i in range(self.priority_combo.count()):
-            if self.priority_combo.itemData(i) == current_priority:
-                self.priority_combo.setCurrentIndex(i)
-                break
         form.addRow(QLabel("Priority:"), self.priority_combo)
 
         # Deadline picker (with millisecond precision)
         self.deadline_edit = QDateTimeEdit()
         self.deadline_edit.setCalendarPopup(True)
-        saved = self.opening.get("deadline")
-        if saved:
-            # first try ISO-with-ms
-            dt = QDateTime.fromString(saved, Qt.DateFormat.ISODateWithMs)
-            if not dt.isValid():
-                # fallback to plain ISO
-                dt = QDateTime.fromString(saved, Qt.DateFormat.ISODate)
-            self.deadline_edit.setDateTime(dt if dt.isValid()
-                                           else QDateTime.currentDateTime().addDays(7))
-        else:
-            # default one week out
-            self.deadline_edit.setDateTime(QDateTime.currentDateTime().addDays(7))
         form.addRow(QLabel("Deadline:"), self.deadline_edit)
 
         # Required Skills
-        self.skills_input = QTextEdit(self.opening['required_skills'])
+        self.skills_input = QTextEdit()
         form.addRow(QLabel("Required Skills:"), self.skills_input)
 
         # Buttons
@@ -114,6 +101,51 @@ class CompanyDashboard(QWidget):
         form.addRow(btn_view)
 
         self.setLayout(form)
+        self.load_fields()
+
+    def load_fields(self):
+        """Fill the form from self.opening."""
+        self.name_input.setText(self.opening['opening_name'])
+
+        # Pre-select saved specialization
+        if self.opening['specialization'] in self.SPECIALIZATIONS:
+            idx = self.SPECIALIZATIONS.index(self.opening['specialization'])
+            self.spec_combo.setCurrentIndex(idx)
+
+        self.loc_input.setText(self.opening['location'])
+        self.stip_input.setText(str(self.opening['stipend']))
+
+        # Use direct indexing on sqlite3.Row for required_gpa
+        gpa_val = self.opening['required_gpa'] if 'required_gpa' in self.opening.keys() else 0
+        self.gpa_input.setText(str(gpa_val))
+
+        # Pre-select saved priority
+        current_priority = self.opening.get('priority', 'location')
+        for i in range(self.priority_combo.count()):
+            if self.priority_combo.itemData(i) == current_priority:
+                self.priority_combo.setCurrentIndex(i)
+                break
+
+        saved = self.opening.get("deadline")
+        if saved:
+            # first try ISO-with-ms
+            dt = QDateTime.fromString(saved, Qt.DateFormat.ISODateWithMs)
+            if not dt.isValid():
+                # fallback to plain ISO
+                dt = QDateTime.fromString(saved, Qt.DateFormat.ISODate)
+            self.deadline_edit.setDateTime(dt if dt.isValid()
+                                           else QDateTime.currentDateTime().addDays(7))
+        else:
+            # default one week out
+            self.deadline_edit.setDateTime(QDateTime.currentDateTime().addDays(7))
+
+        self.skills_input.setPlainText(self.opening['required_skills'])
+
+    def refresh(self, changed):
+        """The opening was changed elsewhere since this screen was last shown."""
+        self.load_opening()
+        if self.opening:
+            self.load_fields()
 
     def handle_save(self):
         """
@@ -174,16 +206,7 @@ class CompanyDashboard(QWidget):
 
     def back_to_openings(self):
         """Return to the OpeningsListWindow (no save)."""
-        self.next_window = OpeningsListWindow(self.user)
-        self.next_window.show()
-        self.close()
-
-    def view_matches(self):
-        """Open the applicants/matches view for this opening."""
-        from gui.applicants_window import ApplicantsWindow
-        self.next_window = ApplicantsWindow(self.opening_id)
-        self.next_window.show()
-        self.close()
+        navigate(self, OpeningsListWindow, self.user)
 
     def view_matches(self):
         """
@@ -193,15 +216,5 @@ class CompanyDashboard(QWidget):
         # defer import to break the circular dependency
         from gui.applicants_window import ApplicantsWindow
 
-        # pull the full opening row from the DB
-        opening_row = self.db.get_opening_by_id(self.opening_id)
-        # sqlite3.Row doesn’t support .get(), so convert to dict
-        try:
-            opening_row = dict(opening_row)
-        except Exception:
-            pass
-
-        # now hand that dict off to ApplicantsWindow
-        self.next_window = ApplicantsWindow(opening_row)
-        self.next_window.show()
-        self.close()
+        # self.opening is kept current by refresh(), so no need to re-read it
+        navigate(self, ApplicantsWindow, self.opening)
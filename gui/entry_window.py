@@ -2,7 +2,6 @@
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout
 from PyQt6.QtCore import Qt
-from gui.login_window import LoginWindow
 
 class EntryWindow(QWidget):
     def __init__(self):
@@ -39,7 +38,9 @@ class EntryWindow(QWidget):
         self.setLayout(layout)
 
     def open_login(self, role: str):
-        # Instantiate and show the login/register window with the selected role
-        self.login_window = LoginWindow(role=role)
-        self.login_window.show()
-        self.close()
+        # Imported here, not at startup: it brings in the database layer and bcrypt
+        from gui.login_window import LoginWindow
+        from gui.navigator import navigate
+
+        # Show the login/register window with the selected role
+        self.login_window = navigate(self, LoginWindow, role=role)
@@ -0,0 +1,200 @@
+# gui/list_models.py
+"""
+Item models and delegates for the long lists (matches, applicants,
+openings).
+
+PagedListModel holds only the rows fetched so far. The view asks for more
+(canFetchMore/fetchMore) as it scrolls to the end, and each page is read
+from the database on the window's TaskRunner, so neither memory nor paint
+time depends on how many rows exist in total. Windows patch single rows
+(replace_row, remove_row, append_row) when gui/changes.py reports edits. Per-row buttons are painted
+by ButtonsDelegate rather than built as widgets.
+"""
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QRect, QEvent, Qt, pyqtSignal
+from PyQt6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionButton
+
+# Rows read per fetchMore()
+PAGE_SIZE = 100
+
+
+class PagedListModel(QAbstractListModel):
+    """
+    A list model filled a page at a time.
+
+    `fetch(after, limit)` returns (rows, next key) with next key None after
+    the last page; it runs on `tasks` (a TaskRunner) when given, so it
+    must open its own DBManager. `display(row)` gives the text of a row
+    and `foreground(row)`, if given, its colour. The row itself is
+    available under Qt.ItemDataRole.UserRole and from row().
+    """
+
+    # rows added by the latest page, and whether more pages remain
+    page_loaded = pyqtSignal(int, bool)
+
+    def __init__(self, fetch, display, tasks=None, foreground=None, page_size=PAGE_SIZE,
+                 parent=None):
+        super().__init__(parent)
+        self.fetch = fetch
+        self.display = display
+        self.foreground = foreground
+        self.tasks = tasks
+        self.page_size = page_size
+        self.rows = []
+        self._next = None       # key to fetch the next page after
+        self._done = False      # the last page has been read
+        self._loading = False   # a page is on its way
+        self._generation = 0    # bumped by reload(); older pages are dropped
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.display(row)
+        if role == Qt.ItemDataRole.ForegroundRole and self.foreground is not None:
+            return self.foreground(row)
+        if role == Qt.ItemDataRole.UserRole:
+            return row
+        return None
+
+    def row(self, i: int):
+        return self.rows[i]
+
+    def row_changed(self, i: int):
+        """Repaint row `i` after something its text depends on changed."""
+        index = self.index(i)
+        self.dataChanged.emit(index, index)
+
+    def rows_changed(self):
+        """Repaint every loaded row."""
+        if self.rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self.rows) - 1))
+
+    @property
+    def done(self) -> bool:
+        """Every row has been fetched (and no page is on its way)."""
+        return self._done and not self._loading
+
+    def find(self, match) -> list:
+        """Indexes of the loaded rows for which match(row) is true."""
+        return [i for i, row in enumerate(self.rows) if match(row)]
+
+    def replace_row(self, i: int, row):
+        """Swap in a fresh copy of row `i` (e.g. after it was edited)."""
+        self.rows[i] = row
+        self.row_changed(i)
+
+    def remove_row(self, i: int):
+        self.beginRemoveRows(QModelIndex(), i, i)
+        del self.rows[i]
+        self.endRemoveRows()
+
+    def append_row(self, row):
+        """Add a row at the end; only sensible once `done`, or pages overlap."""
+        self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows))
+        self.rows.append(row)
+        self.endInsertRows()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._done and not self._loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self._loading = True
+        generation = self._generation
+        if self.tasks is not None:
+            self.tasks.submit(self.fetch, self._next, self.page_size,
+                              on_done=lambda page: self._append(page, generation),
+                              on_error=lambda exc: self._failed(exc, generation))
+        else:
+            self._append(self.fetch(self._next, self.page_size), generation)
+
+    def reload(self):
+        """Drop every row and fetch the first page again."""
+        self.beginResetModel()
+        self._generation += 1  # a page still on its way belongs to the old rows
+        self.rows, self._next, self._done, self._loading = [], None, False, False
+        self.endResetModel()
+        self.fetchMore()
+
+    def _append(self, page, generation):
+        if generation != self._generation:
+            return  # fetched before a reload(); its own fetch is in flight
+        rows, self._next = page
+        self._loading = False
+        self._done = self._next is None
+        if rows:
+            first = len(self.rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self.rows.extend(rows)
+            self.endInsertRows()
+        self.page_loaded.emit(len(rows), not self._done)
+
+    def _failed(self, exc, generation):
+        if generation != self._generation:
+            return
+        self._loading = False
+        if self.tasks is not None:
+            self.tasks.show_error(exc)
+
+
+class ButtonsDelegate(QStyledItemDelegate):
+    """
+    Paints a row's text with push buttons on its right (e.g. "Edit",
+    "Delete") and emits clicked(row, label) when one is clicked; no
+    widgets are created per row.
+    """
+
+    clicked = pyqtSignal(int, str)
+
+    BUTTON_WIDTH = 70
+    MARGIN = 4
+
+    def __init__(self, labels, parent=None):
+        super().__init__(parent)
+        self.labels = list(labels)
+
+    def _button_rects(self, rect: QRect):
+        rects = []
+        right = rect.right() - self.MARGIN
+        for label in reversed(self.labels):
+            r = QRect(right - self.BUTTON_WIDTH + 1, rect.top() + 2,
+                      self.BUTTON_WIDTH, rect.height() - 4)
+            rects.append((label, r))
+            right -= self.BUTTON_WIDTH + self.MARGIN
+        return list(reversed(rects))
+
+    def paint(self, painter, option, index):
+        buttons = self._button_rects(option.rect)
+        text_option = type(option)(option)
+        text_option.rect = QRect(option.rect)
+        text_option.rect.setRight(buttons[0][1].left() - self.MARGIN if buttons
+                                  else option.rect.right())
+        super().paint(painter, text_option, index)
+
+        style = QApplication.style()
+        for label, rect in buttons:
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = label
+            button.state = QStyle.StateFlag.State_Enabled
+            style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter)
+
+    def sizeHint(self, option, index):
+        hint = super().sizeHint(option, index)
+        hint.setHeight(max(hint.height(), 30))
+        return hint
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.MouseButtonRelease:
+            point = event.position().toPoint()
+            for label, rect in self._button_rects(option.rect):
+                if rect.contains(point):
+                    self.clicked.emit(index.row(), label)
+                    return True
+        return super().editorEvent(event, model, option, index)
@@ -4,17 +4,67 @@ from PyQt6.QtWidgets import (
     QWidget, QLabel, QLineEdit, QPushButton,
     QVBoxLayout, QHBoxLayout, QMessageBox, QInputDialog
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThreadPool
 from database.db_manager import DBManager
 from utils.validation import is_valid_email
-from utils.encryption import hash_password, check_password
+from utils.auth import auth_service
+from gui.navigator import navigate
+from gui.tasks import TaskRunner
 import random, string
 
+_auth_pool = None
+
+
+def auth_pool() -> QThreadPool:
+    """
+    The pool login and register tasks run on: no more threads than the
+    AuthService lets hash at once, so queued logins never hold up window
+    loads on the global pool.
+    """
+    global _auth_pool
+    if _auth_pool is None:
+        _auth_pool = QThreadPool()
+        _auth_pool.setMaxThreadCount(auth_service().max_workers)
+    return _auth_pool
+
+
+# bcrypt is slow on purpose, so these run on a worker thread (see gui/tasks.py)
+def _authenticate(db_path, email, password, role):
+    """Return (user, student profile or None, error message or None)."""
+    db = DBManager(db_path)
+    user = db.get_user(email)
+    if not user or user['role'] != role:
+        return None, None, f"No {role} account for that email."
+    ok, new_hash = auth_service().verify(password, user['hashed_password'])
+    if not ok:
+        return None, None, "Incorrect password."
+    if new_hash:
+        # hashed under an older cost policy; the password is known right now
+        db.update_password(email, new_hash)
+    db.log_access(email)
+    db.log_session(email, login=True)
+    profile = db.get_student_by_email(email) if role == 'student' else None
+    return user, profile, None
+
+
+def _register(db_path, email, password, role):
+    """Create the account; return False if the email is already taken."""
+    db = DBManager(db_path)
+    if db.get_user(email):
+        return False
+    db.insert_user({
+        "email": email,
+        "hashed_password": auth_service().hash(password),
+        "role": role
+    })
+    return True
+
 class LoginWindow(QWidget):
     def __init__(self, role: str):
         super().__init__()
         self.role = role  # 'student' or 'company'
         self.db = DBManager()
+        self.tasks = TaskRunner(self, auth_pool())
         self.init_ui()
 
     def init_ui(self):
@@ -65,6 +115,9 @@ class LoginWindow(QWidget):
         # Connect signals
         self.login_btn.clicked.connect(self.handle_login)
         self.register_btn.clicked.connect(self.handle_register)
+        # No second click while a password is being checked
+        self.tasks.busy_changed.connect(lambda busy: self.login_btn.setEnabled(not busy))
+        self.tasks.busy_changed.connect(lambda busy: self.register_btn.setEnabled(not busy))
 
         self.setLayout(layout)
 
@@ -72,9 +125,7 @@ class LoginWindow(QWidget):
         # Toggle between student and company login/register
         new_role = 'student' if self.role == 'company' else 'company'
         from gui.login_window import LoginWindow  # avoid circular
-        self.next_window = LoginWindow(role=new_role)
-        self.next_window.show()
-        self.close()
+        navigate(self, LoginWindow, role=new_role)
 
     def handle_login(self):
         email = self.email_input.text().strip()
@@ -85,32 +136,27 @@ class LoginWindow(QWidget):
         if not password:
             QMessageBox.warning(self, "Empty Password", "Please enter your password.")
             return
-        user = self.db.get_user(email)
-        if not user or user['role'] != self.role:
-            QMessageBox.warning(self, "Login Failed", f"No {self.role} account for that email.")
-            return
-        if not check_password(password, user['hashed_password']):
-            QMessageBox.warning(self, "Login Failed", "Incorrect password.")
-            return
+        self.tasks.submit(_authenticate, self.db.db_path, email, password, self.role,
+                          on_done=self.finish_login)
 
-        self.db.log_access(email)
-        self.db.log_session(email, login=True)
+    def finish_login(self, outcome):
+        user, profile, error = outcome
+        if error:
+            QMessageBox.warning(self, "Login Failed", error)
+            return
 
         # Route to next window
         if self.role == 'company':
             from gui.openings_list_window import OpeningsListWindow
-            self.next_window = OpeningsListWindow(user)
+            navigate(self, OpeningsListWindow, user)
         else:
             # student: check if profile exists
-            profile = self.db.get_student_by_email(email)
             if profile:
                 from gui.student_dashboard import StudentDashboard
-                self.next_window = StudentDashboard(profile)
+                navigate(self, StudentDashboard, profile)
             else:
                 from gui.student_profile_window import StudentProfileWindow
-                self.next_window = StudentProfileWindow(email)
-        self.next_window.show()
-        self.close()
+                navigate(self, StudentProfileWindow, user['email'])
 
     def handle_register(self):
         email = self.email_input.text().strip()
@@ -123,27 +169,22 @@ class LoginWindow(QWidget):
             QMessageBox.warning(self, "Weak Password", 
                 "Password must be at least 8 characters and alphanumeric.")
             return
-        if self.db.get_user(email):
+        self.tasks.submit(_register, self.db.db_path, email, password, self.role,
+                          on_done=lambda created: self.finish_register(email, created))
+
+    def finish_register(self, email, created):
+        if not created:
             QMessageBox.warning(self, "Already Registered", "An account with that email already exists.")
             return
-        # Create user
-        hashed = hash_password(password)
-        self.db.insert_user({
-            "email": email,
-            "hashed_password": hashed,
-            "role": self.role
-        })
         QMessageBox.information(self, "Registered", "Account created successfully!")
 
         # Next flow after register
         if self.role == 'company':
             from gui.opening_name_window import OpeningNameWindow
-            self.next_window = OpeningNameWindow(email)
+            navigate(self, OpeningNameWindow, email)
         else:
             from gui.student_profile_window import StudentProfileWindow
-            self.next_window = StudentProfileWindow(email)
-        self.next_window.show()
-        self.close()
+            navigate(self, StudentProfileWindow, email)
 
     def handle_password_recovery(self):
         # existing recovery logic
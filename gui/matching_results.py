@@ -4,14 +4,28 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
     QPushButton,
     QMessageBox,
-    QListWidget,
-    QListWidgetItem
+    QListView
 )
 from PyQt6.QtCore import Qt, QDateTime
+from PyQt6.QtGui import QColor
 from database.db_manager import DBManager
-from models.student import Student
-from models.opening import Opening
-from models.matching import match_openings_for_student
+from gui.changes import TABLES, change_notifier
+from gui.list_models import PagedListModel
+from gui.navigator import navigate
+from gui.tasks import TaskRunner
+from models.applications import ApplicationState
+from models.match_cache import MatchCache, profile_key
+from models.match_store import MatchStore
+from models.matching import opening_from_row, student_from_row
+
+# Shared by every results window, so going back and forth between the
+# dashboard and this window reuses the last lists
+_match_cache = MatchCache()
+
+
+def refresh_matches(db_path):
+    """Apply queued match changes; runs on a pool thread (see MatchStore)."""
+    return MatchStore(db_path).refresh()
 
 
 class MatchingResultsWindow(QWidget):
@@ -20,11 +34,27 @@ class MatchingResultsWindow(QWidget):
     shows deadline status, allows the student to view details,
     apply or cancel an application, and navigate back.
     """
+    # Reused by the navigator for the same student (see gui/navigator.py);
+    # kept current by on_rows_changed rather than refreshed on return
+    @staticmethod
+    def screen_key(student_row):
+        return student_row['email']
+
     def __init__(self, student_row):
         super().__init__()
         self.student_row = student_row
         self.db = DBManager()
-        self.openings = []  # list of Opening objects
+        self.tasks = TaskRunner(self)
+        self.updating_matches = False
+        self.stale_empty_page = False
+        # the student's applied set, read once and kept current on apply/cancel
+        self.applications = ApplicationState(student_row['email'], self.db.db_path)
+        # (Opening, is_closed) rows, fetched a page at a time as the list scrolls
+        self.model = PagedListModel(self.get_matches, self.describe, tasks=self.tasks,
+                                    foreground=self.status_color, parent=self)
+        changes = change_notifier(self.db.db_path)
+        changes.rows_changed.connect(self.on_rows_changed)
+        changes.reset.connect(self.reload_all)
         self.init_ui()
 
     def init_ui(self):
@@ -34,48 +64,16 @@ class MatchingResultsWindow(QWidget):
         layout = QVBoxLayout()
         layout.setAlignment(Qt.AlignmentFlag.AlignTop)
 
-        matches = self.get_matches()
-        if not matches:
-            QMessageBox.information(
-                self,
-                "No Matches",
-                "No openings match your criteria."
-            )
-
-        # List to display matched openings with deadline status
-        self.list_widget = QListWidget()
-        # current time in ISO format for comparison
-        # get a true datetime for “now”
-        now_dt = datetime.utcnow()
-        for opening in matches:
-            base = f"{opening.name} @ {opening.location} — SAR {opening.stipend}"
-
-            # figure out the deadline as a datetime
-            dl = opening.deadline
-            if isinstance(dl, str):
-                try:
-                    dl = datetime.fromisoformat(dl)
-                except ValueError:
-                    dl = None
-
-            # open vs closed
-            status = "Application Open"
-            color  = Qt.GlobalColor.green
-            if dl and dl < now_dt:
-                status = "Application Closed"
-                color  = Qt.GlobalColor.red
-
-            display = f"{base}   [{status}]"
-            item    = QListWidgetItem(display)
-            item.setForeground(color)
-            self.list_widget.addItem(item)
-            self.openings.append(opening)
+        # Only the rows in view are painted; more are fetched near the end
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
 
         # Double‑click to show details
-        self.list_widget.itemDoubleClicked.connect(self.show_details)
+        self.list_view.doubleClicked.connect(self.show_details)
         # Update toggle when selection changes
-        self.list_widget.currentRowChanged.connect(lambda _: self.update_toggle_button())
-        layout.addWidget(self.list_widget)
+        self.list_view.selectionModel().currentRowChanged.connect(
+            lambda *_: self.update_toggle_button())
+        layout.addWidget(self.list_view)
 
         # Apply / Cancel button
         self.toggle_btn = QPushButton()
@@ -87,50 +85,152 @@ class MatchingResultsWindow(QWidget):
         back_btn.clicked.connect(self.back_to_dashboard)
         layout.addWidget(back_btn)
 
-        if self.openings:
-            self.list_widget.setCurrentRow(0)
         self.update_toggle_button()
-
         self.setLayout(layout)
+        self.model.page_loaded.connect(self.first_page_loaded)
+        self.model.fetchMore()
+        self.update_matches()
 
-    def get_matches(self):
-        # Build Student model
-        prefs = (self.student_row['preferred_locations'].split(';')
-                 if self.student_row['preferred_locations'] else [])
-        skills = (self.student_row['skills'].split(',')
-                  if self.student_row['skills'] else [])
-        student = Student(
-            student_id=self.student_row['student_id'],
-            name=self.student_row['name'],
-            email=self.student_row['email'],
-            gpa=self.student_row['gpa'],
-            specialization=self.student_row['specialization'],
-            preferred_locations=prefs,
-            skills=skills
-        )
-        # Fetch raw openings
-        raw = self.db.get_openings_by_specialization(student.specialization)
-        opening_list = []
-        for row in raw:
-            req_skills = row['required_skills'].split(',') if row['required_skills'] else []
-            deadline_val = row['deadline'] if 'deadline' in row.keys() else None
-            opening_list.append(Opening(
-                opening_id=row['opening_id'],
-                company_email=row['company_email'],
-                name=row['opening_name'],
-                specialization=row['specialization'],
-                location=row['location'],
-                stipend=row['stipend'],
-                required_skills=req_skills,
-                required_gpa=row['required_gpa'],
-                priority=row['priority'],
-                deadline=deadline_val
-            ))
-        return match_openings_for_student(student, opening_list)
-
-    def show_details(self, item: QListWidgetItem):
-        idx = self.list_widget.row(item)
-        opening = self.openings[idx]
+    # Opening fields that decide whether and where an opening is listed
+    RANKING_FIELDS = ("specialization", "location", "stipend", "required_gpa", "priority")
+
+    def on_rows_changed(self, table, keys):
+        """
+        Patch what another window or process changed: applied badges,
+        and openings whose name, deadline or skills were edited in place.
+        Anything that can move openings in or out of the list, or
+        reorder it, reloads it from the first page.
+        """
+        email = self.student_row['email']
+        if table == "applications":
+            mine = {opening_id for e, opening_id in keys if e == email}
+            if mine:
+                self.applications.reload()
+                for i in self.model.find(lambda row: row[0].opening_id in mine):
+                    self.model.row_changed(i)
+                self.update_toggle_button()
+        elif table == "students":
+            if email in keys:
+                self.student_row = self.db.get_student_by_email(email) or self.student_row
+                self.update_matches(reload=True)
+        elif table == "openings":
+            if not self.patch_openings(keys):
+                self.update_matches(reload=True)
+            self.update_toggle_button()
+
+    def patch_openings(self, opening_ids) -> bool:
+        """Update loaded openings in place; False if the list must reload."""
+        positions = {row[0].opening_id: i for i, row in enumerate(self.model.rows)}
+        now = datetime.utcnow()
+        for opening_id in opening_ids:
+            row = self.db.get_opening_by_id(opening_id)
+            i = positions.get(opening_id)
+            if i is None:
+                # a new or edited opening this student might now match
+                if row is not None and row['specialization'] == self.student_row['specialization']:
+                    return False
+                continue
+            old = self.model.row(i)[0]
+            if row is None or any(getattr(old, f) != row[f] for f in self.RANKING_FIELDS):
+                return False
+            opening = opening_from_row(row)
+            self.model.replace_row(i, (opening, opening.is_closed(now)))
+        return True
+
+    def reload_all(self):
+        # A bound slot, so Qt disconnects it once this screen is deleted
+        self.refresh(set(TABLES))
+
+    def refresh(self, changed):
+        """Catch up with changes too many to patch (see gui/changes.py)."""
+        if "applications" in changed:
+            self.applications.reload()
+        if changed & {"openings", "students"}:
+            self.update_matches(reload=True)  # the matches themselves may differ
+        else:
+            self.model.rows_changed()  # only the applied badges
+        self.update_toggle_button()
+
+    def update_matches(self, reload=False):
+        """
+        Bring the stored matches up to date on the pool, then reload the
+        list if they changed (or always, with reload=True). Until then the
+        list shows the stored, possibly stale, rows.
+        """
+        self.updating_matches = True
+        self.tasks.submit(refresh_matches, self.db.db_path,
+                          on_done=lambda changed: self.matches_updated(changed or reload))
+
+    def matches_updated(self, reload):
+        self.updating_matches = False
+        # an empty first page may only have been stale; read it again
+        if reload or self.stale_empty_page:
+            self.stale_empty_page = False
+            self.model.reload()
+
+    def first_page_loaded(self, count, more):
+        """Select the top match, or say there are none, once page one arrives."""
+        if not count and self.updating_matches:
+            self.stale_empty_page = True  # wait for the refreshed list
+            return
+        self.model.page_loaded.disconnect(self.first_page_loaded)
+        if not count:
+            QMessageBox.information(
+                self,
+                "No Matches",
+                "No openings match your criteria."
+            )
+            return
+        self.list_view.setCurrentIndex(self.model.index(0))
+
+    def describe(self, row):
+        opening, closed = row
+        base = f"{opening.name} @ {opening.location} — SAR {opening.stipend}"
+        # open vs closed (as of this view)
+        status = "Application Closed" if closed else "Application Open"
+        badge = "   ✓ Applied" if self.applications.has_applied(opening.opening_id) else ""
+        return f"{base}   [{status}]{badge}"
+
+    @staticmethod
+    def status_color(row):
+        return QColor(Qt.GlobalColor.red if row[1] else Qt.GlobalColor.green)
+
+    def current_opening(self):
+        """The selected Opening, or None."""
+        idx = self.list_view.currentIndex()
+        return self.model.row(idx.row())[0] if idx.isValid() else None
+
+    def get_matches(self, after=None, limit=100):
+        """
+        Return one page of (Opening, is_closed) pairs and the offset of the
+        next page (None after the last). Matches are materialized in the
+        database and only recomputed for the slices that changed since the
+        last view (see MatchStore); each page is read by rank from its
+        index. Pages are served as stored while update_matches() brings
+        the store up to date. Repeat views with the same profile and
+        openings come from _match_cache, which only keeps pages read from
+        an up-to-date store; deadlines are checked per view.
+        Runs on a worker thread, so it opens its own DBManager.
+        """
+        db = DBManager(self.db.db_path)
+        offset = after or 0
+        email = self.student_row['email']
+        row = db.get_student_by_email(email) or self.student_row
+        key = (db.db_path, db.get_openings_version(), profile_key(student_from_row(row)),
+               offset, limit)
+        store = MatchStore(db.db_path)
+        # one extra row tells whether another page follows
+        if store.is_current():
+            matches = _match_cache.get_or_compute(
+                key, lambda: store.get_matches(email, limit=limit + 1, offset=offset))
+        else:
+            matches = store.get_matches(email, limit=limit + 1, offset=offset)
+        now = datetime.utcnow()
+        page = [(o, o.is_closed(now)) for o in matches[:limit]]
+        return page, (offset + limit if len(matches) > limit else None)
+
+    def show_details(self, index):
+        opening = self.model.row(index.row())[0]
         info = (
             f"Opening ID: {opening.opening_id}\n"
             f"Name: {opening.name}\n"
@@ -145,27 +245,20 @@ class MatchingResultsWindow(QWidget):
         QMessageBox.information(self, "Opening Details", info)
 
     def update_toggle_button(self):
-        idx = self.list_widget.currentRow()
-        if idx < 0:
+        opening = self.current_opening()
+        if opening is None:
             self.toggle_btn.setText("Select an opening to Apply/Cancel")
             self.toggle_btn.setEnabled(False)
             return
         self.toggle_btn.setEnabled(True)
-        opening = self.openings[idx]
-        applied = bool(self.db.cursor.execute(
-            "SELECT 1 FROM applications WHERE student_email=? AND opening_id=?",
-            (self.student_row['email'], opening.opening_id)
-        ).fetchone())
+        applied = self.applications.has_applied(opening.opening_id)
         self.toggle_btn.setText("Cancel Application" if applied else "Apply")
 
     def toggle_current_application(self):
-        idx = self.list_widget.currentRow()
-        if idx < 0:
+        o = self.current_opening()
+        if o is None:
             return
 
-        o = self.openings[idx]
-        email = self.student_row['email']
-
         # --- New: block Apply if deadline has passed ---
         now = datetime.now()
         if self.toggle_btn.text() == "Apply" and o.deadline and now > o.deadline:
@@ -178,7 +271,7 @@ class MatchingResultsWindow(QWidget):
 
         # Proceed with normal apply/cancel logic
         if self.toggle_btn.text() == "Apply":
-            if self.db.apply_to_opening(email, o.opening_id):
+            if self.applications.apply(o.opening_id):
                 QMessageBox.information(self, "Applied", "Your application was successful.")
         else:
             ans = QMessageBox.question(
@@ -187,13 +280,12 @@ class MatchingResultsWindow(QWidget):
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
             if ans == QMessageBox.StandardButton.Yes:
-                self.db.cancel_application(email, o.opening_id)
+                self.applications.cancel(o.opening_id)
                 QMessageBox.information(self, "Cancelled", "Your application has been cancelled.")
 
-        # Refresh the button text (“Apply” or “Cancel”) after the action
+        # Refresh the badge and the button text (“Apply” or “Cancel”) after the action
+        self.model.row_changed(self.list_view.currentIndex().row())
         self.update_toggle_button()
     def back_to_dashboard(self):
         from gui.student_dashboard import StudentDashboard
-        self.next_window = StudentDashboard(self.student_row)
-        self.next_window.show()
-        self.close()
+        navigate(self, StudentDashboard, self.student_row)
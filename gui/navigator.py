@@ -0,0 +1,200 @@
+# gui/navigator.py
+"""
+One main window whose screens stay alive between visits.
+
+    navigate(self, StudentDashboard, student_row)   # instead of X(...).show(); self.close()
+    go_back(self)                                   # the previous cached screen, if any
+
+Navigator is a QStackedWidget. A screen class opts into caching with
+
+    @staticmethod
+    def screen_key(*args): ...   # same arguments as __init__; equal keys share a screen
+    DEPENDS_ON = ("openings",)   # data_versions counters its contents come from
+    def refresh(self, changed): ...   # `changed` is the set of those that moved
+
+Opening a cached screen again just raises it. If one of its DEPENDS_ON
+counters (see DBManager.get_data_versions) moved since it was last shown,
+refresh(changed) runs first, so the screen re-reads only what went stale.
+List screens instead follow gui/changes.py row by row, and need no
+DEPENDS_ON; the notifier is polled on every switch so they are current
+when raised.
+Screens without screen_key (login and entry forms) are built fresh every
+time and dropped as soon as they are left.
+
+Hidden screens are evicted, least recently used first, once more than
+`max_cached` are kept, and after `idle_ttl` seconds unseen; eviction
+closes the screen, so its TaskRunner cancels what it still had pending.
+
+A window that is not inside a Navigator (e.g. one built on its own in a
+test) navigates the old way: the next window is shown and it closes.
+"""
+
+import sys
+import time
+from collections import OrderedDict
+
+from PyQt6.QtWidgets import QStackedWidget
+
+
+class Navigator(QStackedWidget):
+    """The application's main window: a stack of screens."""
+
+    def __init__(self, db_path: str = "ams.db", max_cached: int = 6,
+                 idle_ttl: float = 600.0, parent=None):
+        super().__init__(parent)
+        self.db_path = db_path
+        self.max_cached = max_cached
+        self.idle_ttl = idle_ttl
+        self._cached = OrderedDict()  # (class, key) -> screen, least recently shown first
+        self._seen = {}               # screen -> data versions it last showed
+        self._left = {}               # screen -> monotonic time it was hidden
+        self._sizes = {}              # screen -> the size it asked for in init_ui
+        self._history = []            # cached screens to go back to, most recent last
+
+    @staticmethod
+    def of(widget):
+        """The Navigator `widget` is shown in, or None."""
+        while widget is not None:
+            if isinstance(widget, Navigator):
+                return widget
+            widget = widget.parentWidget()
+        return None
+
+    def open(self, cls, *args, **kwargs):
+        """Show screen `cls(*args, **kwargs)`, reusing a cached one if its key matches."""
+        key = None
+        if hasattr(cls, "screen_key"):
+            key = (cls, cls.screen_key(*args, **kwargs))
+        screen = self._cached.get(key) if key is not None else None
+        if screen is None:
+            screen = cls(*args, **kwargs)
+            self._add(screen)
+            if key is not None:
+                self._cached[key] = screen
+        current = self.currentWidget()
+        if current is not None and current is not screen and self._is_cached(current):
+            if screen in self._history:
+                del self._history[self._history.index(screen):]
+            self._history.append(current)
+        self._switch(screen)
+        return screen
+
+    def back(self) -> bool:
+        """Return to the previous cached screen; False if there is none."""
+        while self._history:
+            screen = self._history.pop()
+            if self._is_cached(screen):
+                self._switch(screen)
+                return True
+        return False
+
+    def reset(self):
+        """Drop every screen but the current one (e.g. on log out)."""
+        current = self.currentWidget()
+        for screen in list(self._cached.values()):
+            if screen is not current:
+                self._drop(screen)
+        self._history.clear()
+
+    def cached_screens(self):
+        """The cached screens, least recently shown first."""
+        return list(self._cached.values())
+
+    def _add(self, screen):
+        self._sizes[screen] = screen.size()
+        screen.windowTitleChanged.connect(
+            lambda title, s=screen: self.setWindowTitle(title) if s is self.currentWidget() else None)
+        self.addWidget(screen)
+
+    def _is_cached(self, screen) -> bool:
+        return screen in self._cached.values()
+
+    def _switch(self, screen):
+        changes = sys.modules.get("gui.changes")  # loaded once a live screen exists
+        if changes is not None:
+            changes.poll_changes(self.db_path)  # live screens catch up before they are shown
+        previous = self.currentWidget()
+        if previous is not None and previous is not screen:
+            if self._is_cached(previous):
+                self._left[previous] = time.monotonic()
+            else:
+                self._drop(previous)
+        self._left.pop(screen, None)
+        if self._is_cached(screen):
+            # Versions as of showing: anything written after that, even
+            # while this screen was still on top, counts as a change next time
+            now = self._versions(screen)
+            seen = self._seen.get(screen)
+            if seen is not None:
+                changed = {name for name, version in now.items() if seen.get(name) != version}
+                if changed:
+                    screen.refresh(changed)
+            self._seen[screen] = now
+        for key, cached in self._cached.items():
+            if cached is screen:
+                self._cached.move_to_end(key)
+                break
+        self.setCurrentWidget(screen)
+        self.setWindowTitle(screen.windowTitle())
+        self.resize(self._sizes.get(screen, self.size()))
+        self._evict()
+
+    def _versions(self, screen) -> dict:
+        from database.db_manager import DBManager  # not needed to show the entry window
+        names = getattr(screen, "DEPENDS_ON", ())
+        return DBManager(self.db_path).get_data_versions(names) if names else {}
+
+    def _evict(self):
+        current = self.currentWidget()
+        now = time.monotonic()
+        idle = [s for s, left in self._left.items()
+                if self.idle_ttl is not None and now - left > self.idle_ttl]
+        for screen in idle:
+            self._drop(screen)
+        for screen in list(self._cached.values()):
+            if len(self._cached) <= self.max_cached:
+                break
+            if screen is not current:
+                self._drop(screen)
+
+    def _drop(self, screen):
+        for key, cached in list(self._cached.items()):
+            if cached is screen:
+                del self._cached[key]
+        self._seen.pop(screen, None)
+        self._left.pop(screen, None)
+        self._sizes.pop(screen, None)
+        if screen in self._history:
+            self._history.remove(screen)
+        self.removeWidget(screen)
+        screen.close()
+        screen.deleteLater()
+
+    def closeEvent(self, event):
+        # Closing the main window closes every screen, cancelling their tasks
+        for screen in [self.widget(i) for i in range(self.count())]:
+            screen.close()
+        super().closeEvent(event)
+
+
+def navigate(current, cls, *args, reset: bool = False, **kwargs):
+    """
+    Go from screen `current` to `cls(*args, **kwargs)` and return it.
+    With reset=True (log out) every other cached screen is dropped.
+    """
+    navigator = Navigator.of(current)
+    if navigator is None:
+        current.next_window = cls(*args, **kwargs)
+        current.next_window.show()
+        current.close()
+        return current.next_window
+    screen = navigator.open(cls, *args, **kwargs)
+    if reset:
+        navigator.reset()
+    return screen
+
+
+def go_back(current) -> bool:
+    """Return to the screen before `current` if it is still cached."""
+    navigator = Navigator.of(current)
+    return navigator is not None and navigator.back()
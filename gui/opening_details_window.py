@@ -7,6 +7,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QDateTime
 from database.db_manager import DBManager
+from gui.navigator import navigate
 from gui.openings_list_window import OpeningsListWindow
 
 class OpeningDetailsWindow(QWidget):
@@ -149,18 +150,14 @@ class OpeningDetailsWindow(QWidget):
         )
 
         # --- Navigate back to openings list ---
-        self.next_window = OpeningsListWindow({
+        navigate(self, OpeningsListWindow, {
             'email': self.company_email,
             'role':  'company'
         })
-        self.next_window.show()
-        self.close()
 
     def back_to_list(self):
         """Cancel creation and return to the openings list view."""
-        self.next_window = OpeningsListWindow({
+        navigate(self, OpeningsListWindow, {
             'email': self.company_email,
             'role':  'company'
         })
-        self.next_window.show()
-        self.close()
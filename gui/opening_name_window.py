@@ -4,6 +4,7 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton, QMessageBox
 )
 from PyQt6.QtCore import Qt
+from gui.navigator import navigate
 
 class OpeningNameWindow(QWidget):
     def __init__(self, company_email):
@@ -36,9 +37,7 @@ class OpeningNameWindow(QWidget):
 
     def back_to_list(self):
         from gui.openings_list_window import OpeningsListWindow
-        self.next_window = OpeningsListWindow({'email': self.company_email, 'role': 'company'})
-        self.next_window.show()
-        self.close()
+        navigate(self, OpeningsListWindow, {'email': self.company_email, 'role': 'company'})
 
     def handle_next(self):
         name = self.name_input.text().strip()
@@ -47,7 +46,4 @@ class OpeningNameWindow(QWidget):
             return
 
         from gui.opening_details_window import OpeningDetailsWindow
-        # keep a persistent reference so the window isn't garbage-collected
-        self.next_window = OpeningDetailsWindow(self.company_email, name)
-        self.next_window.show()
-        self.close()
+        navigate(self, OpeningDetailsWindow, self.company_email, name)
@@ -1,19 +1,36 @@
 # gui/openings_list_window.py
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel,
-    QListWidget, QListWidgetItem, QListView,
+    QWidget, QVBoxLayout, QLabel, QListView,
     QPushButton, QMessageBox, QHBoxLayout
 )
 from PyQt6.QtCore import Qt
 from database.db_manager import DBManager
+from gui.changes import change_notifier
 from gui.entry_window import EntryWindow
+from gui.list_models import ButtonsDelegate, PagedListModel
+from gui.navigator import navigate
+from gui.tasks import TaskRunner
 
 class OpeningsListWindow(QWidget):
+    # Reused by the navigator for the same company (see gui/navigator.py);
+    # kept current by on_rows_changed rather than refreshed on return
+    @staticmethod
+    def screen_key(user_row):
+        return user_row['email']
+
     def __init__(self, user_row):
         super().__init__()
         self.user = user_row               # expects dict/Row with ['email']
         self.db = DBManager()
+        self.tasks = TaskRunner(self)
+        # Opening rows, fetched a page at a time as the list scrolls
+        self.model = PagedListModel(self.fetch_page,
+                                    lambda o: f"[{o['opening_id']}] {o['opening_name']}",
+                                    tasks=self.tasks, parent=self)
+        self.changes = change_notifier(self.db.db_path)
+        self.changes.rows_changed.connect(self.on_rows_changed)
+        self.changes.reset.connect(self.load_openings)
         self.init_ui()
 
     def init_ui(self):
@@ -27,10 +44,14 @@ class OpeningsListWindow(QWidget):
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
-        # List widget
-        self.list_widget = QListWidget()
-        self.list_widget.setViewMode(QListView.ViewMode.IconMode)
-        layout.addWidget(self.list_widget)
+        # List view; the Edit/Delete buttons are painted by the delegate
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setUniformItemSizes(True)
+        self.buttons = ButtonsDelegate(["Edit", "Delete"], self.list_view)
+        self.buttons.clicked.connect(self.row_clicked)
+        self.list_view.setItemDelegate(self.buttons)
+        layout.addWidget(self.list_view)
 
         # Buttons
         btn_layout = QHBoxLayout()
@@ -49,59 +70,62 @@ class OpeningsListWindow(QWidget):
         self.load_openings()
 
     def load_openings(self):
+        """Refresh the list from its first page."""
+        self.model.reload()
+
+    def on_rows_changed(self, table, keys):
+        """Patch the rows of openings edited, added or deleted anywhere."""
+        if table != "openings":
+            return
+        positions = {o['opening_id']: i for i, o in enumerate(self.model.rows)}
+        removed, added = [], []
+        for opening_id in keys:
+            row = self.db.get_opening_by_id(opening_id)
+            i = positions.get(opening_id)
+            if i is not None:
+                if row is None:
+                    removed.append(i)
+                else:
+                    self.model.replace_row(i, row)
+            elif row is not None and row['company_email'] == self.user['email'] and self.model.done:
+                # not loaded yet: it arrives with its page unless every page is in
+                added.append(row)
+        for i in sorted(removed, reverse=True):
+            self.model.remove_row(i)
+        for row in sorted(added, key=lambda o: o['opening_id']):
+            self.model.append_row(row)
+
+    def fetch_page(self, after, limit):
         """
-        Refresh the list with each opening displayed alongside a Delete button.
+        One page of this company's openings (keyset on opening_id) and the
+        key of the next page; runs on a worker thread.
         """
-        self.list_widget.clear()
-        openings = self.db.get_openings_by_company(self.user['email'])
-        for o in openings:
-            # Create a container widget
-            container = QWidget()
-            hbox = QHBoxLayout()
-            hbox.setContentsMargins(5, 2, 5, 2)
-
-            # Opening label
-            label = QLabel(f"[{o['opening_id']}] {o['opening_name']}")
-            label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-            hbox.addWidget(label, stretch=1)
-
-            # Edit button
-            edit_btn = QPushButton("Edit")
-            edit_btn.clicked.connect(lambda _, oid=o['opening_id']: self.edit_opening(oid))
-            hbox.addWidget(edit_btn)
-
-            # Delete button
-            del_btn = QPushButton("Delete")
-            del_btn.clicked.connect(lambda _, oid=o['opening_id'], name=o['opening_name']: self.confirm_delete(oid, name))
-            hbox.addWidget(del_btn)
-
-            container.setLayout(hbox)
-
-            # Insert into list
-            item = QListWidgetItem()
-            item.setSizeHint(container.sizeHint())
-            self.list_widget.addItem(item)
-            self.list_widget.setItemWidget(item, container)
+        rows = DBManager(self.db.db_path).get_openings_by_company(
+            self.user['email'], after=after, limit=limit + 1)
+        if len(rows) > limit:
+            return rows[:limit], rows[limit - 1]['opening_id']
+        return rows, None
+
+    def row_clicked(self, row, label):
+        """Edit or delete the opening whose painted button was clicked."""
+        o = self.model.row(row)
+        if label == "Edit":
+            self.edit_opening(o['opening_id'])
+        else:
+            self.confirm_delete(o['opening_id'], o['opening_name'])
 
     def log_out(self):
-        # Keep a reference so it isn't garbage-collected
-        self.next_window = EntryWindow()
-        self.next_window.show()
-        self.close()
+        navigate(self, EntryWindow, reset=True)
 
 
     def issue_new(self):
         from gui.opening_name_window import OpeningNameWindow
-        self.next_window = OpeningNameWindow(self.user['email'])
-        self.next_window.show()
-        self.close()
+        navigate(self, OpeningNameWindow, self.user['email'])
 
     def edit_opening(self, opening_id):
         # defer the import until runtime to avoid circularity
         from gui.company_dashboard import CompanyDashboard
-        self.next_window = CompanyDashboard(self.user, opening_id)
-        self.next_window.show()
-        self.close()
+        navigate(self, CompanyDashboard, self.user, opening_id)
 
     def confirm_delete(self, opening_id, opening_name):
         reply = QMessageBox.question(
@@ -113,4 +137,4 @@ class OpeningsListWindow(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             self.db.delete_opening(opening_id)
             QMessageBox.information(self, "Deleted", f"Deleted opening '{opening_name}'.")
-            self.load_openings()
+            self.changes.poll()  # drops the row now rather than on the next tick
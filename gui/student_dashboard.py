@@ -2,8 +2,17 @@
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton
 from PyQt6.QtCore import Qt
+from database.db_manager import DBManager
+from gui.navigator import navigate
 
 class StudentDashboard(QWidget):
+    # Reused by the navigator for the same student (see gui/navigator.py)
+    DEPENDS_ON = ("students",)
+
+    @staticmethod
+    def screen_key(user_row):
+        return user_row['email']
+
     def __init__(self, user_row):
         """
         user_row: sqlite3.Row or dict with keys:
@@ -12,21 +21,23 @@ class StudentDashboard(QWidget):
         """
         super().__init__()
         self.user = user_row
+        self.db = DBManager()
         self.init_ui()
 
     def init_ui(self):
-        self.setWindowTitle(f"Student Dashboard — {self.user['name']}")
         self.setGeometry(250, 250, 600, 400)
 
         layout = QVBoxLayout()
         layout.setAlignment(Qt.AlignmentFlag.AlignTop)
 
         # Profile summary
-        layout.addWidget(QLabel(f"Welcome, {self.user['name']}!"))
-        layout.addWidget(QLabel(f"GPA: {self.user['gpa']}"))
-        layout.addWidget(QLabel(f"Specialization: {self.user['specialization']}"))
-        prefs = self.user['preferred_locations'].replace(';', ', ')
-        layout.addWidget(QLabel(f"Preferred Locations: {prefs}"))
+        self.welcome_label = QLabel()
+        self.gpa_label = QLabel()
+        self.spec_label = QLabel()
+        self.prefs_label = QLabel()
+        for label in (self.welcome_label, self.gpa_label, self.spec_label, self.prefs_label):
+            layout.addWidget(label)
+        self.show_profile()
 
                 # View matches button
         btn_view_matches = QPushButton("View Matching Results")
@@ -45,20 +56,27 @@ class StudentDashboard(QWidget):
 
         self.setLayout(layout)
 
+    def show_profile(self):
+        self.setWindowTitle(f"Student Dashboard — {self.user['name']}")
+        self.welcome_label.setText(f"Welcome, {self.user['name']}!")
+        self.gpa_label.setText(f"GPA: {self.user['gpa']}")
+        self.spec_label.setText(f"Specialization: {self.user['specialization']}")
+        prefs = self.user['preferred_locations'].replace(';', ', ')
+        self.prefs_label.setText(f"Preferred Locations: {prefs}")
+
+    def refresh(self, changed):
+        """The profile was edited since this screen was last shown."""
+        self.user = self.db.get_student_by_email(self.user['email']) or self.user
+        self.show_profile()
+
     def show_matches(self):
         from gui.matching_results import MatchingResultsWindow
-        self.next_window = MatchingResultsWindow(self.user)
-        self.next_window.show()
-        self.close()
+        navigate(self, MatchingResultsWindow, self.user)
 
     def edit_profile(self):
         from gui.student_profile_window import StudentProfileWindow
-        self.next_window = StudentProfileWindow(self.user['email'])
-        self.next_window.show()
-        self.close()
+        navigate(self, StudentProfileWindow, self.user['email'])
 
     def log_out(self):
         from gui.login_window import LoginWindow
-        self.next_window = LoginWindow(role='student')
-        self.next_window.show()
-        self.close()
+        navigate(self, LoginWindow, role='student', reset=True)
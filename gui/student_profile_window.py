@@ -6,6 +6,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from database.db_manager import DBManager
+from gui.navigator import navigate
 
 class StudentProfileWindow(QWidget):
     def __init__(self, email: str):
@@ -122,6 +123,4 @@ class StudentProfileWindow(QWidget):
 
         # Go to student dashboard
         from gui.student_dashboard import StudentDashboard
-        self.next_window = StudentDashboard(self.db.get_student_by_email(self.email))
-        self.next_window.show()
-        self.close()
+        navigate(self, StudentDashboard, self.db.get_student_by_email(self.email))
@@ -0,0 +1,114 @@
+# gui/tasks.py
+"""
+Background work for windows, on the application-wide QThreadPool.
+
+    self.tasks = TaskRunner(self)
+    self.tasks.submit(load_rows, email, on_done=self.show_rows)
+
+`fn` runs on a pool thread; `on_done(result)` or `on_error(exc)` run back
+on the GUI thread (without on_error, failures are shown in a message
+box). Task functions must open their own DBManager: each pool thread then
+gets its own SQLite connection from the registry in database/connection.py
+(connections are never shared across threads).
+
+When the window closes, queued tasks are dropped and the results of
+running ones are discarded. While anything is pending the window shows a
+busy cursor and `busy_changed` fires, e.g. to disable buttons.
+"""
+
+from PyQt6.QtCore import QEvent, QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtWidgets import QMessageBox
+
+
+class _TaskSignals(QObject):
+    # Created on the GUI thread, so connected slots run there
+    done = pyqtSignal(object)
+    error = pyqtSignal(object)
+
+
+class Task(QRunnable):
+    """One call of `fn(*args, **kwargs)` on the pool."""
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.setAutoDelete(False)  # the runner holds it until it reports back
+        self.fn, self.args, self.kwargs = fn, args, kwargs
+        self.signals = _TaskSignals()
+        self.cancelled = False  # long jobs may poll this to stop early
+
+    def cancel(self):
+        """Drop the result; the call itself is not interrupted."""
+        self.cancelled = True
+
+    def run(self):
+        if self.cancelled:
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as exc:
+            if not self.cancelled:
+                self.signals.error.emit(exc)
+            return
+        if not self.cancelled:
+            self.signals.done.emit(result)
+
+
+class TaskRunner(QObject):
+    """Submits a window's background work and tracks what is still pending."""
+
+    busy_changed = pyqtSignal(bool)
+
+    def __init__(self, window, pool: QThreadPool = None):
+        super().__init__(window)
+        self.window = window
+        self.pool = pool or QThreadPool.globalInstance()
+        self.pending = set()
+        window.installEventFilter(self)
+
+    def submit(self, fn, *args, on_done=None, on_error=None, **kwargs) -> Task:
+        """Run `fn(*args, **kwargs)` on the pool and return the Task."""
+        task = Task(fn, *args, **kwargs)
+        task.signals.done.connect(lambda result: self._finish(task, on_done, result))
+        task.signals.error.connect(lambda exc: self._finish(task, on_error or self.show_error, exc))
+        self.pending.add(task)
+        if len(self.pending) == 1:
+            self._set_busy(True)
+        self.pool.start(task)
+        return task
+
+    def cancel_all(self):
+        """Cancel everything still pending (done automatically on close)."""
+        for task in list(self.pending):
+            task.cancel()
+            self.pool.tryTake(task)
+        if self.pending:
+            self.pending.clear()
+            self._set_busy(False)
+
+    @property
+    def busy(self) -> bool:
+        return bool(self.pending)
+
+    def _finish(self, task, callback, value):
+        if task not in self.pending:
+            return  # cancelled after it had already emitted
+        self.pending.discard(task)
+        if not self.pending:
+            self._set_busy(False)
+        if callback is not None:
+            callback(value)
+
+    def show_error(self, exc: Exception):
+        QMessageBox.critical(self.window, "Error", f"Something went wrong:\n{exc}")
+
+    def _set_busy(self, busy: bool):
+        if busy:
+            self.window.setCursor(Qt.CursorShape.BusyCursor)
+        else:
+            self.window.unsetCursor()
+        self.busy_changed.emit(busy)
+
+    def eventFilter(self, obj, event):
+        if obj is self.window and event.type() == QEvent.Type.Close:
+            self.cancel_all()
+        return False
@@ -1,36 +1,57 @@
 import sys
-from PyQt6.QtWidgets import QApplication
 
-# Import the entry window (role selection)
-from gui.entry_window import EntryWindow
-
-# Import database setup to ensure tables exist
-from database import setup
-
-# Import utility modules (if needed globally)
-from utils import encryption, validation, notifications
-
-# Import matching system (for business logic use within GUIs)
-from models.matching import MatchingSystem
-
-# Optional: Import logger (if you have a custom logger)
-# from utils.logger import setup_logger
-
-
-def main():
-    # Step 1: Initialize database (creates tables if not existing)
-    setup.create_tables()
-
-    # Step 2: Initialize the QApplication
-    app = QApplication(sys.argv)
-
-    # Step 3: Launch the Entry Window for role selection
-    entry_window = EntryWindow()
-    entry_window.show()
+from utils.startup import StartupProfile, on_first_paint
+
+# Everything else is imported inside main() or where it is first used, so
+# the entry window appears before the database layer, bcrypt, Jinja2 or the
+# matching code are loaded. `python main.py --profile-startup` prints how
+# long each import and startup step took, then exits after the first paint.
+
+
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    profile = StartupProfile(enabled="--profile-startup" in argv)
+    profile.install()
+
+    # Step 1: Initialize the QApplication
+    with profile.phase("import PyQt6"):
+        from PyQt6.QtWidgets import QApplication
+    with profile.phase("QApplication"):
+        app = QApplication([a for a in argv if a != "--profile-startup"])
+
+    # Step 2: Launch the Entry Window for role selection; every later screen
+    # is shown in the same window by the navigator
+    with profile.phase("import gui.entry_window"):
+        from gui.entry_window import EntryWindow
+        from gui.navigator import Navigator
+    with profile.phase("EntryWindow"):
+        navigator = Navigator()
+        navigator.open(EntryWindow)
+        navigator.show()
+
+    # Step 3: Once the window is up, make sure the database schema is current
+    # (DBManager would also do this on first use) and calibrate bcrypt
+    # on a pool thread (see utils/auth.py)
+    def after_first_paint():
+        profile.mark("first paint")
+        with profile.phase("database setup"):
+            from database import setup
+            setup.create_tables()
+        # Fit the bcrypt cost to this machine before anyone logs in
+        with profile.phase("start bcrypt calibration"):
+            from PyQt6.QtCore import QThreadPool
+            from utils.auth import auth_service
+            QThreadPool.globalInstance().start(auth_service().calibrate)
+        if profile.enabled:
+            profile.uninstall()
+            profile.report()
+            app.quit()
+
+    on_first_paint(navigator, after_first_paint)
 
     # Step 4: Execute the app loop
-    sys.exit(app.exec())
+    return app.exec()
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,237 @@
+# models/allocation.py
+"""
+Placement rounds: a stable assignment of students to opening seats.
+
+    python -m models.allocation                # allocate and save a round
+    python -m models.allocation --db ams.db --dry-run --backend python
+
+Students propose in the order match_openings_for_student ranks openings
+for them; each opening holds its best `capacity` proposers according to
+the applicant rules of ApplicantsWindow. This is student-proposing
+deferred acceptance (Gale-Shapley), so no student and opening would both
+rather be matched to each other than keep what they got, and no student
+can do better by misreporting preferences.
+"""
+
+import argparse
+import bisect
+import heapq
+import time
+from collections import deque
+from typing import Dict, Iterable, Optional
+
+from database.db_manager import DBManager
+from .matching import opening_from_tuple, student_from_tuple
+from .opening import Opening
+from .student import Student
+
+
+def allocate(students: Iterable[Student], openings: Iterable[Opening],
+             max_choices: Optional[int] = None,
+             backend: str = "python") -> Dict[str, Optional[int]]:
+    """
+    Return {student email: opening_id, or None if unplaced}.
+
+    An opening accepts a student whose GPA meets its required GPA and who
+    lists its location among their preferred locations (ApplicantsWindow's
+    filter). It prefers, for priority 'location', students who rank its
+    location higher, then higher GPA; for priority 'gpa', higher GPA only.
+    Remaining ties go to the lower email, so results do not depend on
+    input order. Each opening offers `capacity` seats. `max_choices` caps
+    how many openings each student may propose to.
+
+    backend="numpy" runs the proposals in vectorized rounds (see
+    models/vectorized.py). The student-optimal stable assignment is
+    unique, so both backends return the same result.
+    """
+    students, capacity, segments = _choices(students, openings, max_choices)
+    if backend == "numpy":
+        try:
+            from .vectorized import deferred_acceptance_numpy
+        except ImportError as e:
+            raise ImportError("The 'numpy' allocation backend requires NumPy "
+                              "(pip install numpy).") from e
+        held = deferred_acceptance_numpy(capacity, segments)
+    elif backend == "python":
+        held = _deferred_acceptance(capacity, segments)
+    else:
+        raise ValueError(f"Unknown allocation backend: {backend!r}")
+
+    result: Dict[str, Optional[int]] = {s.email: None for s in students}
+    for opening_id, holders in held.items():
+        for i in holders:
+            result[students[i].email] = opening_id
+    return result
+
+
+def _choices(students, openings, max_choices):
+    """
+    Return (students sorted by email, {opening_id: capacity}, segments),
+    where segments[i] lists student i's choices as [(opening ids, score)].
+
+    A student's choices form a few segments: their GPA-priority openings,
+    then one per preferred location. Every opening in a segment ranks the
+    student the same way, so that view is a single int `score` (larger is
+    better). Segment lists only hold openings the student's GPA qualifies
+    for, in stipend order, and are shared by every student with the same
+    specialization, locations and GPA band, so memory stays linear in
+    openings plus students.
+    """
+    students = sorted(students, key=lambda s: s.email)
+    n = len(students)
+
+    # merit: a student's place in (GPA, lower email) order, 0 = weakest.
+    # score = (depth - location rank) * n + merit, or merit for GPA priority
+    merit = [0] * n
+    for m, i in enumerate(sorted(range(n), key=lambda i: (students[i].gpa, -i))):
+        merit[i] = m
+    depth = max((len(s.preferred_locations) for s in students), default=0)
+
+    # Openings best stipend first; the sort is stable, so equal stipends
+    # keep input order exactly as in matching.py.
+    gpa_lists: Dict[tuple, list] = {}  # (specialization, location) -> GPA priority
+    loc_lists: Dict[tuple, list] = {}  # (specialization, location) -> location priority
+    position: Dict[int, int] = {}
+    capacity: Dict[int, int] = {}
+    for pos, o in enumerate(sorted(openings, key=lambda o: -o.stipend)):
+        if o.priority == 'gpa':
+            gpa_lists.setdefault((o.specialization, o.location), []).append(o)
+        elif o.priority == 'location':
+            loc_lists.setdefault((o.specialization, o.location), []).append(o)
+        else:
+            continue
+        position[id(o)] = pos
+        capacity[o.opening_id] = o.capacity
+
+    bases: Dict[tuple, tuple] = {}  # (kind, spec, locations) -> (openings, GPA levels)
+    shared: Dict[tuple, list] = {}  # ... + (GPA band,) -> opening ids
+
+    def segment(kind: str, spec: str, locations: tuple, gpa: float) -> list:
+        base_key = (kind, spec, locations)
+        if base_key not in bases:
+            lists = gpa_lists if kind == 'gpa' else loc_lists
+            parts = [lists.get((spec, loc), ()) for loc in locations]
+            base = list(heapq.merge(*parts, key=lambda o: position[id(o)]))
+            bases[base_key] = (base, sorted({o.required_gpa for o in base}))
+        base, levels = bases[base_key]
+        band = bisect.bisect_right(levels, gpa)
+        key = base_key + (band,)
+        if key not in shared:
+            limit = levels[band - 1] if band else -1
+            shared[key] = [o.opening_id for o in base if o.required_gpa <= limit]
+        return shared[key]
+
+    segments = []
+    for i, student in enumerate(students):
+        spec, gpa = student.specialization, student.gpa
+        prefs = list(dict.fromkeys(student.preferred_locations))
+        segs = [(segment('gpa', spec, tuple(sorted(prefs)), gpa), merit[i])]
+        for loc in prefs:
+            rank = student.preferred_locations.index(loc)
+            segs.append((segment('location', spec, (loc,), gpa), (depth - rank) * n + merit[i]))
+        if max_choices is not None:
+            left, capped = max_choices, []
+            for choices, score in segs:
+                capped.append((choices[:left], score))
+                left -= len(capped[-1][0])
+            segs = capped
+        segments.append(segs)
+    return students, capacity, segments
+
+
+def _deferred_acceptance(capacity: Dict[int, int], segments: list) -> Dict[int, list]:
+    """Student-proposing deferred acceptance; returns {opening_id: [student index]}."""
+    # Seats held per opening: a min-heap of (score, student index) with the
+    # weakest holder on top. floor[opening_id] is the score a proposer must
+    # beat: -1 while seats are free. Floors only ever rise, so a segment's
+    # cached minimum floor stays a valid lower bound, and a segment whose
+    # every seat is held by someone stronger is skipped in one comparison.
+    held: Dict[int, list] = {opening_id: [] for opening_id in capacity}
+    floor: Dict[int, int] = {opening_id: -1 for opening_id in capacity}
+    segment_floor: Dict[int, int] = {}
+
+    cursor = [(0, 0)] * len(segments)  # per student: (segment index, position)
+    free = deque(range(len(segments)))
+    while free:
+        i = free.popleft()
+        segs = segments[i]
+        seg, pos = cursor[i]
+        placed = None
+        while seg < len(segs):
+            choices, score = segs[seg]
+            key = id(choices)
+            if score > segment_floor.get(key, -1):
+                for pos in range(pos, len(choices)):
+                    if score > floor[choices[pos]]:
+                        placed = choices[pos]
+                        break
+                if placed is not None:
+                    pos += 1
+                    break
+                segment_floor[key] = min((floor[o] for o in choices), default=-1)
+            seg, pos = seg + 1, 0
+        cursor[i] = (seg, pos)
+        if placed is None:
+            continue  # choices exhausted: unplaced
+
+        seats = held[placed]
+        if len(seats) < capacity[placed]:
+            heapq.heappush(seats, (score, i))
+        else:
+            free.append(heapq.heapreplace(seats, (score, i))[1])
+        if len(seats) == capacity[placed]:
+            floor[placed] = seats[0][0]
+
+    return {opening_id: [i for _, i in seats] for opening_id, seats in held.items()}
+
+
+def default_backend() -> str:
+    """
+    The backend placement rounds use unless told otherwise: "numpy" when
+    NumPy is installed (several times faster at term scale), else "python".
+    Both give the same assignment.
+    """
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return "python"
+    return "numpy"
+
+
+def run_round(db: DBManager, max_choices: Optional[int] = None, save: bool = True,
+              backend: Optional[str] = None):
+    """
+    Allocate every student in the database and, if `save`, record the
+    round. Returns (round_id or None, assignments, seconds). `backend`
+    defaults to default_backend().
+    """
+    backend = backend or default_backend()
+    start = time.perf_counter()
+    openings = [opening_from_tuple(r) for r in db.iter_openings(as_tuples=True)]
+    students = [student_from_tuple(r) for r in db.iter_students(as_tuples=True)]
+    assignments = allocate(students, openings, max_choices, backend)
+    elapsed = time.perf_counter() - start
+    round_id = db.save_allocation(assignments, elapsed) if save else None
+    return round_id, assignments, elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a placement round (stable allocation).")
+    parser.add_argument("--db", default="ams.db", help="database file (default: ams.db)")
+    parser.add_argument("--max-choices", type=int, default=None,
+                        help="cap on openings each student may propose to")
+    parser.add_argument("--backend", choices=["python", "numpy"], default=None,
+                        help="default: numpy if installed, else python")
+    parser.add_argument("--dry-run", action="store_true", help="compute but do not save")
+    args = parser.parse_args(argv)
+
+    backend = args.backend or default_backend()
+    round_id, assignments, elapsed = run_round(DBManager(args.db), args.max_choices,
+                                               save=not args.dry_run, backend=backend)
+    placed = sum(1 for o in assignments.values() if o is not None)
+    print(f"placed {placed} of {len(assignments)} students in {elapsed:.2f}s ({backend})"
+          + (f" (round {round_id})" if round_id is not None else " (not saved)"))
+
+
+if __name__ == "__main__":
+    main()
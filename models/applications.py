@@ -0,0 +1,49 @@
+# models/applications.py
+"""
+Which openings a student has applied to, held in memory.
+
+The whole applied set is read once with one indexed query; after that,
+has_applied() is a set lookup. apply() and cancel() write to the database
+first and then update the set, so it stays in step with this process's own
+changes. Call reload() to pick up applications made elsewhere.
+"""
+
+from typing import FrozenSet
+
+from database.db_manager import DBManager
+
+
+class ApplicationState:
+    """The applied set of one student, with write-through apply/cancel."""
+
+    def __init__(self, student_email: str, db_path: str = "ams.db"):
+        self.student_email = student_email
+        self.db = DBManager(db_path)
+        self._applied = None  # read on first use
+
+    def reload(self):
+        """Read the applied set from the database again."""
+        self._applied = self.db.get_applied_opening_ids(self.student_email)
+
+    @property
+    def applied(self) -> FrozenSet[int]:
+        if self._applied is None:
+            self.reload()
+        return frozenset(self._applied)
+
+    def has_applied(self, opening_id: int) -> bool:
+        if self._applied is None:
+            self.reload()
+        return opening_id in self._applied
+
+    def apply(self, opening_id: int) -> bool:
+        """Apply; return True if first-time, False if already applied."""
+        first = self.db.apply_to_opening(self.student_email, opening_id)
+        if self._applied is not None:
+            self._applied.add(opening_id)
+        return first
+
+    def cancel(self, opening_id: int):
+        self.db.cancel_application(self.student_email, opening_id)
+        if self._applied is not None:
+            self._applied.discard(opening_id)
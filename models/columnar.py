@@ -0,0 +1,191 @@
+# models/columnar.py
+"""
+Students and openings as NumPy columns in one shared-memory block.
+
+The parent process loads both tables once with ColumnStore.load(); worker
+processes receive only its small, picklable `handle` and attach to the
+same memory with ColumnStore.attach(), so they map the data instead of
+unpickling Student/Opening objects, and memory stays flat however many
+workers attach. Text columns are coded as integers; the code -> name
+tables travel in the handle.
+
+    students: email (bytes), gpa, specialization, locations (one row of
+              location codes per student, padded with -1), skills (packed
+              bitsets, see skills.pack)
+    openings: opening_id, specialization, location, stipend, required_gpa,
+              priority (0 = gpa, 1 = location, -1 = other), deadline (POSIX
+              seconds, NaN if none or not a date), skills
+
+Requires NumPy.
+"""
+
+from collections import namedtuple
+from multiprocessing import shared_memory
+from typing import Dict, List
+
+import numpy as np
+
+from database.db_manager import DBManager
+from .opening import parse_deadline
+from .skills import SkillIndex, pack
+
+PRIORITY_CODES = {'gpa': 0, 'location': 1}
+
+# Everything a worker needs to attach: the block's name, where each column
+# lives in it, and the code -> name tables
+StoreHandle = namedtuple("StoreHandle",
+                         ["name", "layout", "specializations", "locations", "skills"])
+
+
+def _timestamp(deadline) -> float:
+    """POSIX seconds of a stored deadline; NaN if there is none or it is not a date."""
+    try:
+        parsed = parse_deadline(deadline)
+    except ValueError:
+        # rows written before ingest validated deadlines: one of them
+        # must not abort the whole load (or a --shared run)
+        return np.nan
+    return parsed.timestamp() if parsed else np.nan
+
+
+class ColumnStore:
+    """
+    Read-only column arrays over a shared-memory block. `students` and
+    `openings` map column names to arrays; row i of every student column
+    describes the same student.
+
+    The process that load()s the store owns the block and should close()
+    it when done (or use the store as a context manager), which also
+    frees the memory. Attached stores only close their own mapping.
+    Arrays taken from a store must not be used after it is closed.
+    """
+
+    def __init__(self, shm, handle: StoreHandle, owner: bool):
+        self._shm = shm
+        self._owner = owner
+        self.handle = handle
+        self.specializations: List[str] = list(handle.specializations)
+        self.locations: List[str] = list(handle.locations)
+        self.skills: List[str] = list(handle.skills)
+        self.students: Dict[str, np.ndarray] = {}
+        self.openings: Dict[str, np.ndarray] = {}
+        for table, column, dtype, shape, offset in handle.layout:
+            array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+            array.flags.writeable = False
+            getattr(self, table)[column] = array
+
+    @classmethod
+    def load(cls, db: DBManager) -> "ColumnStore":
+        """Read the students and openings tables into a new shared block."""
+        specs: Dict[str, int] = {}
+        locs: Dict[str, int] = {}
+        index = SkillIndex()
+
+        emails, gpas, student_specs, prefs, student_masks = [], [], [], [], []
+        for row in db.iter_students():
+            emails.append(row['email'].encode("utf-8"))
+            gpas.append(row['gpa'])
+            student_specs.append(specs.setdefault(row['specialization'], len(specs)))
+            cities = row['preferred_locations'].split(';') if row['preferred_locations'] else []
+            prefs.append([locs.setdefault(c, len(locs)) for c in cities])
+            student_masks.append(index.mask(row['skills'].split(',') if row['skills'] else []))
+
+        opening_rows = []
+        opening_masks = []
+        for row in db.iter_openings():
+            opening_rows.append((
+                row['opening_id'], specs.setdefault(row['specialization'], len(specs)),
+                locs.setdefault(row['location'], len(locs)), row['stipend'],
+                row['required_gpa'], PRIORITY_CODES.get(row['priority'], -1),
+                _timestamp(row['deadline'])))
+            required = row['required_skills'].split(',') if row['required_skills'] else []
+            opening_masks.append(index.mask(required))
+
+        depth = max(map(len, prefs), default=0)
+        locations = np.full((len(prefs), max(depth, 1)), -1, dtype=np.int32)
+        for i, codes in enumerate(prefs):
+            locations[i, :len(codes)] = codes
+        columns = {
+            'students': {
+                'email': np.array(emails, dtype=f"S{max(map(len, emails), default=1)}"),
+                'gpa': np.array(gpas, dtype=np.float64),
+                'specialization': np.array(student_specs, dtype=np.int32),
+                'locations': locations,
+                'skills': pack(student_masks, len(index)),
+            },
+            'openings': {},
+        }
+        names = ['opening_id', 'specialization', 'location', 'stipend',
+                 'required_gpa', 'priority', 'deadline']
+        types = [np.int64, np.int32, np.int32, np.float64, np.float64, np.int8, np.float64]
+        fields = list(zip(*opening_rows)) or [()] * len(names)
+        for name, dtype, values in zip(names, types, fields):
+            columns['openings'][name] = np.array(values, dtype=dtype)
+        columns['openings']['skills'] = pack(opening_masks, len(index))
+
+        # Lay the columns out back to back, each on an 8-byte boundary
+        layout, size = [], 0
+        for table, arrays in columns.items():
+            for column, array in arrays.items():
+                layout.append((table, column, array.dtype.str, array.shape, size))
+                size += -(-array.nbytes // 8) * 8
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for table, column, dtype, shape, offset in layout:
+            array = columns[table][column]
+            np.ndarray(shape, dtype=array.dtype, buffer=shm.buf, offset=offset)[...] = array
+
+        handle = StoreHandle(shm.name, tuple(layout), tuple(specs), tuple(locs),
+                             tuple(index.names()))
+        return cls(shm, handle, owner=True)
+
+    @classmethod
+    def attach(cls, handle: StoreHandle) -> "ColumnStore":
+        """Map a store created by load() in another process, without copying."""
+        return cls(shared_memory.SharedMemory(name=handle.name), handle, owner=False)
+
+    def rows(self, table: str, specialization: str) -> np.ndarray:
+        """Row numbers of `table` ('students' or 'openings') in one specialization."""
+        if specialization not in self.specializations:
+            return np.empty(0, dtype=np.intp)
+        code = self.specializations.index(specialization)
+        return np.flatnonzero(getattr(self, table)['specialization'] == code)
+
+    def match(self, specialization: str, skill_tiebreak: bool = False) -> Dict[str, List[int]]:
+        """
+        Match one specialization straight from the columns; returns {email:
+        [opening_id, ...]} in the order match_all_students gives.
+        """
+        from .vectorized import rank_openings
+
+        students = self.rows('students', specialization)
+        openings = self.rows('openings', specialization)
+        emails = [e.decode("utf-8") for e in self.students['email'][students].tolist()]
+        if not len(openings):
+            return {email: [] for email in emails}
+        # stable by stipend; rows are in opening_id order, as in the tables
+        openings = openings[np.argsort(-self.openings['stipend'][openings], kind="stable")]
+        o = {column: values[openings] for column, values in self.openings.items()}
+        s = {column: values[students] for column, values in self.students.items()}
+        ranked = rank_openings(
+            s['gpa'], s['locations'], o['location'], o['required_gpa'],
+            o['priority'] == PRIORITY_CODES['gpa'], o['priority'] == PRIORITY_CODES['location'],
+            o['stipend'], s['skills'] if skill_tiebreak else None,
+            o['skills'] if skill_tiebreak else None)
+        ids = o['opening_id']
+        return {emails[row]: ids[columns].tolist() for row, columns in ranked}
+
+    def close(self):
+        """Drop this process's mapping; the owner also frees the block."""
+        if self._shm is None:
+            return
+        self.students, self.openings = {}, {}
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,10 +1,16 @@
-class ApprenticeshipOpening:
+from .opening import Opening
+
+
+class ApprenticeshipOpening(Opening):
+    """
+    Legacy constructor kept for old callers: an Opening without a company
+    or name. New code should build Opening directly.
+    """
+    __slots__ = ()
+
     def __init__(self, opening_id, specialization, location, stipend, required_skills):
-        self.opening_id = opening_id
-        self.specialization = specialization
-        self.location = location
-        self.stipend = stipend
-        self.required_skills = required_skills  # list of skills
+        super().__init__(opening_id, "", "", specialization, location, stipend,
+                         required_skills)
 
     def __repr__(self):
         return f"Opening({self.opening_id}, {self.specialization}, {self.location}, Stipend: {self.stipend})"
@@ -0,0 +1,90 @@
+# models/match_cache.py
+"""
+In-memory cache of match lists.
+
+A student's matches depend only on their own matching profile and on the
+openings, so entries are keyed on (profile, openings version, ...). The
+version comes from DBManager.get_openings_version(), which triggers bump on
+every change to `openings`; a company's edit therefore makes every older
+entry unreachable rather than stale, and LRU order ages them out.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+
+def profile_key(student, skill_tiebreak: bool = False) -> tuple:
+    """
+    The parts of a Student that decide their matches. Students sharing a
+    profile share cache entries.
+    """
+    skills = tuple(sorted(s.strip().lower() for s in student.skills)) if skill_tiebreak else ()
+    return (student.specialization, student.gpa, tuple(student.preferred_locations), skills)
+
+
+class MatchCache:
+    """
+    Bounded LRU cache whose entries also expire `ttl` seconds after they
+    were stored (ttl=None: never). Safe to share between threads.
+    `hits`, `misses` and `evictions` (entries dropped for space or age)
+    count since creation or the last clear().
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: Optional[float] = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (expires, value)
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable, default=None):
+        """Return the cached value for `key`, or `default` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and entry[0] < time.monotonic():
+                del self._entries[key]
+                self.evictions += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value):
+        """Store `value`, evicting the least recently used entry if full."""
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], list]) -> list:
+        """
+        Return a copy of the cached list for `key`, calling compute() and
+        storing its result on a miss. Copies keep callers from editing
+        the cached list.
+        """
+        value = self.get(key)
+        if value is None:
+            value = list(compute())
+            self.put(key, value)
+        return list(value)
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "size": len(self._entries)}
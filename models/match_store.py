@@ -0,0 +1,155 @@
+# models/match_store.py
+
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from database.connection import write_transaction
+from database.db_manager import DBManager
+from .matching import match_all_students, opening_from_row, student_from_row
+from .opening import Opening
+
+# Above this many individually-dirty students (e.g. after a bulk ingest)
+# it is cheaper to recompute whole specializations than to look each up
+FULL_REFRESH_THRESHOLD = 10_000
+
+
+class MatchStore:
+    """
+    Materialized match lists in the `student_matches` table.
+
+    Triggers on `openings` and `students` (schema v3) queue the slices
+    that may have changed in `match_dirty`. refresh() recomputes only the
+    students in those slices. Reading a student's matches is then one
+    indexed join, and students whose results did not change are never
+    rewritten.
+
+    Reads never refresh: they serve the stored rows as they are and
+    is_current() says whether changes are still queued, so a reader
+    never waits on the write lock or pays for a recompute. The writer or
+    a background task (see gui/matching_results.py) runs refresh().
+
+    An opening change affects every student of its specialization whose
+    GPA clears its required GPA. Its location only moves it between that
+    student's preference buckets. So the slice is keyed on
+    (specialization, GPA) rather than on location.
+    """
+
+    def __init__(self, db_path: str = "ams.db"):
+        self.db = DBManager(db_path)
+
+    def get_matches(self, email: str, limit: Optional[int] = None,
+                    offset: int = 0) -> List[Opening]:
+        """
+        Return the student's stored matches in priority order; they may
+        lag behind queued changes until refresh() runs (see is_current()).
+        `limit`/`offset` select a page by rank straight from the index.
+        """
+        return [o for o, _ in self.iter_matches(email, limit=limit, offset=offset)]
+
+    def iter_matches(self, email: str, now: Optional[str] = None, open_only: bool = False,
+                     limit: Optional[int] = None, offset: int = 0,
+                     batch_size: int = 200) -> Iterator[Tuple[Opening, bool]]:
+        """
+        Stream (opening, is_closed) pairs in priority order. Whether the
+        deadline has passed as of `now` (ISO text, default: local now) is
+        decided by SQLite, and open_only=True skips closed openings there,
+        so only rows that are shown are turned into Opening objects.
+        Like get_matches(), this reads the stored lists without refreshing.
+        """
+        now = now or datetime.now().isoformat(timespec="milliseconds")
+        end = offset + limit if limit is not None else -1
+        cur = self.db.conn.execute(f"""
+            SELECT o.*, (o.deadline <> '' AND o.deadline < ?) AS is_closed
+              FROM student_matches m
+              JOIN openings o ON o.opening_id = m.opening_id
+             WHERE m.student_email = ? AND m.rank >= ? AND (? < 0 OR m.rank < ?)
+               {"AND (o.deadline = '' OR o.deadline >= ?)" if open_only else ""}
+             ORDER BY m.rank
+        """, (now, email, offset, end, end) + ((now,) if open_only else ()))
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                return
+            for r in rows:
+                yield opening_from_row(r), bool(r['is_closed'])
+
+    def is_current(self) -> bool:
+        """True if no change is waiting to be applied, i.e. reads are not stale."""
+        return self.db.conn.execute("SELECT 1 FROM match_dirty LIMIT 1").fetchone() is None
+
+    def refresh(self, rebuild: bool = False) -> int:
+        """
+        Apply pending changes (or recompute everyone, with rebuild=True) and
+        return how many students' lists were rewritten. Runs in one write
+        transaction (see write_transaction) so concurrent refreshes from
+        other windows or processes cannot interleave.
+        """
+        if not rebuild and self.is_current():
+            return 0
+        conn = self.db.conn
+        with write_transaction(conn, "match_refresh"):
+            if rebuild:
+                conn.execute("INSERT INTO match_dirty (specialization, min_gpa) "
+                             "SELECT DISTINCT specialization, NULL FROM students")
+            changed = self._apply_dirty()
+        return changed
+
+    def _apply_dirty(self) -> int:
+        conn = self.db.conn
+        max_id, n_students = conn.execute(
+            "SELECT MAX(dirty_id), COUNT(student_email) FROM match_dirty").fetchone()
+        if max_id is None:
+            return 0
+
+        # specialization -> lowest GPA that may be affected (None = everyone)
+        slices: Dict[str, float] = {}
+        if n_students > FULL_REFRESH_THRESHOLD:
+            for (spec,) in conn.execute("SELECT DISTINCT specialization FROM students"):
+                slices[spec] = None
+        for spec, min_gpa in conn.execute(
+                "SELECT specialization, min_gpa FROM match_dirty "
+                "WHERE specialization IS NOT NULL AND dirty_id <= ?", (max_id,)):
+            if min_gpa is None or (spec in slices and slices[spec] is None):
+                slices[spec] = None
+            else:
+                slices[spec] = min(slices.get(spec, min_gpa), min_gpa)
+
+        # specialization -> {email: Student}
+        students: Dict[str, dict] = {}
+        for spec, min_gpa in slices.items():
+            rows = conn.execute(
+                "SELECT * FROM students WHERE specialization = ? AND gpa >= ?",
+                (spec, -1 if min_gpa is None else min_gpa))
+            for row in rows:
+                students.setdefault(spec, {})[row['email']] = student_from_row(row)
+        if n_students <= FULL_REFRESH_THRESHOLD:
+            for (email,) in conn.execute(
+                    "SELECT DISTINCT student_email FROM match_dirty "
+                    "WHERE student_email IS NOT NULL AND dirty_id <= ?", (max_id,)).fetchall():
+                row = conn.execute("SELECT * FROM students WHERE email = ?", (email,)).fetchone()
+                if row is not None:
+                    students.setdefault(row['specialization'], {})[email] = student_from_row(row)
+
+        changed = 0
+        for spec, group in students.items():
+            openings = [opening_from_row(r) for r in conn.execute(
+                "SELECT * FROM openings WHERE specialization = ? ORDER BY opening_id", (spec,))]
+            for email, matches in match_all_students(group.values(), openings).items():
+                changed += self._store(email, [o.opening_id for o in matches])
+
+        conn.execute("DELETE FROM match_dirty WHERE dirty_id <= ?", (max_id,))
+        return changed
+
+    def _store(self, email: str, opening_ids: List[int]) -> int:
+        """Replace one student's stored list if it differs; return 1 if it did."""
+        conn = self.db.conn
+        stored = [r[0] for r in conn.execute(
+            "SELECT opening_id FROM student_matches WHERE student_email = ? ORDER BY rank",
+            (email,))]
+        if stored == opening_ids:
+            return 0
+        conn.execute("DELETE FROM student_matches WHERE student_email = ?", (email,))
+        conn.executemany(
+            "INSERT INTO student_matches (student_email, rank, opening_id) VALUES (?, ?, ?)",
+            [(email, rank, oid) for rank, oid in enumerate(opening_ids)])
+        return 1
@@ -1,9 +1,13 @@
 # models/matching.py
 
-from typing import List
+import heapq
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
 from database.db_manager import DBManager
 from .student import Student
 from .opening import Opening
+from .match_cache import MatchCache, profile_key
+from .skills import SkillIndex, overlap
 
 def match_openings_for_student(student: Student, openings: List[Opening]) -> List[Opening]:
     """
@@ -12,7 +16,11 @@ def match_openings_for_student(student: Student, openings: List[Opening]) -> Lis
     3) Sort within each group by stipend descending.
     4) Flatten and return the combined list.
     """
-def match_openings_for_student(student, openings):
+def match_openings_for_student(student, openings, skill_tiebreak=False):
+    # 0) with skill_tiebreak, equal stipends are ordered by how many of
+    #    the opening's required skills the student has (most first)
+    stipend_key = _stipend_key(student, skill_tiebreak)
+
     # 1) only those whose required_gpa ≤ student.gpa
     spec_matches = [
       o for o in openings
@@ -25,7 +33,7 @@ def match_openings_for_student(student, openings):
     loc_pref = [o for o in spec_matches if o.priority == 'location']
 
     # 3) GPA-priority group sorted by stipend desc
-    gpa_sorted = sorted(gpa_pref, key=lambda o: -o.stipend)
+    gpa_sorted = sorted(gpa_pref, key=stipend_key)
 
     # 4) location-priority grouping exactly as before
     buckets = {loc: [] for loc in student.preferred_locations}
@@ -37,26 +45,223 @@ def match_openings_for_student(student, openings):
             others.append(o)
     ordered_loc = []
     for loc in student.preferred_locations:
-        ordered_loc.extend(sorted(buckets[loc], key=lambda o: -o.stipend))
-    ordered_loc.extend(sorted(others, key=lambda o: -o.stipend))
+        ordered_loc.extend(sorted(buckets[loc], key=stipend_key))
+    ordered_loc.extend(sorted(others, key=stipend_key))
 
     # 5) final list: GPA-priority first, then location-priority
     return gpa_sorted + ordered_loc
 
 
+def _stipend_key(student: Student, skill_tiebreak: bool):
+    """Sort key within a priority bucket: stipend desc, then skill overlap desc."""
+    if not skill_tiebreak:
+        return lambda o: -o.stipend
+    index = SkillIndex()
+    wanted = index.mask(student.skills)
+    return lambda o: (-o.stipend, -overlap(wanted, index.mask(o.required_skills)))
+
+
+def iter_matches_for_student(student: Student, openings: Iterable[Opening],
+                             skill_tiebreak: bool = False) -> Iterator[Opening]:
+    """
+    Lazily yield exactly what match_openings_for_student returns, in the
+    same order. Bucketing is one O(n) pass and each bucket is heapified
+    rather than sorted, so taking the first k matches costs O(n + k log n)
+    instead of sorting every eligible opening.
+    """
+    stipend_key = _stipend_key(student, skill_tiebreak)
+    gpa_pref = []
+    buckets = {loc: [] for loc in student.preferred_locations}
+    others = []
+    for o in openings:
+        if o.specialization != student.specialization or student.gpa < o.required_gpa:
+            continue
+        if o.priority == 'gpa':
+            gpa_pref.append(o)
+        elif o.priority == 'location':
+            buckets.get(o.location, others).append(o)
+
+    def drain(bucket):
+        # Heap entries are (stipend key, position, opening): the position
+        # reproduces the stable sort's tie order and keeps Openings
+        # uncompared. Buckets the caller never reaches are never heapified.
+        heap = [(stipend_key(o), i, o) for i, o in enumerate(bucket)]
+        heapq.heapify(heap)
+        while heap:
+            yield heapq.heappop(heap)[2]
+
+    yield from drain(gpa_pref)
+    # A location listed twice is emitted twice, as in the list version
+    repeated = {loc for loc in buckets if student.preferred_locations.count(loc) > 1}
+    emitted: Dict[str, List[Opening]] = {}
+    for loc in student.preferred_locations:
+        if loc in emitted:
+            yield from emitted[loc]
+        elif loc in repeated:
+            emitted[loc] = list(drain(buckets[loc]))
+            yield from emitted[loc]
+        else:
+            yield from drain(buckets[loc])
+    yield from drain(others)
+
+
+def top_matches_for_student(student: Student, openings: Iterable[Opening],
+                            limit: int, offset: int = 0,
+                            skill_tiebreak: bool = False) -> List[Opening]:
+    """Return matches offset .. offset+limit-1 without ordering the rest."""
+    matches = iter_matches_for_student(student, openings, skill_tiebreak)
+    return list(islice(matches, offset, offset + limit))
+
+
+def student_from_row(row) -> Student:
+    """Build a Student from a `students` table row."""
+    prefs = row['preferred_locations'].split(';') if row['preferred_locations'] else []
+    skills = row['skills'].split(',') if row['skills'] else []
+    return Student(
+        student_id=row['student_id'],
+        name=row['name'],
+        email=row['email'],
+        gpa=row['gpa'],
+        specialization=row['specialization'],
+        preferred_locations=prefs,
+        skills=skills
+    )
+
+
+def opening_from_row(row) -> Opening:
+    """Build an Opening from an `openings` table row."""
+    req_skills = row['required_skills'].split(',') if row['required_skills'] else []
+    return Opening(
+        opening_id=row['opening_id'],
+        company_email=row['company_email'],
+        name=row['opening_name'],
+        specialization=row['specialization'],
+        location=row['location'],
+        stipend=row['stipend'],
+        required_skills=req_skills,
+        required_gpa=row['required_gpa'],
+        priority=row['priority'],
+        deadline=row['deadline'] or None,
+        capacity=row['capacity']
+    )
+
+
+def student_from_tuple(values) -> Student:
+    """Build a Student from a plain tuple in STUDENT_FIELDS order."""
+    student_id, name, email, gpa, specialization, prefs, skills = values
+    return Student(student_id, name, email, gpa, specialization,
+                   prefs.split(';') if prefs else [], skills.split(',') if skills else [])
+
+
+def opening_from_tuple(values) -> Opening:
+    """Build an Opening from a plain tuple in OPENING_FIELDS order."""
+    (opening_id, company_email, name, specialization, location, stipend,
+     req_skills, required_gpa, priority, deadline, capacity) = values
+    return Opening(opening_id, company_email, name, specialization, location, stipend,
+                   req_skills.split(',') if req_skills else [], required_gpa, priority,
+                   deadline or None, capacity)
+
+
+def match_all_students(students: Iterable[Student],
+                       openings: Iterable[Opening],
+                       backend: str = "python",
+                       skill_tiebreak: bool = False) -> Dict[str, List[Opening]]:
+    """
+    Batch version of match_openings_for_student: returns {student email:
+    ordered openings} with exactly the same order the per-student function
+    gives each student.
+
+    backend="numpy" computes the same result over NumPy arrays (see
+    models/vectorized.py), which pays off for large populations.
+
+    Openings are grouped by specialization and each group is sorted by
+    stipend once, up front. Python's sort is stable, so every per-student
+    subset taken from a pre-sorted group is already in the order that
+    sorting the subset would produce; a student then only costs one
+    eligibility pass over their own specialization. Students with an
+    identical (specialization, GPA, preferred locations) profile share the
+    computation.
+
+    skill_tiebreak=True orders equal stipends by skill overlap, as in
+    match_openings_for_student. Skills are interned into one SkillIndex
+    for the whole batch, so each comparison is an AND plus a popcount.
+    """
+    if backend == "numpy":
+        try:
+            from .vectorized import match_all_students_numpy
+        except ImportError as e:
+            raise ImportError("The 'numpy' matching backend requires NumPy "
+                              "(pip install numpy).") from e
+        return match_all_students_numpy(students, openings, skill_tiebreak)
+    if backend != "python":
+        raise ValueError(f"Unknown matching backend: {backend!r}")
+
+    # specialization -> (gpa-priority openings, location-priority openings),
+    # each sorted by stipend descending
+    groups: Dict[str, tuple] = {}
+    for o in sorted(openings, key=lambda o: -o.stipend):
+        gpa_pref, loc_pref = groups.setdefault(o.specialization, ([], []))
+        (gpa_pref if o.priority == 'gpa' else loc_pref).append(o)
+
+    index = SkillIndex()
+    masks: Dict[int, int] = {}  # id(opening) -> required-skills bitset
+    if skill_tiebreak:
+        for gpa_pref, loc_pref in groups.values():
+            for o in gpa_pref + loc_pref:
+                masks[id(o)] = index.mask(o.required_skills)
+
+    results: Dict[str, List[Opening]] = {}
+    seen: Dict[tuple, List[Opening]] = {}
+    for student in students:
+        wanted = index.mask(student.skills) if skill_tiebreak else 0
+        key = (student.specialization, student.gpa, tuple(student.preferred_locations), wanted)
+        ordered = seen.get(key)
+        if ordered is None:
+            gpa_pref, loc_pref = groups.get(student.specialization, ((), ()))
+            ordered = [o for o in gpa_pref if student.gpa >= o.required_gpa]
+
+            buckets = {loc: [] for loc in student.preferred_locations}
+            others = []
+            for o in loc_pref:
+                if student.gpa >= o.required_gpa:
+                    buckets.get(o.location, others).append(o)
+            if skill_tiebreak:
+                # each list is already in stipend order; this only
+                # reorders runs of equal stipend (stable, near-linear)
+                tie = lambda o: (-o.stipend, -(masks[id(o)] & wanted).bit_count())
+                for part in (ordered, others, *buckets.values()):
+                    part.sort(key=tie)
+            for loc in student.preferred_locations:
+                ordered.extend(buckets[loc])
+            ordered.extend(others)
+            seen[key] = ordered
+        results[student.email] = list(ordered)
+    return results
+
+
 class MatchingSystem:
     """
     Encapsulates retrieval of students and openings from the database
     and applies the matching algorithm.
     """
 
-    def __init__(self, db_path: str = "ams.db"):
+    def __init__(self, db_path: str = "ams.db", backend: str = "python",
+                 skill_tiebreak: bool = False, cache: Optional[MatchCache] = None):
         self.db = DBManager(db_path)
+        self.backend = backend  # batch matching backend: "python" or "numpy"
+        self.skill_tiebreak = skill_tiebreak  # order equal stipends by skill overlap
+        self.cache = cache  # optional MatchCache for per-student lookups
 
-    def get_matches_for_student_email(self, email: str) -> List[Opening]:
+    def get_matches_for_student_email(self, email: str, limit: Optional[int] = None,
+                                      offset: int = 0) -> List[Opening]:
         """
         Given a student's email, load their profile and return a list of
-        Opening objects ordered by matching priority.
+        Opening objects ordered by matching priority. With `limit`, only
+        that page of matches (starting at `offset`) is ordered and returned.
+
+        With a cache, the result is keyed on the student's matching profile
+        and the openings version, so a profile or opening edit is never
+        served from an older entry.
         """
         # Load student row
         stu_row = self.db.get_student_by_email(email)
@@ -64,34 +269,48 @@ class MatchingSystem:
             return []
 
         # Build Student domain object
-        prefs = stu_row['preferred_locations'].split(';') if stu_row['preferred_locations'] else []
-        skills = stu_row['skills'].split(',') if stu_row['skills'] else []
-        student = Student(
-            student_id=stu_row['student_id'],
-            name=stu_row['name'],
-            email=stu_row['email'],
-            gpa=stu_row['gpa'],
-            specialization=stu_row['specialization'],
-            preferred_locations=prefs,
-            skills=skills
-        )
-
-        # Fetch openings and build Opening objects
+        student = student_from_row(stu_row)
+        if self.cache is None:
+            return self._match_student(student, limit, offset)
+        key = (self.db.db_path, self.db.get_openings_version(),
+               profile_key(student, self.skill_tiebreak), self.skill_tiebreak, limit, offset)
+        return self.cache.get_or_compute(key, lambda: self._match_student(student, limit, offset))
+
+    def _match_student(self, student: Student, limit: Optional[int], offset: int) -> List[Opening]:
+        prefs = student.preferred_locations
+        if len(set(prefs)) == len(prefs) and not self.skill_tiebreak:
+            # SQLite filters on GPA and orders by priority/stipend, so only
+            # eligible rows are fetched and turned into Opening objects
+            rows = self.db.iter_matching_openings(
+                student.specialization, student.gpa, prefs, limit=limit, offset=offset)
+            return [opening_from_row(r) for r in rows]
+
+        # A location listed twice is matched twice by the pure function;
+        # keep that exact behaviour for these rare profiles. Skill
+        # tie-breaks are also computed here rather than in SQL.
         raw = self.db.get_openings_by_specialization(student.specialization)
-        openings: List[Opening] = []
-        for o in raw:
-            req_skills = o['required_skills'].split(',') if o['required_skills'] else []
-            openings.append(Opening(
-                opening_id=o['opening_id'],
-                company_email=o['company_email'],
-                name=o['opening_name'],
-                specialization=o['specialization'],
-                location=o['location'],
-                stipend=o['stipend'],
-                required_skills=req_skills
-            ))
-
-        # Delegate to the pure function
-        return match_openings_for_student(student, openings)
+        openings = [opening_from_row(o) for o in raw]
+        if limit is not None:
+            return top_matches_for_student(student, openings, limit, offset,
+                                           self.skill_tiebreak)
+        return match_openings_for_student(student, openings, self.skill_tiebreak)
 
+    def get_all_matches(self, workers: Optional[int] = None) -> Dict[str, List[Opening]]:
+        """
+        Match every student in the database in one pass: openings and
+        students are each read once, then handed to match_all_students.
+        With `workers`, each specialization is matched in its own worker
+        process instead (see models/parallel.py).
+        """
+        if workers is not None:
+            from .parallel import match_all_parallel
+            ids, _ = match_all_parallel(self.db.db_path, workers, self.backend,
+                                        self.skill_tiebreak)
+            by_id = {o.opening_id: o for o in map(opening_from_tuple,
+                                                  self.db.iter_openings(as_tuples=True))}
+            return {email: [by_id[i] for i in ordered] for email, ordered in ids.items()}
 
+        openings = [opening_from_tuple(o) for o in self.db.iter_openings(as_tuples=True)]
+        students = (student_from_tuple(s) for s in self.db.iter_students(as_tuples=True))
+        return match_all_students(students, openings, backend=self.backend,
+                                  skill_tiebreak=self.skill_tiebreak)
@@ -1,9 +1,29 @@
 # models/opening.py
 
-from typing import List, Union
+from typing import List, Optional, Union
 from datetime import datetime
 
+
+def parse_deadline(value: Union[str, datetime, None]) -> Optional[datetime]:
+    """
+    A stored deadline as a datetime: ISO text is parsed, a datetime is
+    kept, and None or "" mean no deadline. Raises ValueError for text
+    that is not an ISO date.
+    """
+    if isinstance(value, str):
+        return datetime.fromisoformat(value) if value else None
+    return value
+
+
 class Opening:
+    # Slots instead of a per-instance __dict__: batch matching builds one
+    # Opening per row, so this keeps 100k of them compact and quick to make
+    __slots__ = (
+        "opening_id", "company_email", "name", "specialization", "location",
+        "stipend", "required_skills", "required_gpa", "priority", "capacity",
+        "_deadline", "_has_deadline",
+    )
+
     def __init__(
         self,
         opening_id: int,
@@ -15,7 +35,8 @@ class Opening:
         required_skills: List[str],
         required_gpa: float = 0.0,
         priority: str = 'location',
-        deadline: Union[str, datetime] = None
+        deadline: Union[str, datetime] = None,
+        capacity: int = 1
     ):
         self.opening_id = opening_id
         self.company_email = company_email
@@ -26,16 +47,30 @@ class Opening:
         self.required_skills = required_skills
         self.required_gpa = required_gpa
         self.priority = priority
-        
-        # Parse or store deadline
-        if isinstance(deadline, str):
-            # Expect ISO format string
-            self.deadline = datetime.fromisoformat(deadline)
-        elif isinstance(deadline, datetime):
-            self.deadline = deadline
-        else:
-            # If no deadline provided, default to now
-            self.deadline = datetime.now()
+        self.capacity = capacity  # seats offered in a placement round
+        self.deadline = deadline  # parsed on first read; see `deadline`
+
+    @property
+    def deadline(self) -> datetime:
+        """
+        The deadline as a datetime. An ISO string is parsed the first time
+        it is read and the result kept; with no deadline it defaults to now
+        (as of that first read).
+        """
+        dl = self._deadline
+        if not isinstance(dl, datetime):
+            dl = parse_deadline(dl) or datetime.now()
+            self._deadline = dl
+        return dl
+
+    @deadline.setter
+    def deadline(self, value: Union[str, datetime]):
+        self._deadline = value
+        self._has_deadline = value is not None
+
+    def is_closed(self, now: datetime) -> bool:
+        """True if the opening has a deadline and it is before `now`."""
+        return self._has_deadline and self.deadline < now
 
     def __repr__(self):
         dl = self.deadline.isoformat() if isinstance(self.deadline, datetime) else str(self.deadline)
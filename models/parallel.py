@@ -0,0 +1,143 @@
+# models/parallel.py
+"""
+Match every student using one worker process per specialization.
+
+    python -m models.parallel                  # all cores
+    python -m models.parallel --workers 4 --backend numpy
+    python -m models.parallel --shared         # workers share one column store
+
+Specialization is a hard filter in matching, so each specialization is an
+independent partition: a worker opens its own read-only connection, loads
+only that partition's students and openings, matches them and sends back
+opening ids. Nothing but ids and timings crosses process boundaries.
+
+With shared=True the parent instead loads both tables once into a
+shared-memory ColumnStore (models/columnar.py) and workers attach to it,
+so no worker reads the database or builds Student/Opening objects.
+"""
+
+import argparse
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from database.connection import read_only_path
+from database.db_manager import DBManager
+from .matching import match_all_students, opening_from_row, student_from_row
+
+# How long one partition took inside its worker (load + match)
+PartitionTiming = namedtuple("PartitionTiming",
+                             ["specialization", "students", "openings", "seconds"])
+
+
+def match_partition(db_path: str, specialization: str, backend: str = "python",
+                    skill_tiebreak: bool = False):
+    """
+    Match one specialization; runs in a worker process.
+    Returns ({email: [opening_id, ...]}, PartitionTiming).
+    """
+    start = time.perf_counter()
+    db = DBManager(read_only_path(db_path))
+    students = [student_from_row(r) for r in db.get_students_by_specialization(specialization)]
+    openings = [opening_from_row(r) for r in db.get_openings_by_specialization(specialization)]
+    matches = match_all_students(students, openings, backend=backend,
+                                 skill_tiebreak=skill_tiebreak)
+    ids = {email: [o.opening_id for o in ordered] for email, ordered in matches.items()}
+    timing = PartitionTiming(specialization, len(students), len(openings),
+                             time.perf_counter() - start)
+    return ids, timing
+
+
+def match_shared_partition(handle, specialization: str, skill_tiebreak: bool = False):
+    """match_partition() over an attached ColumnStore; runs in a worker process."""
+    from .columnar import ColumnStore
+
+    start = time.perf_counter()
+    store = ColumnStore.attach(handle)
+    try:
+        ids = store.match(specialization, skill_tiebreak)
+        n_openings = len(store.rows('openings', specialization))
+    finally:
+        store.close()
+    timing = PartitionTiming(specialization, len(ids), n_openings,
+                             time.perf_counter() - start)
+    return ids, timing
+
+
+def match_all_parallel(db_path: str = "ams.db", workers: Optional[int] = None,
+                       backend: str = "python", skill_tiebreak: bool = False,
+                       shared: bool = False
+                       ) -> Tuple[Dict[str, List[int]], List[PartitionTiming]]:
+    """
+    Match every student, one specialization per task, on up to `workers`
+    processes (default: CPU count). Returns ({email: [opening_id, ...]},
+    per-partition timings); the ids are in the order match_all_students
+    would give.
+
+    shared=True matches from a shared-memory ColumnStore with the NumPy
+    ranking (`backend` is then ignored); requires NumPy.
+    """
+    # Make sure the schema is current before read-only workers open it,
+    # and hand out the biggest partitions first so no worker finishes last
+    # with a large one still queued
+    db = DBManager(db_path)
+    sizes = db.conn.execute(
+        "SELECT specialization, COUNT(*) FROM students GROUP BY specialization").fetchall()
+    partitions = [spec for spec, _ in sorted(sizes, key=lambda r: -r[1])]
+
+    results: Dict[str, List[int]] = {}
+    timings: List[PartitionTiming] = []
+    if not partitions:
+        return results, timings
+    workers = min(workers or os.cpu_count() or 1, len(partitions))
+    store = None
+    if shared:
+        from .columnar import ColumnStore
+        store = ColumnStore.load(db)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            if store is not None:
+                futures = [pool.submit(match_shared_partition, store.handle, spec,
+                                       skill_tiebreak) for spec in partitions]
+            else:
+                futures = [pool.submit(match_partition, db_path, spec, backend,
+                                       skill_tiebreak) for spec in partitions]
+            for future in futures:
+                ids, timing = future.result()
+                results.update(ids)
+                timings.append(timing)
+    finally:
+        if store is not None:
+            store.close()
+    return results, timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Match all students in parallel.")
+    parser.add_argument("--db", default="ams.db", help="database file (default: ams.db)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--backend", choices=["python", "numpy"], default="python")
+    parser.add_argument("--skill-tiebreak", action="store_true",
+                        help="order equal stipends by skill overlap")
+    parser.add_argument("--shared", action="store_true",
+                        help="load the data once into shared memory for all workers")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results, timings = match_all_parallel(args.db, args.workers, args.backend,
+                                          args.skill_tiebreak, args.shared)
+    wall = time.perf_counter() - start
+
+    print(f"{'specialization':<28}{'students':>10}{'openings':>10}{'seconds':>10}")
+    for t in timings:
+        print(f"{t.specialization:<28}{t.students:>10}{t.openings:>10}{t.seconds:>10.2f}")
+    busy = sum(t.seconds for t in timings)
+    print(f"{len(results)} students matched in {wall:.2f}s wall "
+          f"({busy:.2f}s of partition work)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# models/ranking.py
+"""
+Ranking of a company's applicants, as ApplicantsWindow shows them.
+
+An opening only lists applicants whose GPA meets its required GPA and who
+have its location among their preferred locations. Location-priority
+openings list them by where that location sits in their preferences,
+then by GPA (highest first); GPA-priority openings by GPA alone. Ties go
+to the lower email so pages are stable.
+
+Filtering and ordering happen in one indexed query (see
+DBManager.get_ranked_applicants), so only the rows shown are fetched.
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from database.db_manager import DBManager
+
+
+def applicant_key(row) -> tuple:
+    """Keyset position of a ranked applicant row: pass it as `after`."""
+    return (row['sort_rank'], -row['gpa'], row['email'])
+
+
+class ApplicantRanking:
+    """Ranked, paged access to the applicants of companies' openings."""
+
+    def __init__(self, db_path: str = "ams.db"):
+        self.db = DBManager(db_path)
+
+    def page(self, opening_id: int, limit: int = 50,
+             after: Optional[tuple] = None) -> Tuple[list, Optional[tuple]]:
+        """
+        Return (rows, next key): up to `limit` applicants following the
+        key `after` (None = from the top). The next key is None once the
+        last applicant has been returned.
+        """
+        rows = self.db.get_ranked_applicants(opening_id, after=after, limit=limit + 1)
+        if len(rows) > limit:
+            rows = rows[:limit]
+            return rows, applicant_key(rows[-1])
+        return rows, None
+
+    def iter_ranked(self, opening_id: int, page_size: int = 200) -> Iterator:
+        """Yield every eligible applicant of an opening, best first."""
+        after = None
+        while True:
+            rows, after = self.page(opening_id, page_size, after)
+            yield from rows
+            if after is None:
+                return
+
+    def rank_company(self, company_email: str) -> Dict[int, List]:
+        """
+        Rank the applicants of all of a company's openings in one query.
+        Returns {opening_id: ranked rows}; openings without eligible
+        applicants are left out.
+        """
+        ranked: Dict[int, List] = {}
+        for row in self.db.get_ranked_applicants_by_company(company_email):
+            ranked.setdefault(row['opening_id'], []).append(row)
+        return ranked
@@ -0,0 +1,91 @@
+# models/skills.py
+"""
+Skill sets as integer bitsets.
+
+Skill names are interned to bit positions once, so a student's or an
+opening's skills become a single Python int and the overlap of two sets is
+`(a & b).bit_count()`: one AND and one popcount instead of intersecting
+lists of strings. overlap_matrix() does the same for every student x
+opening pair at once over packed NumPy words.
+"""
+
+from typing import Dict, Iterable, List
+
+
+class SkillIndex:
+    """
+    Interns skill names to bit positions. Names are compared trimmed and
+    case-insensitively, like the `skills` table (schema v4).
+    """
+
+    def __init__(self):
+        self._bits: Dict[str, int] = {}
+
+    def __len__(self):
+        return len(self._bits)
+
+    def bit(self, name: str) -> int:
+        """Return the bit position for `name`, assigning the next free one if new."""
+        key = name.strip().lower()
+        bit = self._bits.get(key)
+        if bit is None:
+            bit = self._bits[key] = len(self._bits)
+        return bit
+
+    def mask(self, skills: Iterable[str]) -> int:
+        """Return the bitset of `skills`; blank names are ignored."""
+        mask = 0
+        for name in skills:
+            if name.strip():
+                mask |= 1 << self.bit(name)
+        return mask
+
+    def names(self) -> List[str]:
+        """Interned names (trimmed, lower-cased), in bit order."""
+        return sorted(self._bits, key=self._bits.get)
+
+
+def overlap(a: int, b: int) -> int:
+    """Number of skills two bitsets have in common."""
+    return (a & b).bit_count()
+
+
+def pack(masks: List[int], n_bits: int):
+    """Pack int bitsets into a (len(masks), words) uint64 array."""
+    import numpy as np
+
+    words = max(1, (n_bits + 63) // 64)
+    out = np.zeros((len(masks), words), dtype=np.uint64)
+    for w in range(words):
+        shift = 64 * w
+        out[:, w] = [(m >> shift) & 0xFFFFFFFFFFFFFFFF for m in masks]
+    return out
+
+
+def overlap_matrix(student_masks: List[int], opening_masks: List[int], n_bits: int):
+    """
+    Return an int array `m` with m[i, j] = overlap(student_masks[i],
+    opening_masks[j]), computed with vectorized AND + popcount. Requires NumPy.
+    """
+    return overlap_packed(pack(student_masks, n_bits), pack(opening_masks, n_bits))
+
+
+def overlap_packed(a, b):
+    """overlap_matrix() for bitsets that are already packed (see pack())."""
+    import numpy as np
+
+    counts = np.zeros((len(a), len(b)), dtype=np.int32)
+    for w in range(a.shape[1]):
+        both = a[:, w, None] & b[None, :, w]
+        counts += popcount(both)
+    return counts
+
+
+def popcount(words):
+    """Per-element count of set bits in a uint64 array."""
+    import numpy as np
+
+    if hasattr(np, "bitwise_count"):  # NumPy 2.0+
+        return np.bitwise_count(words)
+    as_bytes = words.view(np.uint8).reshape(words.shape + (8,))
+    return np.unpackbits(as_bytes, axis=-1).sum(axis=-1)
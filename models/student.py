@@ -3,6 +3,10 @@
 from typing import List
 
 class Student:
+    # Slotted like Opening: no per-instance __dict__
+    __slots__ = ("student_id", "name", "email", "gpa", "specialization",
+                 "preferred_locations", "skills")
+
     def __init__(self,
                  student_id: str,
                  name: str,
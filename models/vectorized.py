@@ -0,0 +1,252 @@
+# models/vectorized.py
+"""
+NumPy backends for batch matching and allocation. Selected with
+match_all_students(..., backend="numpy") and allocate(..., backend="numpy");
+NumPy is only needed when these backends are used.
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+from .opening import Opening
+from .skills import SkillIndex, overlap_packed, pack, popcount
+
+# Upper bound on students x openings cells materialized at once
+CHUNK_CELLS = 4_000_000
+
+
+def match_all_students_numpy(students, openings,
+                             skill_tiebreak: bool = False) -> Dict[str, List[Opening]]:
+    """
+    Same contract and result as matching.match_all_students, computed a
+    specialization at a time over integer-coded arrays:
+
+      - each specialization's openings are stably sorted by stipend, so an
+        opening's column index is its stipend rank;
+      - for a block of students, location preference rank and the GPA
+        eligibility mask are computed by broadcasting;
+      - a single sort key (priority group * n + stipend rank) per cell is
+        argsorted row-wise, which orders every student's openings at once.
+
+    With skill_tiebreak, the key also carries each cell's skill overlap
+    (from skills.overlap_packed) between the stipend and the position, so
+    equal stipends are ordered by overlap.
+    """
+    students = list(students)
+    openings = list(openings)
+
+    by_spec: Dict[str, list] = {}
+    for o in openings:
+        by_spec.setdefault(o.specialization, []).append(o)
+
+    results: Dict[str, List[Opening]] = {}
+    students_by_spec: Dict[str, list] = {}
+    for s in students:
+        students_by_spec.setdefault(s.specialization, []).append(s)
+        results[s.email] = []
+
+    for spec, spec_students in students_by_spec.items():
+        spec_openings = by_spec.get(spec)
+        if not spec_openings:
+            continue
+        _match_specialization(spec_students, spec_openings, results, skill_tiebreak)
+    return results
+
+
+def _match_specialization(students, openings, results, skill_tiebreak=False):
+    stipend = np.array([o.stipend for o in openings], dtype=np.float64)
+    order = np.argsort(-stipend, kind="stable")
+    openings = [openings[i] for i in order]
+    # object array so each student's result is one fancy-index + tolist()
+    opening_objs = np.empty(len(openings), dtype=object)
+    opening_objs[:] = openings
+
+    # -1 pads short preference lists, -2 marks cities with no openings
+    loc_codes: Dict[str, int] = {}
+    loc = np.array([loc_codes.setdefault(o.location, len(loc_codes)) for o in openings],
+                   dtype=np.int32)
+    n_prefs = max(len(s.preferred_locations) for s in students)
+    prefs = np.full((len(students), max(n_prefs, 1)), -1, dtype=np.int32)
+    for row, s in enumerate(students):
+        prefs[row, :len(s.preferred_locations)] = [
+            loc_codes.get(city, -2) for city in s.preferred_locations]
+
+    student_bits = opening_bits = None
+    if skill_tiebreak:
+        index = SkillIndex()
+        opening_masks = [index.mask(o.required_skills) for o in openings]
+        student_masks = [index.mask(s.skills) for s in students]
+        student_bits = pack(student_masks, len(index))
+        opening_bits = pack(opening_masks, len(index))
+
+    ranked = rank_openings(
+        np.array([s.gpa for s in students], dtype=np.float64), prefs, loc,
+        np.array([o.required_gpa for o in openings], dtype=np.float64),
+        np.array([o.priority == 'gpa' for o in openings], dtype=bool),
+        np.array([o.priority == 'location' for o in openings], dtype=bool),
+        stipend[order], student_bits, opening_bits)
+    for row, columns in ranked:
+        results[students[row].email] = opening_objs[columns].tolist()
+
+
+def rank_openings(gpa, prefs, loc, req_gpa, gpa_priority, loc_priority, stipend,
+                  student_bits=None, opening_bits=None):
+    """
+    Order one specialization's openings for each of its students, given as
+    arrays; yields (student row, opening columns in match order).
+
+    Openings must already be stably sorted by stipend descending. `prefs`
+    holds each student's preferred location codes, padded with negative
+    codes that no opening uses. With packed skill bitsets (skills.pack) for
+    both sides, equal stipends are ordered by skill overlap.
+    """
+    n = len(stipend)
+    n_prefs = prefs.shape[1]
+    stipend_rank = np.arange(n, dtype=np.int64)
+    # openings that are neither GPA- nor location-priority are never matched
+    unmatched = ~(gpa_priority | loc_priority)
+    ineligible = (n_prefs + 2) * n
+
+    skill_tiebreak = student_bits is not None
+    if skill_tiebreak:
+        # Dense rank of each distinct stipend: openings sharing one tie
+        stipend_tie = np.unique(-stipend, return_inverse=True)[1].astype(np.int64)
+        n_ties = int(stipend_tie.max()) + 1 if n else 1
+
+    # A location listed twice repeats its openings, as in the list version
+    ordered_prefs = np.sort(prefs, axis=1)
+    repeats = ((ordered_prefs[:, 1:] == ordered_prefs[:, :-1])
+               & (ordered_prefs[:, 1:] >= 0)).any(axis=1)
+
+    block = max(1, CHUNK_CELLS // max(n, 1))
+    for start in range(0, len(gpa), block):
+        chunk = slice(start, start + block)
+        chunk_prefs = prefs[chunk]
+
+        # 0 = GPA-priority opening, 1 + k = k-th preferred city, 1 + n_prefs = other
+        group = np.full((len(chunk_prefs), n), n_prefs + 1, dtype=np.int64)
+        for k in range(n_prefs - 1, -1, -1):
+            group[chunk_prefs[:, k, None] == loc[None, :]] = k + 1
+        group[:, gpa_priority] = 0
+
+        eligible = (gpa[chunk, None] >= req_gpa[None, :]) & ~unmatched[None, :]
+        if skill_tiebreak:
+            bits = student_bits[chunk]
+            shared = overlap_packed(bits, opening_bits)
+            most = int(popcount(bits).sum(axis=1).max())
+            key = ((group * n_ties + stipend_tie) * (most + 1) + (most - shared)) * n + stipend_rank
+            key[~eligible] = np.iinfo(np.int64).max
+        else:
+            key = group * n + stipend_rank
+            key[~eligible] = ineligible
+
+        ranked = np.argsort(key, axis=1, kind="stable")
+        counts = eligible.sum(axis=1)
+        for row in range(len(chunk_prefs)):
+            columns = ranked[row, :counts[row]]
+            if repeats[start + row]:
+                columns = _repeat_locations(columns, group[row, columns], chunk_prefs[row])
+            yield start + row, columns
+
+
+def _repeat_locations(columns, groups, prefs):
+    """Emit a preferred city's openings again wherever the city is listed again."""
+    bounds = np.searchsorted(groups, np.arange(len(prefs) + 3))
+    part = lambda g: columns[bounds[g]:bounds[g + 1]]
+    first = {}
+    pieces = [part(0)]
+    for k, code in enumerate(prefs.tolist()):
+        pieces.append(part(first.setdefault(code, k) + 1))
+    pieces.append(part(len(prefs) + 1))
+    return np.concatenate(pieces)
+
+
+def deferred_acceptance_numpy(capacity: Dict[int, int], segments: list) -> Dict[int, list]:
+    """
+    NumPy backend for allocation._deferred_acceptance, same inputs and result.
+
+    Every student's choices are laid out in one flat array (CSR style:
+    student i owns flat[start[i]:end[i]]). Proposals then run in rounds:
+    each free student skips past openings whose weakest held seat already
+    beats them, proposes to the next one, and every opening keeps its best
+    `capacity` of holders plus proposers in one lexsort.
+    """
+    # Openings become columns 0..m-1, found from their ids by binary search
+    opening_ids = sorted(capacity)
+    ids = np.array(opening_ids, dtype=np.int64)
+    cap = np.array([capacity[o] for o in opening_ids], dtype=np.int64)
+
+    # Segment lists are shared between students; convert each once
+    arrays: Dict[int, np.ndarray] = {}
+    pieces, scores, lengths, totals = [], [], [], []
+    for segs in segments:
+        total = 0
+        for choices, score in segs:
+            arr = arrays.get(id(choices))
+            if arr is None:
+                arr = arrays[id(choices)] = np.searchsorted(
+                    ids, np.array(choices, dtype=np.int64)).astype(np.int32)
+            pieces.append(arr)
+            scores.append(score)
+            lengths.append(len(arr))
+            total += len(arr)
+        totals.append(total)
+    flat = np.concatenate(pieces) if pieces else np.zeros(0, dtype=np.int32)
+    flat_score = np.repeat(np.array(scores, dtype=np.int64), lengths)
+    end = np.cumsum(np.array(totals, dtype=np.int64))
+    ptr = end - totals
+
+    # One sort key per candidate: by opening, then best score first
+    top = int(flat_score.max()) if flat_score.size else 0
+    span = top + 2
+
+    floor = np.full(len(opening_ids), -1, dtype=np.int64)
+    held_s = np.zeros(0, dtype=np.int64)
+    held_o = np.zeros(0, dtype=np.int32)
+    held_sc = np.zeros(0, dtype=np.int64)
+    free = np.arange(len(segments), dtype=np.int64)
+    while True:
+        # Skip choices that would be refused outright (floors are fixed
+        # until the merge below, so this cannot change the outcome)
+        free = free[ptr[free] < end[free]]
+        check = free
+        while check.size:
+            idx = ptr[check]
+            check = check[flat_score[idx] <= floor[flat[idx]]]
+            ptr[check] += 1
+            check = check[ptr[check] < end[check]]
+        free = free[ptr[free] < end[free]]
+        if not free.size:
+            break
+
+        idx = ptr[free]
+        ptr[free] += 1
+        # Only openings proposed to this round need their holders re-ranked
+        touched = np.zeros(len(opening_ids), dtype=bool)
+        touched[flat[idx]] = True
+        moved = touched[held_o]
+        settled = (held_s[~moved], held_o[~moved], held_sc[~moved])
+        cand_s = np.concatenate([held_s[moved], free])
+        cand_o = np.concatenate([held_o[moved], flat[idx]])
+        cand_sc = np.concatenate([held_sc[moved], flat_score[idx]])
+        order = np.argsort(cand_o * span + (top - cand_sc))
+        cand_s, cand_o, cand_sc = cand_s[order], cand_o[order], cand_sc[order]
+
+        # Position of each candidate within its opening, best first
+        first = np.flatnonzero(np.r_[True, cand_o[1:] != cand_o[:-1]])
+        rank = np.arange(len(cand_o)) - np.repeat(first, np.diff(np.r_[first, len(cand_o)]))
+        seats = cap[cand_o]
+        keep = rank < seats
+        last = rank == seats - 1
+        floor[cand_o[last]] = cand_sc[last]
+
+        held_s = np.concatenate([settled[0], cand_s[keep]])
+        held_o = np.concatenate([settled[1], cand_o[keep]])
+        held_sc = np.concatenate([settled[2], cand_sc[keep]])
+        free = cand_s[~keep]
+
+    result: Dict[int, list] = {opening_id: [] for opening_id in opening_ids}
+    for i, c in zip(held_s.tolist(), held_o.tolist()):
+        result[opening_ids[c]].append(i)
+    return result
@@ -0,0 +1,140 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import random
+import tempfile
+import unittest
+from database import connection
+from database.db_manager import DBManager
+from models.allocation import allocate, default_backend, run_round
+from models.matching import match_openings_for_student
+from test_matching import random_openings, random_students
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def opening_prefers(opening, a, b):
+    """True if `opening` ranks student a above student b (applicant rules)."""
+    def key(s):
+        rank = s.preferred_locations.index(opening.location) if opening.priority == 'location' else 0
+        return (rank, -s.gpa, s.email)
+    return key(a) < key(b)
+
+
+def acceptable(opening, student):
+    return (opening.specialization == student.specialization
+            and student.gpa >= opening.required_gpa
+            and opening.location in student.preferred_locations)
+
+
+# Test cases for the deferred-acceptance allocation engine
+class TestAllocation(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(3)
+        self.openings = random_openings(rng, 80)
+        for o in self.openings:
+            o.capacity = rng.randint(1, 3)
+        self.students = random_students(rng, 300)
+        self.students[0].preferred_locations = ["Riyadh", "Riyadh", "Abha"]
+
+    # Seats are never oversold and every placement is one both sides accept
+    def test_capacity_and_acceptability(self):
+        result = allocate(self.students, self.openings)
+        by_id = {o.opening_id: o for o in self.openings}
+        counts = {}
+        for s in self.students:
+            oid = result[s.email]
+            if oid is not None:
+                self.assertTrue(acceptable(by_id[oid], s))
+                counts[oid] = counts.get(oid, 0) + 1
+        for oid, n in counts.items():
+            self.assertLessEqual(n, by_id[oid].capacity)
+        self.assertGreater(len(counts), 0)
+
+    # No student and opening would both rather be matched to each other
+    def test_no_blocking_pairs(self):
+        result = allocate(self.students, self.openings)
+        by_id = {o.opening_id: o for o in self.openings}
+        holders = {}
+        for s in self.students:
+            holders.setdefault(result[s.email], []).append(s)
+        for s in self.students:
+            ranked = [o for o in match_openings_for_student(s, self.openings) if acceptable(o, s)]
+            mine = by_id.get(result[s.email])
+            better = ranked[:ranked.index(mine)] if mine else ranked
+            for o in better:
+                seats = holders.get(o.opening_id, [])
+                full = len(seats) >= o.capacity
+                self.assertTrue(full and not any(opening_prefers(o, s, h) for h in seats),
+                                f"{s.email} and opening {o.opening_id} block")
+
+    # Input order does not change the outcome
+    def test_order_independent(self):
+        shuffled = list(self.students)
+        random.Random(1).shuffle(shuffled)
+        self.assertEqual(allocate(shuffled, self.openings), allocate(self.students, self.openings))
+
+    # The NumPy backend finds the same (unique student-optimal) assignment
+    @unittest.skipUnless(numpy, "NumPy not installed")
+    def test_numpy_backend_parity(self):
+        for max_choices in (None, 2):
+            self.assertEqual(allocate(self.students, self.openings, max_choices, backend="numpy"),
+                             allocate(self.students, self.openings, max_choices))
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            allocate(self.students, self.openings, backend="gpu")
+
+    # A capped preference list only ever makes the student worse off
+    def test_max_choices(self):
+        result = allocate(self.students, self.openings, max_choices=1)
+        for s in self.students:
+            if result[s.email] is not None:
+                ranked = [o for o in match_openings_for_student(s, self.openings)
+                          if acceptable(o, s)]
+                self.assertEqual(result[s.email], ranked[0].opening_id)
+
+
+# Test cases for running and storing a placement round
+class TestAllocationRound(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = DBManager(os.path.join(self.tmp.name, "ams.db"))
+        opening = {"company_email": "c@co.com", "opening_name": "Dev", "location": "Riyadh",
+                   "specialization": "Software Engineering", "stipend": 1000, "capacity": 2}
+        self.db.insert_opening(opening)
+        for n, gpa in enumerate([3.0, 4.0, 3.5]):
+            self.db.insert_student({
+                "student_id": f"S{n}", "name": f"S{n}", "mobile_number": "+966501234567",
+                "email": f"s{n}@uni.edu", "gpa": gpa, "specialization": "Software Engineering",
+                "preferred_locations": "Riyadh", "skills": "",
+            })
+
+    def tearDown(self):
+        connection.close_all()
+        self.tmp.cleanup()
+
+    # The two best GPAs get the two seats and the round is saved
+    def test_run_round(self):
+        round_id, assignments, _ = run_round(self.db)
+        self.assertEqual(assignments, {"s0@uni.edu": None, "s1@uni.edu": 1, "s2@uni.edu": 1})
+        placed = [r["email"] for r in self.db.get_allocated_students(1)]
+        self.assertEqual(placed, ["s1@uni.edu", "s2@uni.edu"])
+        self.assertIsNone(self.db.get_allocation_for_student("s0@uni.edu"))
+        self.assertEqual(self.db.get_allocation_for_student("s1@uni.edu", round_id)["opening_id"], 1)
+
+    # Rounds use NumPy when it is installed and give the same seats without it
+    def test_default_backend(self):
+        self.assertEqual(default_backend(), "numpy" if numpy else "python")
+        _, python, _ = run_round(self.db, save=False, backend="python")
+        _, default, _ = run_round(self.db, save=False)
+        self.assertEqual(default, python)
+
+
+if __name__ == '__main__':
+    unittest.main()
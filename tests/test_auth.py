@@ -0,0 +1,101 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import tempfile
+import threading
+import time
+import unittest
+
+from database import connection
+from database.db_manager import DBManager
+from utils import auth
+from utils.auth import AuthService
+from utils.encryption import hash_cost, hash_password
+
+try:
+    from gui.login_window import _authenticate
+except ImportError:
+    _authenticate = None
+
+
+# Test cases for the calibrated, bounded bcrypt service
+class TestAuthService(unittest.TestCase):
+
+    # The calibrated cost follows the target and stays within the range
+    def test_calibrate(self):
+        self.assertEqual(AuthService(target_seconds=60, min_cost=4, max_cost=6).cost, 6)
+        self.assertEqual(AuthService(target_seconds=1e-6, min_cost=4, max_cost=6).cost, 4)
+
+    # Only hashes outside the policy are replaced, and only on a correct password
+    def test_verify_and_rehash(self):
+        service = AuthService(target_seconds=1e-6, min_cost=5, max_cost=6)
+        self.assertEqual(hash_cost(service.hash("Secret123")), 5)
+        self.assertEqual(service.verify("Secret123", hash_password("Secret123", 5)), (True, None))
+        self.assertEqual(service.verify("Wrong123", hash_password("Secret123", 4)), (False, None))
+        for old_cost in (4, 7):
+            ok, new_hash = service.verify("Secret123", hash_password("Secret123", old_cost))
+            self.assertTrue(ok)
+            self.assertEqual(hash_cost(new_hash), 5)
+        stats = service.stats()
+        self.assertEqual((stats["hash"]["count"], stats["verify"]["count"]), (3, 4))
+        self.assertEqual(stats["rehashed"], 2)
+        self.assertGreater(stats["verify"]["max_ms"], 0)
+
+    # No more than max_workers hashes run at the same time
+    def test_bounded(self):
+        service = AuthService(target_seconds=1e-6, min_cost=4, max_cost=4, max_workers=1)
+        service.calibrate()
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def slow_hash(password, cost):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return hash_password(password, cost)
+
+        original = auth.hash_password
+        auth.hash_password = slow_hash
+        try:
+            threads = [threading.Thread(target=service.hash, args=("Secret123",)) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            auth.hash_password = original
+        self.assertEqual(peak[0], 1)
+        self.assertGreater(service.stats()["hash"]["wait_ms"], 0)
+
+
+# Test cases for rehashing on login
+@unittest.skipUnless(_authenticate, "PyQt6 not installed")
+class TestRehashOnLogin(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = DBManager(os.path.join(self.tmp.name, "ams.db"))
+        self.db.insert_user({"email": "s@uni.edu", "role": "student",
+                             "hashed_password": hash_password("Secret123", 4)})
+        self.saved, auth._service = auth._service, AuthService(1e-6, min_cost=5, max_cost=6)
+
+    def tearDown(self):
+        auth._service = self.saved
+        connection.close_all()
+        self.tmp.cleanup()
+
+    # A successful login upgrades the stored hash; a failed one leaves it
+    def test_login_rehashes(self):
+        _authenticate(self.db.db_path, "s@uni.edu", "Wrong123", "student")
+        self.assertEqual(hash_cost(self.db.get_user("s@uni.edu")["hashed_password"]), 4)
+        user, _, error = _authenticate(self.db.db_path, "s@uni.edu", "Secret123", "student")
+        self.assertIsNone(error)
+        stored = self.db.get_user("s@uni.edu")["hashed_password"]
+        self.assertEqual(hash_cost(stored), 5)
+        self.assertEqual(auth._service.verify("Secret123", stored), (True, None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import sqlite3
+import tempfile
+import unittest
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from database import connection
+from database.db_manager import DBManager
+
+try:
+    from PyQt6.QtCore import QCoreApplication, QEvent
+    from PyQt6.QtWidgets import QApplication
+    from gui.applicants_window import ApplicantsWindow
+    from gui.changes import ChangeNotifier, _notifiers, change_notifier
+except ImportError:
+    QApplication = None
+
+
+# Test cases for the live change notifier
+@unittest.skipUnless(QApplication, "PyQt6 not installed")
+class TestChangeNotifier(unittest.TestCase):
+
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication([])
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = DBManager(os.path.join(self.tmp.name, "ams.db"))
+        self.opening_id = self.add_opening()
+        self.notifier = ChangeNotifier(self.db.db_path, interval=60000, max_batch=3)
+        self.changes, self.resets = [], 0
+        self.notifier.rows_changed.connect(lambda name, keys: self.changes.append((name, keys)))
+        self.notifier.reset.connect(self.on_reset)
+        # stands in for another process writing to the same file
+        self.other = sqlite3.connect(self.db.db_path, isolation_level=None)
+
+    def tearDown(self):
+        self.notifier.timer.stop()
+        self.other.close()
+        connection.close_all()
+        self.tmp.cleanup()
+
+    def on_reset(self):
+        self.resets += 1
+
+    def add_opening(self, name="Dev"):
+        self.db.insert_opening({"company_email": "hr@co.com", "opening_name": name,
+                                "specialization": "SE", "location": "Riyadh", "stipend": 100})
+        return self.db.conn.execute("SELECT MAX(opening_id) FROM openings").fetchone()[0]
+
+    # Another connection's commit is seen, keyed by the rows it touched
+    def test_external_write(self):
+        self.notifier.poll()
+        self.assertEqual(self.changes, [])
+        self.other.execute("UPDATE openings SET stipend = 200 WHERE opening_id = ?",
+                           (self.opening_id,))
+        self.notifier.poll()
+        self.assertEqual(self.changes, [("openings", {self.opening_id})])
+        self.notifier.poll()
+        self.assertEqual(len(self.changes), 1)
+
+    # This process's own writes and application keys
+    def test_own_write(self):
+        self.db.apply_to_opening("s@uni.edu", self.opening_id)
+        self.notifier.poll()
+        self.assertEqual(self.changes, [("applications", {("s@uni.edu", self.opening_id)})])
+
+    # Writes to unwatched tables never read the change log
+    def test_unwatched_table(self):
+        reads = []
+        get_changes = self.notifier.db.get_changes
+        self.notifier.db.get_changes = lambda *args: reads.append(args) or get_changes(*args)
+        self.db.log_access("s@uni.edu")
+        self.notifier.poll()
+        self.assertEqual(reads, [])
+        self.assertEqual(self.changes, [])
+
+    # More than max_batch changes at once ask views to reload instead
+    def test_reset_on_large_batch(self):
+        for i in range(4):
+            self.add_opening(f"Dev {i}")
+        self.notifier.poll()
+        self.assertEqual((self.changes, self.resets), ([], 1))
+        self.add_opening("One more")
+        self.notifier.poll()
+        self.assertEqual(len(self.changes), 1)
+
+    # The log is pruned once `keep` rows have been read
+    def test_prune(self):
+        self.notifier.keep = 2
+        for i in range(3):
+            self.add_opening(f"Dev {i}")
+        self.notifier.poll()
+        count = self.db.conn.execute("SELECT COUNT(*) FROM change_log").fetchone()[0]
+        self.assertEqual(count, 2)
+        self.add_opening("After prune")
+        self.notifier.poll()
+        self.assertEqual(self.resets, 0)
+        self.assertEqual(len(self.changes), 2)
+
+    # A deleted screen no longer hears from the shared notifier
+    def test_deleted_screen(self):
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)  # windows open ./ams.db
+        try:
+            window = ApplicantsWindow(dict(self.db.get_opening_by_id(self.opening_id)))
+            shared = change_notifier(window.db.db_path)
+            window.close()
+            window.deleteLater()
+            QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+            shared.reset.emit()  # used to reload the deleted model and abort
+            shared.rows_changed.emit("openings", {self.opening_id})
+        finally:
+            _notifiers.pop("ams.db").timer.stop()
+            os.chdir(cwd)
+
+
+if __name__ == '__main__':
+    unittest.main()
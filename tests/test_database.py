@@ -0,0 +1,390 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import sqlite3
+import json
+import tempfile
+import threading
+import types
+import unittest
+from unittest import mock
+from database import connection, db_manager, migrations, writer
+from database.ingest import ingest
+from database.db_manager import DBManager
+from models.applications import ApplicationState
+
+
+# Test cases for the shared connection registry
+class TestConnectionRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "ams.db")
+
+    def tearDown(self):
+        connection.close_all()
+        self.tmp.cleanup()
+
+    # Managers created on the same thread share one connection
+    def test_same_thread_shares_connection(self):
+        a = DBManager(self.db_path)
+        b = DBManager(self.db_path)
+        self.assertIs(a.conn, b.conn)
+
+    # Each thread gets its own connection
+    def test_other_thread_gets_own_connection(self):
+        main_conn = DBManager(self.db_path).conn
+        seen = []
+        t = threading.Thread(target=lambda: seen.append(DBManager(self.db_path).conn))
+        t.start()
+        t.join()
+        self.assertIsNot(main_conn, seen[0])
+
+    # A thread whose ident once belonged to an exited thread gets a connection of its own
+    def test_reused_ident_gets_own_connection(self):
+        seen = []
+        # as if the worker had this (live) thread's ident
+        main_ident = threading.get_ident()
+        reused = types.SimpleNamespace(get_ident=lambda: main_ident,
+                                       enumerate=threading.enumerate)
+        with mock.patch.object(connection, "threading", reused):
+            t = threading.Thread(target=lambda: seen.append(connection.get_connection(self.db_path)))
+            t.start()
+            t.join()
+        conn = connection.get_connection(self.db_path)
+        self.assertIsNot(conn, seen[0])
+        with self.assertRaises(sqlite3.ProgrammingError):
+            seen[0].execute("SELECT 1")  # closed, not leaked
+
+    # The schema initializer only runs once per database per process
+    def test_init_runs_once(self):
+        calls = []
+        connection.get_connection(self.db_path, init=calls.append)
+        connection.get_connection(self.db_path, init=calls.append)
+        t = threading.Thread(
+            target=lambda: connection.get_connection(self.db_path, init=calls.append))
+        t.start()
+        t.join()
+        self.assertEqual(len(calls), 1)
+
+    # Data written through one manager is visible through another
+    def test_managers_see_each_others_writes(self):
+        DBManager(self.db_path).insert_user(
+            {"email": "a@b.com", "hashed_password": "x", "role": "student"})
+        self.assertIsNotNone(DBManager(self.db_path).get_user("a@b.com"))
+
+
+# Test cases for the versioned schema migrations
+class TestMigrations(unittest.TestCase):
+
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+
+    def tearDown(self):
+        self.conn.close()
+
+    # A fresh database ends up at the latest version
+    def test_fresh_database_is_migrated(self):
+        migrations.migrate(self.conn)
+        self.assertEqual(migrations.get_version(self.conn), migrations.SCHEMA_VERSION)
+        tables = {r[0] for r in self.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table'")}
+        self.assertTrue({"users", "students", "openings", "applications"} <= tables)
+
+    # The old setup.py openings table gains the newer columns
+    def test_legacy_openings_table_is_upgraded(self):
+        self.conn.execute("""
+            CREATE TABLE openings (
+                opening_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                company_email TEXT NOT NULL, opening_name TEXT NOT NULL,
+                specialization TEXT NOT NULL, location TEXT NOT NULL,
+                stipend REAL CHECK(stipend > 0), required_skills TEXT)
+        """)
+        migrations.migrate(self.conn)
+        cols = {r[1] for r in self.conn.execute("PRAGMA table_info(openings)")}
+        self.assertTrue({"deadline", "required_gpa", "priority"} <= cols)
+
+    # Once current, migrate() only reads user_version
+    def test_current_database_is_skipped(self):
+        migrations.migrate(self.conn)
+        statements = []
+        self.conn.set_trace_callback(statements.append)
+        migrations.migrate(self.conn)
+        self.assertEqual(statements, ["PRAGMA user_version"])
+
+
+# Test cases for the normalized skills / preferred-location tables (schema v4)
+class TestNormalizedTerms(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = DBManager(os.path.join(self.tmp.name, "ams.db"))
+        self.db.insert_student(dict(make_student(1), preferred_locations="Jeddah;Riyadh",
+                                    skills="Python, SQL"))
+        self.db.insert_student(dict(make_student(2), preferred_locations="Abha;Dammam;Riyadh",
+                                    skills='sql,"quoted" skill'))
+        self.db.insert_opening({"company_email": "c@co.com", "opening_name": "Dev",
+                                "specialization": "Software Engineering", "location": "Riyadh",
+                                "stipend": 1000, "required_skills": "python,sql"})
+
+    def tearDown(self):
+        connection.close_all()
+        self.tmp.cleanup()
+
+    def emails(self, rows):
+        return [r["email"] for r in rows]
+
+    # Skill lookups are case-insensitive and ignore surrounding spaces
+    def test_skill_and_location_lookups(self):
+        self.assertEqual(len(self.db.get_openings_requiring_skill(" SQL ")), 1)
+        self.assertEqual(self.db.get_openings_requiring_skill("java"), [])
+        rows = self.db.get_students_preferring_location("Riyadh")
+        self.assertEqual(self.emails(rows), ["s1@uni.edu"])
+        self.assertEqual(rows[0]["location_rank"], 2)
+        rows = self.db.get_students_preferring_location("Riyadh", max_rank=3)
+        self.assertEqual(self.emails(rows), ["s1@uni.edu", "s2@uni.edu"])
+        skills = {r[0] for r in self.db.conn.execute("SELECT name FROM skills")}
+        self.assertEqual(skills, {"Python", "SQL", '"quoted" skill'})
+
+    # Triggers keep the tables in step with profile and opening edits
+    def test_edits_are_tracked(self):
+        row = dict(self.db.get_student_by_email("s2@uni.edu"))
+        row["preferred_locations"] = "Riyadh"
+        self.db.update_student("s2@uni.edu", row)
+        rows = self.db.get_students_preferring_location("Riyadh", max_rank=1)
+        self.assertEqual(self.emails(rows), ["s2@uni.edu"])
+        opening = dict(self.db.get_opening_by_id(1))
+        opening["required_skills"] = "java"
+        self.db.update_opening(1, opening)
+        self.assertEqual(len(self.db.get_openings_requiring_skill("java")), 1)
+        self.assertEqual(self.db.get_openings_requiring_skill("python"), [])
+        self.db.delete_opening(1)
+        self.assertEqual(self.db.get_openings_requiring_skill("java"), [])
+
+    # Upgrading from v3 backfills the rows that already exist
+    def test_backfill(self):
+        conn = self.db.conn
+        for table in ("skills", "student_skills", "opening_skills", "student_locations"):
+            conn.execute(f"DELETE FROM {table}")
+        conn.execute("PRAGMA user_version = 3")
+        conn.commit()
+        migrations.migrate(conn)
+        self.assertEqual(len(self.db.get_openings_requiring_skill("python")), 1)
+        self.assertEqual(len(self.db.get_students_preferring_location("Riyadh", 3)), 2)
+
+
+# Test cases for the opt-in multi-user mode (WAL + busy retry + writer thread)
+class TestMultiUserMode(unittest.TestCase):
+
+    def setUp(self):
+        self.saved = connection.settings()
+        connection.configure(wal=True, busy_retries=3, writer_queue=True)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "ams.db")
+
+    def tearDown(self):
+        writer.stop_all()
+        connection.close_all()
+        connection.configure(**self.saved)
+        self.tmp.cleanup()
+
+    # New connections switch the file to WAL journaling
+    def test_wal_enabled(self):
+        db = DBManager(self.db_path)
+        mode = db.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    # Writes from many threads all land through the single writer
+    def test_concurrent_writes_are_all_committed(self):
+        def worker(n):
+            db = DBManager(self.db_path)
+            for i in range(25):
+                db.log_access(f"user{n}-{i}@x.com")
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        count = DBManager(self.db_path).conn.execute(
+            "SELECT COUNT(*) FROM access_logs").fetchone()[0]
+        self.assertEqual(count, 200)
+
+    # A failing statement in a batch is reported to its own caller only
+    def test_integrity_error_reaches_caller(self):
+        db = DBManager(self.db_path)
+        self.assertTrue(db.apply_to_opening("s@uni.edu", 1))
+        self.assertFalse(db.apply_to_opening("s@uni.edu", 1))
+        self.assertTrue(db.apply_to_opening("s@uni.edu", 2))
+
+    # retry_on_busy retries lock errors but not other failures
+    def test_retry_on_busy(self):
+        attempts = []
+        def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise sqlite3.OperationalError("database is locked")
+            return "ok"
+        self.assertEqual(connection.retry_on_busy(flaky, retries=3, base_delay=0), "ok")
+        self.assertEqual(len(attempts), 3)
+
+        attempts.clear()
+        def broken():
+            attempts.append(1)
+            raise sqlite3.OperationalError("no such table: x")
+        with self.assertRaises(sqlite3.OperationalError):
+            connection.retry_on_busy(broken, retries=3, base_delay=0)
+        self.assertEqual(len(attempts), 1)
+
+    # Each writer batch prunes the change log, with no GUI reading it
+    def test_writer_prunes_change_log(self):
+        db = DBManager(self.db_path)
+        with mock.patch.object(writer, "CHANGE_LOG_KEEP", 5):
+            for opening_id in range(20):
+                db.apply_to_opening("s@uni.edu", opening_id)
+        count = db.conn.execute("SELECT COUNT(*) FROM change_log").fetchone()[0]
+        self.assertEqual(count, 5)
+
+
+def make_student(n):
+    return {
+        "student_id": f"S{n:06d}", "name": f"Student {n}", "mobile_number": "+966501234567",
+        "email": f"s{n}@uni.edu", "gpa": 3.5, "specialization": "Software Engineering",
+        "preferred_locations": "Riyadh;Jeddah", "skills": "python",
+    }
+
+
+# Test cases for the bulk insert methods and the ingest CLI
+class TestBulkInsert(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = DBManager(os.path.join(self.tmp.name, "ams.db"))
+
+    def tearDown(self):
+        connection.close_all()
+        self.tmp.cleanup()
+
+    # Bad rows are collected while the rest of their chunk still goes in
+    def test_bad_rows_are_collected(self):
+        rows = [make_student(n) for n in range(2500)]
+        rows[1200] = make_student(5)        # duplicate email / id
+        del rows[1700]["name"]              # missing key
+        seen = []
+        result = self.db.insert_students_bulk(
+            rows, chunk_size=500, on_error=lambda i, row, exc: seen.append(i))
+        self.assertEqual(result.inserted, 2498)
+        self.assertEqual(result.failed, 2)
+        self.assertEqual(sorted(seen), [1200, 1700])
+        count = self.db.conn.execute("SELECT COUNT(*) FROM students").fetchone()[0]
+        self.assertEqual(count, 2498)
+
+    # The CLI path validates rows and reports them by line number
+    def test_ingest_csv(self):
+        path = os.path.join(self.tmp.name, "students.csv")
+        with open(path, "w") as f:
+            f.write("student_id,name,mobile_number,email,gpa,specialization,"
+                    "preferred_locations,skills\n")
+            f.write("S1,Ann,+966501234567,ann@uni.edu,4.1,Software Engineering,Riyadh,python\n")
+            f.write("S2,Bob,+966501234567,bob@uni.edu,7.0,Software Engineering,Riyadh,sql\n")
+        messages = []
+        inserted, rejected, _ = ingest(self.db, "students", path, report=messages.append)
+        self.assertEqual((inserted, rejected), (1, 1))
+        self.assertTrue(messages[0].startswith("line 3:"))
+        self.assertEqual(self.db.get_student_by_email("ann@uni.edu")["gpa"], 4.1)
+
+    # A headless bulk load leaves a bounded change log behind
+    def test_bulk_prunes_change_log(self):
+        with mock.patch.object(db_manager, "CHANGE_LOG_KEEP", 100):
+            self.db.insert_students_bulk(make_student(n) for n in range(500))
+        count = self.db.conn.execute("SELECT COUNT(*) FROM change_log").fetchone()[0]
+        self.assertEqual(count, 100)
+
+    # Inside a caller's transaction, bulk writes nest and the caller decides
+    def test_bulk_in_open_transaction(self):
+        conn = self.db.conn
+        conn.execute("BEGIN IMMEDIATE")
+        self.db.insert_students_bulk(make_student(n) for n in range(10))
+        round_id = self.db.save_allocation({make_student(0)["email"]: None})
+        self.assertTrue(conn.in_transaction)
+        conn.rollback()
+        count = conn.execute("SELECT COUNT(*) FROM students").fetchone()[0]
+        self.assertEqual(count, 0)
+        self.assertIsNone(conn.execute("SELECT 1 FROM allocation_rounds WHERE round_id = ?",
+                                       (round_id,)).fetchone())
+
+        # a failing nested write undoes only itself
+        conn.execute("BEGIN IMMEDIATE")
+        self.db.insert_students_bulk([make_student(1)])
+        with self.assertRaises(sqlite3.Error):
+            self.db.save_allocation({"x@uni.edu": object()})  # cannot be bound
+        conn.commit()
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM students").fetchone()[0], 1)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM allocation_rounds").fetchone()[0], 0)
+
+    # Malformed JSON lines and badly typed values are rejected row by row
+    def test_ingest_jsonl(self):
+        path = os.path.join(self.tmp.name, "students.jsonl")
+        good = dict(make_student(1), student_id=1001, mobile_number=966501234567)
+        with open(path, "w") as f:
+            f.write(json.dumps(good) + "\n")
+            f.write('{"email": "bad@uni.edu",\n')
+            f.write(json.dumps(dict(make_student(2), name=None)) + "\n")
+            f.write("[1, 2]\n")
+        messages = []
+        inserted, rejected, _ = ingest(self.db, "students", path, report=messages.append)
+        self.assertEqual((inserted, rejected), (1, 3))
+        self.assertEqual([m.split(":")[0] for m in messages], ["line 2", "line 3", "line 4"])
+        self.assertEqual(self.db.get_student_by_email("s1@uni.edu")["student_id"], "1001")
+
+        path = os.path.join(self.tmp.name, "openings.jsonl")
+        opening = {"company_email": "hr@co.com", "opening_name": "Dev", "stipend": 100,
+                   "specialization": "Software Engineering", "location": "Riyadh"}
+        with open(path, "w") as f:
+            f.write(json.dumps(dict(opening, deadline="2030-06-30T23:59:00")) + "\n")
+            f.write(json.dumps(dict(opening, deadline="next friday")) + "\n")
+        messages = []
+        inserted, rejected, _ = ingest(self.db, "openings", path, report=messages.append)
+        self.assertEqual((inserted, rejected), (1, 1))
+        self.assertIn("deadline", messages[0])
+
+
+
+# Test cases for the in-memory applied set
+class TestApplicationState(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "ams.db")
+        DBManager(self.db_path).apply_bulk(
+            {"student_email": "ann@uni.edu", "opening_id": i} for i in (1, 2, 3))
+
+    def tearDown(self):
+        connection.close_all()
+        self.tmp.cleanup()
+
+    # The set is read with one query; lookups and writes keep it current
+    def test_one_read_then_write_through(self):
+        state = ApplicationState("ann@uni.edu", self.db_path)
+        selects = []
+        state.db.conn.set_trace_callback(
+            lambda sql: selects.append(sql) if sql.startswith("SELECT") else None)
+        self.assertEqual([state.has_applied(i) for i in range(1, 6)],
+                         [True, True, True, False, False])
+        self.assertTrue(state.apply(4))
+        self.assertFalse(state.apply(4))
+        state.cancel(1)
+        self.assertEqual(state.applied, {2, 3, 4})
+        self.assertEqual(len(selects), 1)
+        state.db.conn.set_trace_callback(None)
+        self.assertEqual(DBManager(self.db_path).get_applied_opening_ids("ann@uni.edu"), {2, 3, 4})
+
+    # Which of many students applied to one opening, chunk by chunk
+    def test_applicants_among(self):
+        db = DBManager(self.db_path)
+        emails = ["bob@uni.edu", "ann@uni.edu", "cat@uni.edu"]
+        self.assertEqual(db.get_applicants_among(2, emails, chunk_size=2), {"ann@uni.edu"})
+        self.assertEqual(db.get_applicants_among(9, emails), set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import unittest
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtWidgets import QApplication, QWidget
+    from gui.list_models import PagedListModel
+    from gui.tasks import TaskRunner
+except ImportError:
+    QApplication = None
+
+from test_tasks import wait_until
+
+
+def numbers(total):
+    """A fetch(after, limit) over 0..total-1, keyed on the last number."""
+    calls = []
+
+    def fetch(after, limit):
+        start = 0 if after is None else after + 1
+        rows = list(range(start, min(start + limit, total)))
+        calls.append((after, limit))
+        return rows, (rows[-1] if start + limit < total else None)
+    return fetch, calls
+
+
+# Test cases for the paged list model behind the long lists
+@unittest.skipUnless(QApplication, "PyQt6 not installed")
+class TestPagedListModel(unittest.TestCase):
+
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication([])
+
+    # Pages are appended until the fetch reports no next key
+    def test_fetch_until_done(self):
+        fetch, calls = numbers(25)
+        model = PagedListModel(fetch, str, page_size=10)
+        pages = []
+        model.page_loaded.connect(lambda n, more: pages.append((n, more)))
+        while model.canFetchMore():
+            model.fetchMore()
+        self.assertEqual(model.rowCount(), 25)
+        self.assertEqual(pages, [(10, True), (10, True), (5, False)])
+        self.assertEqual(calls, [(None, 10), (9, 10), (19, 10)])
+        self.assertEqual(model.data(model.index(7)), "7")
+        self.assertEqual(model.data(model.index(7), Qt.ItemDataRole.UserRole), 7)
+
+    # reload() starts again from the first page
+    def test_reload(self):
+        fetch, calls = numbers(25)
+        model = PagedListModel(fetch, str, page_size=10)
+        model.fetchMore()
+        model.fetchMore()
+        model.reload()
+        self.assertEqual(model.rowCount(), 10)
+        self.assertEqual(calls[-1], (None, 10))
+
+    # With a TaskRunner pages arrive asynchronously, one at a time
+    def test_background_pages(self):
+        window = QWidget()
+        fetch, calls = numbers(15)
+        model = PagedListModel(fetch, str, TaskRunner(window), page_size=10)
+        model.fetchMore()
+        self.assertFalse(model.canFetchMore())  # the first page is still loading
+        self.assertTrue(wait_until(self.app, lambda: model.rowCount() == 10))
+        model.fetchMore()
+        self.assertTrue(wait_until(self.app, lambda: model.rowCount() == 15))
+        self.assertFalse(model.canFetchMore())
+
+    # A page that lands after reload() is dropped, not appended to the new rows
+    def test_reload_while_fetching(self):
+        window = QWidget()
+        fetch, calls = numbers(3)
+        model = PagedListModel(fetch, str, TaskRunner(window), page_size=10)
+        model.fetchMore()
+        model.reload()  # before the first page has landed
+        self.assertTrue(wait_until(self.app, lambda: not model.tasks.busy))
+        self.assertEqual(model.rows, [0, 1, 2])
+        self.assertEqual(len(calls), 2)
+        self.assertTrue(model.done)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,354 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import random
+import sqlite3
+import tempfile
+import time
+import unittest
+from database import connection
+from models.student import Student
+from models.opening import Opening
+from models.matching import (MatchingSystem, match_openings_for_student, match_all_students,
+                             iter_matches_for_student, top_matches_for_student)
+from models.match_cache import MatchCache
+from models.match_store import MatchStore
+from models.parallel import match_all_parallel
+from models.skills import SkillIndex, overlap, overlap_matrix
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SPECS = ["Software Engineering", "Civil Engineering", "Mining Engineering"]
+CITIES = ["Riyadh", "Jeddah", "Dammam", "Abha", "Tabuk"]
+SKILLS = ["python", "sql", "cad", "matlab", "java", "excel"]
+
+
+def random_openings(rng, n):
+    return [
+        Opening(
+            opening_id=i, company_email=f"c{i % 7}@co.com", name=f"Opening {i}",
+            specialization=rng.choice(SPECS), location=rng.choice(CITIES),
+            # few distinct stipends so ties (and their ordering) get exercised
+            stipend=rng.choice([1000, 1500, 2000, 2500]),
+            required_skills=rng.sample(SKILLS, rng.randint(0, 3)),
+            required_gpa=rng.choice([0, 2.5, 3.0, 3.5, 4.5]),
+            priority=rng.choice(["location", "gpa"]),
+            deadline="2030-01-01T00:00:00",
+        )
+        for i in range(n)
+    ]
+
+
+def random_students(rng, n):
+    return [
+        Student(
+            student_id=f"S{i}", name=f"Student {i}", email=f"s{i}@uni.edu",
+            gpa=rng.choice([2.0, 2.9, 3.0, 3.7, 4.8]), specialization=rng.choice(SPECS),
+            preferred_locations=rng.sample(CITIES, rng.randint(1, 3)),
+            skills=rng.sample(SKILLS, rng.randint(0, 4)),
+        )
+        for i in range(n)
+    ]
+
+
+# Test cases for the per-student and batch matching functions
+class TestMatching(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(42)
+        self.openings = random_openings(self.rng, 300)
+        self.students = random_students(self.rng, 200)
+
+    # Ordering rules: GPA-priority first, then by preferred location, stipend desc
+    def test_priority_order(self):
+        student = Student("S1", "Ann", "a@uni.edu", 3.5, "Software Engineering",
+                          ["Jeddah", "Riyadh"], [])
+        make = lambda i, loc, stipend, prio="location", gpa=0: Opening(
+            i, "c@co.com", f"O{i}", "Software Engineering", loc, stipend, [], gpa, prio)
+        openings = [make(1, "Riyadh", 3000), make(2, "Jeddah", 1000), make(3, "Abha", 5000),
+                    make(4, "Abha", 900, "gpa"), make(5, "Jeddah", 9000, gpa=4.0)]
+        ids = [o.opening_id for o in match_openings_for_student(student, openings)]
+        self.assertEqual(ids, [4, 2, 1, 3])
+
+    # The batch engine returns exactly what the per-student function returns
+    def test_batch_matches_per_student(self):
+        batch = match_all_students(self.students, self.openings)
+        for s in self.students:
+            expected = match_openings_for_student(s, self.openings)
+            self.assertEqual([o.opening_id for o in batch[s.email]],
+                             [o.opening_id for o in expected])
+
+    # The NumPy backend gives identical results, including duplicate preferences
+    @unittest.skipUnless(numpy, "NumPy not installed")
+    def test_numpy_backend_parity(self):
+        self.students[0].preferred_locations = ["Riyadh", "Riyadh"]
+        self.students[1].preferred_locations = ["Nowhere", "Abha"]
+        vectorized = match_all_students(self.students, self.openings, backend="numpy")
+        for s in self.students:
+            expected = match_openings_for_student(s, self.openings)
+            self.assertEqual([o.opening_id for o in vectorized[s.email]],
+                             [o.opening_id for o in expected])
+
+    # The lazy generator yields the same sequence, and pages slice it
+    def test_lazy_matches_parity(self):
+        self.students[0].preferred_locations = ["Riyadh", "Jeddah", "Riyadh"]
+        for s in self.students:
+            expected = [o.opening_id for o in match_openings_for_student(s, self.openings)]
+            lazy = [o.opening_id for o in iter_matches_for_student(s, self.openings)]
+            self.assertEqual(lazy, expected)
+            page = top_matches_for_student(s, self.openings, limit=5, offset=3)
+            self.assertEqual([o.opening_id for o in page], expected[3:8])
+
+    # Equal stipends inside a bucket are ordered by skill overlap
+    def test_skill_tiebreak_order(self):
+        student = Student("S1", "Ann", "a@uni.edu", 3.5, "Software Engineering",
+                          ["Riyadh"], ["Python", "SQL"])
+        make = lambda i, stipend, skills: Opening(
+            i, "c@co.com", f"O{i}", "Software Engineering", "Riyadh", stipend, skills)
+        openings = [make(1, 1000, []), make(2, 1000, ["python"]), make(3, 2000, []),
+                    make(4, 1000, ["sql ", "python", "java"])]
+        ids = lambda matches: [o.opening_id for o in matches]
+        self.assertEqual(ids(match_openings_for_student(student, openings)), [3, 1, 2, 4])
+        self.assertEqual(ids(match_openings_for_student(student, openings, skill_tiebreak=True)),
+                         [3, 4, 2, 1])
+
+    # Every implementation agrees when skills break ties
+    def test_skill_tiebreak_parity(self):
+        self.students[0].preferred_locations = ["Riyadh", "Riyadh"]
+        expected = {s.email: [o.opening_id for o in match_openings_for_student(
+            s, self.openings, skill_tiebreak=True)] for s in self.students}
+        backends = ["python", "numpy"] if numpy else ["python"]
+        for backend in backends:
+            batch = match_all_students(self.students, self.openings, backend=backend,
+                                       skill_tiebreak=True)
+            self.assertEqual({e: [o.opening_id for o in m] for e, m in batch.items()}, expected)
+        for s in self.students:
+            lazy = iter_matches_for_student(s, self.openings, skill_tiebreak=True)
+            self.assertEqual([o.opening_id for o in lazy], expected[s.email])
+
+    # Bitset overlap counts shared skills, case- and space-insensitively
+    def test_skill_bitsets(self):
+        index = SkillIndex()
+        a = index.mask(["Python", "SQL", ""])
+        b = index.mask([" sql", "java", "python"])
+        self.assertEqual(len(index), 3)
+        self.assertEqual(overlap(a, b), 2)
+        if numpy:
+            masks = [index.mask([f"skill{i}"]) | a for i in range(100)]
+            m = overlap_matrix(masks, [b] + masks, len(index))
+            self.assertEqual(m[5].tolist(), [2] + [2] * 5 + [3] + [2] * 94)
+
+    # The cache counts hits and misses and drops the least recently used entry
+    def test_match_cache_lru_and_ttl(self):
+        cache = MatchCache(maxsize=2)
+        calls = []
+        compute = lambda key: cache.get_or_compute(key, lambda: calls.append(key) or [key])
+        for key in ["a", "b", "a", "c", "b"]:
+            self.assertEqual(compute(key), [key])
+        self.assertEqual(calls, ["a", "b", "c", "b"])
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 4, "evictions": 2, "size": 2})
+
+        cache = MatchCache(ttl=0.01)
+        cache.put("a", [1])
+        time.sleep(0.02)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual((cache.misses, cache.evictions, len(cache)), (1, 1, 0))
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            match_all_students(self.students, self.openings, backend="gpu")
+
+
+# Test cases for MatchingSystem against a real database
+class TestMatchingSystem(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.system = MatchingSystem(os.path.join(self.tmp.name, "ams.db"))
+        rng = random.Random(7)
+        for o in random_openings(rng, 60):
+            self.system.db.insert_opening({
+                "company_email": o.company_email, "opening_name": o.name,
+                "specialization": o.specialization, "location": o.location,
+                "stipend": o.stipend, "required_gpa": o.required_gpa,
+                "priority": o.priority, "deadline": "2030-01-01T00:00:00",
+            })
+        for s in random_students(rng, 40):
+            self.system.db.insert_student({
+                "student_id": s.student_id, "name": s.name, "mobile_number": "+966501234567",
+                "email": s.email, "gpa": s.gpa, "specialization": s.specialization,
+                "preferred_locations": ";".join(s.preferred_locations), "skills": "",
+            })
+
+    def tearDown(self):
+        connection.close_all()
+        self.tmp.cleanup()
+
+    def test_all_matches_agree_with_single_lookups(self):
+        everything = self.system.get_all_matches()
+        self.assertEqual(len(everything), 40)
+        for email, matches in everything.items():
+            single = self.system.get_matches_for_student_email(email)
+            self.assertEqual([o.opening_id for o in matches],
+                             [o.opening_id for o in single])
+            page = self.system.get_matches_for_student_email(email, limit=4, offset=2)
+            self.assertEqual([o.opening_id for o in page],
+                             [o.opening_id for o in single][2:6])
+
+    # Parallel matching by specialization gives the same lists
+    def test_parallel_matches_serial(self):
+        serial = self.system.get_all_matches()
+        parallel = self.system.get_all_matches(workers=2)
+        self.assertEqual({e: [o.opening_id for o in m] for e, m in parallel.items()},
+                         {e: [o.opening_id for o in m] for e, m in serial.items()})
+
+    # Cached lookups are reused until the profile or any opening changes
+    def test_cached_matches_follow_edits(self):
+        cache = MatchCache()
+        system = MatchingSystem(self.system.db.db_path, cache=cache)
+        db = system.db
+        email = next(r['email'] for r in db.iter_students())
+        ids = lambda: [o.opening_id for o in system.get_matches_for_student_email(email)]
+        first = ids()
+        self.assertEqual(ids(), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # A company edit bumps the openings version
+        student = db.get_student_by_email(email)
+        target = next(o for o in db.get_openings_by_specialization(student['specialization'])
+                      if o['opening_id'] not in first)
+        data = dict(target)
+        data.update(required_gpa=0, priority="gpa", stipend=99999)
+        version = db.get_openings_version()
+        db.update_opening(target['opening_id'], data)
+        self.assertGreater(db.get_openings_version(), version)
+        self.assertEqual(ids()[0], target['opening_id'])
+
+        # So does a bulk insert, and a profile edit changes the key
+        db.insert_openings_bulk([data])
+        self.assertEqual(ids(), [o.opening_id for o in self.system.get_matches_for_student_email(email)])
+        row = dict(student)
+        row['preferred_locations'] = "Tabuk"
+        db.update_student(email, row)
+        self.assertEqual(ids(), [o.opening_id for o in self.system.get_matches_for_student_email(email)])
+        self.assertEqual(cache.hits, 1)
+
+    # The shared-memory column store matches like the object backends
+    @unittest.skipUnless(numpy, "NumPy not installed")
+    def test_column_store(self):
+        from models.columnar import ColumnStore
+        self.system.db.insert_student({
+            "student_id": "S99", "name": "Dup", "mobile_number": "+966501234567",
+            "email": "dup@uni.edu", "gpa": 3.7, "specialization": SPECS[0],
+            "preferred_locations": "Riyadh;Abha;Riyadh", "skills": "",
+        })
+        serial = {e: [o.opening_id for o in m] for e, m in self.system.get_all_matches().items()}
+        with ColumnStore.load(self.system.db) as store:
+            self.assertEqual(len(store.students['gpa']), 41)
+            attached = ColumnStore.attach(store.handle)
+            matched = {}
+            for spec in SPECS:
+                matched.update(attached.match(spec))
+            attached.close()
+            self.assertEqual(matched, serial)
+        parallel, _ = match_all_parallel(self.system.db.db_path, workers=2, shared=True)
+        self.assertEqual(parallel, serial)
+
+    # An unparsable stored deadline loads as "no deadline" instead of failing
+    @unittest.skipUnless(numpy, "NumPy not installed")
+    def test_column_store_bad_deadline(self):
+        from models.columnar import ColumnStore
+        db = self.system.db
+        first, second = [r['opening_id'] for r in db.iter_openings()][:2]
+        db.conn.execute("UPDATE openings SET deadline = 'next friday' WHERE opening_id = ?",
+                        (first,))
+        db.conn.execute("UPDATE openings SET deadline = '' WHERE opening_id = ?", (second,))
+        db.conn.commit()
+        with ColumnStore.load(db) as store:
+            deadlines = dict(zip(store.openings['opening_id'].tolist(),
+                                 store.openings['deadline'].tolist()))
+        self.assertTrue(numpy.isnan(deadlines.pop(first)))
+        self.assertTrue(numpy.isnan(deadlines.pop(second)))
+        self.assertFalse(any(numpy.isnan(v) for v in deadlines.values()))
+        serial = {e: [o.opening_id for o in m] for e, m in self.system.get_all_matches().items()}
+        parallel, _ = match_all_parallel(db.db_path, workers=2, shared=True)
+        self.assertEqual(parallel, serial)
+
+    # Deadlines are checked in SQL; open_only drops closed openings there
+    def test_deadline_filter_in_sql(self):
+        db = self.system.db
+        spec, prefs = "Nuclear Engineering", ["Riyadh"]
+        deadlines = {"past": "2001-01-01T00:00:00.000", "future": "2099-01-01T00:00:00.000",
+                     "none": ""}
+        for name, deadline in deadlines.items():
+            db.insert_opening({"company_email": "c@co.com", "opening_name": name,
+                               "specialization": spec, "location": "Riyadh", "stipend": 100,
+                               "deadline": deadline})
+        now = "2026-01-01T00:00:00.000"
+        rows = list(db.iter_matching_openings(spec, 4.0, prefs, now=now))
+        self.assertEqual({r['opening_name']: r['is_closed'] for r in rows},
+                         {"past": 1, "future": 0, "none": 0})
+        rows = list(db.iter_matching_openings(spec, 4.0, [], now=now, open_only=True))
+        self.assertEqual(sorted(r['opening_name'] for r in rows), ["future", "none"])
+
+    # The materialized store serves the same lists and only rewrites what changed
+    def test_match_store_is_incremental(self):
+        store = MatchStore(self.system.db.db_path)
+        store.refresh()
+        emails = [r['email'] for r in self.system.db.iter_students()]
+        for email in emails:
+            self.assertEqual([o.opening_id for o in store.get_matches(email)],
+                             [o.opening_id for o in self.system.get_matches_for_student_email(email)])
+        self.assertTrue(store.is_current())
+        self.assertEqual([o.opening_id for o in store.get_matches(emails[1], limit=3, offset=1)],
+                         [o.opening_id for o in store.get_matches(emails[1])][1:4])
+
+        # A new opening only touches students of its specialization who clear its GPA
+        spec = "Civil Engineering"
+        self.system.db.insert_opening({
+            "company_email": "new@co.com", "opening_name": "New", "specialization": spec,
+            "location": "Riyadh", "stipend": 9999, "required_gpa": 3.5,
+            "priority": "gpa", "deadline": "2030-01-01T00:00:00",
+        })
+        affected = [r for r in self.system.db.iter_students()
+                    if r['specialization'] == spec and r['gpa'] >= 3.5]
+        self.assertEqual(store.refresh(), len(affected))
+        self.assertEqual(store.refresh(), 0)
+        top = store.get_matches(affected[0]['email'])[0]
+        self.assertEqual(top.name, "New")
+
+        # Profile edits re-match just that student
+        row = dict(self.system.db.get_student_by_email(emails[0]))
+        row['specialization'] = "Mining Engineering"
+        self.system.db.update_student(emails[0], row)
+        self.assertEqual(store.refresh(), 1)
+        self.assertEqual([o.opening_id for o in store.get_matches(emails[0])],
+                         [o.opening_id for o in self.system.get_matches_for_student_email(emails[0])])
+
+    # Reads serve the stored lists while another connection holds the write lock
+    def test_match_store_reads_do_not_refresh(self):
+        store = MatchStore(self.system.db.db_path)
+        store.refresh()
+        email = next(self.system.db.iter_students())['email']
+        before = [o.opening_id for o in store.get_matches(email)]
+        row = dict(self.system.db.get_student_by_email(email))
+        row['specialization'] = "Mining Engineering"
+        self.system.db.update_student(email, row)
+        writer = sqlite3.connect(self.system.db.db_path, isolation_level=None, timeout=0)
+        try:
+            writer.execute("BEGIN IMMEDIATE")
+            self.assertFalse(store.is_current())
+            self.assertEqual([o.opening_id for o in store.get_matches(email)], before)
+        finally:
+            writer.rollback()
+            writer.close()
+        self.assertEqual(store.refresh(), 1)
+        self.assertTrue(store.is_current())
+        self.assertNotEqual([o.opening_id for o in store.get_matches(email)], before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import tempfile
+import unittest
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from database import connection
+from database.db_manager import DBManager
+
+try:
+    from PyQt6.QtWidgets import QApplication, QWidget
+    from gui.navigator import Navigator, go_back, navigate
+    from gui.student_dashboard import StudentDashboard
+except ImportError:
+    QApplication = None
+    QWidget = object
+
+
+class Form(QWidget):
+    """An uncached screen."""
+
+
+class Listing(QWidget):
+    """A cached screen, one per owner, reading the openings."""
+    DEPENDS_ON = ("openings",)
+    built = 0
+
+    @staticmethod
+    def screen_key(owner):
+        return owner
+
+    def __init__(self, owner):
+        super().__init__()
+        self.owner = owner
+        self.refreshed = []
+        Listing.built += 1
+
+    def refresh(self, changed):
+        self.refreshed.append(changed)
+
+
+# Test cases for the screen navigator
+@unittest.skipUnless(QApplication, "PyQt6 not installed")
+class TestNavigator(unittest.TestCase):
+
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication([])
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = DBManager(os.path.join(self.tmp.name, "ams.db"))
+        self.nav = Navigator(self.db.db_path)
+        Listing.built = 0
+
+    def tearDown(self):
+        self.nav.close()
+        connection.close_all()
+        self.tmp.cleanup()
+
+    def add_opening(self):
+        self.db.insert_opening({"company_email": "hr@co.com", "opening_name": "Dev",
+                                "specialization": "SE", "location": "Riyadh", "stipend": 100})
+
+    # Screens with the same key are reused; going back needs no rebuild
+    def test_reuse_and_back(self):
+        a = self.nav.open(Listing, "a")
+        b = navigate(a, Listing, "b")
+        self.assertTrue(go_back(b))
+        self.assertIs(self.nav.currentWidget(), a)
+        self.assertIs(navigate(a, Listing, "b"), b)
+        self.assertEqual(Listing.built, 2)
+        self.assertEqual(a.refreshed, [])
+
+    # A screen is refreshed with the tables that changed since it was shown
+    def test_refresh_on_version_change(self):
+        a = self.nav.open(Listing, "a")
+        self.add_opening()  # while `a` is still on top
+        b = navigate(a, Listing, "b")
+        navigate(b, Listing, "a")
+        self.assertEqual(a.refreshed, [{"openings"}])
+        navigate(a, Listing, "b")
+        self.assertEqual(b.refreshed, [])  # built after the change
+        navigate(b, Listing, "a")
+        self.assertEqual(a.refreshed, [{"openings"}])
+
+    # A real screen re-reads the database it was opened on, wherever the cwd is now
+    def test_dashboard_refresh(self):
+        self.db.insert_student({"student_id": "S1", "name": "Ann", "mobile_number": "+966501234567",
+                                "email": "s@uni.edu", "gpa": 3.5, "specialization": "SE",
+                                "preferred_locations": "Riyadh", "skills": ""})
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)  # windows open ./ams.db
+        try:
+            dashboard = self.nav.open(StudentDashboard, self.db.get_student_by_email("s@uni.edu"))
+        finally:
+            os.chdir(cwd)
+        form = navigate(dashboard, Form)
+        row = dict(self.db.get_student_by_email("s@uni.edu"), name="Ann B")
+        self.db.update_student("s@uni.edu", row)
+        navigate(form, StudentDashboard, row)
+        self.assertEqual(dashboard.welcome_label.text(), "Welcome, Ann B!")
+
+    # Uncached screens are dropped once left; log out drops everything
+    def test_forms_and_reset(self):
+        a = self.nav.open(Listing, "a")
+        form = navigate(a, Form)
+        navigate(form, Listing, "a")
+        self.assertEqual(self.nav.count(), 1)
+        navigate(a, Listing, "b")
+        navigate(self.nav.currentWidget(), Form, reset=True)
+        self.assertEqual(self.nav.cached_screens(), [])
+        self.assertFalse(go_back(self.nav.currentWidget()))
+
+    # Least recently shown screens go first once over the limit
+    def test_eviction(self):
+        self.nav.max_cached = 2
+        screen = self.nav.open(Listing, "a")
+        for owner in "bc":
+            screen = navigate(screen, Listing, owner)
+        self.assertEqual([s.owner for s in self.nav.cached_screens()], ["b", "c"])
+        self.nav.idle_ttl = 0
+        navigate(screen, Listing, "b")
+        self.assertEqual([s.owner for s in self.nav.cached_screens()], ["b"])
+
+    # Outside a navigator, windows open the next one and close
+    def test_standalone_window(self):
+        window = Form()
+        window.show()
+        nxt = navigate(window, Listing, "a")
+        self.assertIs(window.next_window, nxt)
+        self.assertFalse(window.isVisible())
+        nxt.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import tempfile
+import unittest
+from datetime import datetime
+from database import connection
+from database.db_manager import DBManager
+from models.company import ApprenticeshipOpening
+from models.matching import (opening_from_row, opening_from_tuple,
+                             student_from_row, student_from_tuple)
+from models.opening import Opening
+from models.student import Student
+
+
+# Test cases for the slotted Opening/Student models
+class TestOpening(unittest.TestCase):
+
+    # The deadline string is parsed on first read, then kept
+    def test_deadline_is_parsed_lazily(self):
+        o = Opening(1, "c@co.com", "Dev", "SE", "Riyadh", 1000, [], deadline="not a date")
+        with self.assertRaises(ValueError):
+            o.deadline
+        o.deadline = "2030-01-01T09:30:00"
+        first = o.deadline
+        self.assertEqual(first, datetime(2030, 1, 1, 9, 30))
+        self.assertIs(o.deadline, first)
+
+    # No deadline still defaults to a datetime
+    def test_missing_deadline_defaults_to_now(self):
+        o = Opening(1, "c@co.com", "Dev", "SE", "Riyadh", 1000, [])
+        self.assertLessEqual(o.deadline, datetime.now())
+
+    # Instances carry no __dict__
+    def test_slots(self):
+        o = Opening(1, "c@co.com", "Dev", "SE", "Riyadh", 1000, [])
+        s = Student("S1", "Ann", "a@uni.edu", 3.5, "SE", ["Riyadh"], [])
+        for obj in (o, s, ApprenticeshipOpening(2, "SE", "Jeddah", 900, ["cad"])):
+            self.assertFalse(hasattr(obj, "__dict__"))
+            with self.assertRaises(AttributeError):
+                obj.nickname = "x"
+
+    # The legacy class is an Opening with defaults for the missing fields
+    def test_legacy_opening(self):
+        o = ApprenticeshipOpening(2, "SE", "Jeddah", 900, ["cad"])
+        self.assertIsInstance(o, Opening)
+        self.assertEqual((o.required_gpa, o.priority, o.capacity), (0.0, 'location', 1))
+        self.assertEqual(repr(o), "Opening(2, SE, Jeddah, Stipend: 900)")
+
+
+# Building models from plain tuples gives the same objects as from rows
+class TestTupleRows(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = DBManager(os.path.join(self.tmp.name, "ams.db"))
+        self.db.insert_opening({
+            "company_email": "c@co.com", "opening_name": "Dev", "specialization": "SE",
+            "location": "Riyadh", "stipend": 1200, "required_skills": "python,sql",
+            "required_gpa": 3.0, "priority": "gpa", "deadline": "2030-01-01T00:00:00",
+            "capacity": 2,
+        })
+        self.db.insert_student({
+            "student_id": "S1", "name": "Ann", "mobile_number": "+966501234567",
+            "email": "a@uni.edu", "gpa": 3.5, "specialization": "SE",
+            "preferred_locations": "Riyadh;Jeddah", "skills": "",
+        })
+
+    def tearDown(self):
+        connection.close_all()
+        self.tmp.cleanup()
+
+    def test_tuples_match_rows(self):
+        fields = lambda obj: {name: getattr(obj, name) for name in type(obj).__slots__
+                              if name != "_deadline"}
+        (row,), (values,) = list(self.db.iter_openings()), list(self.db.iter_openings(as_tuples=True))
+        self.assertIsInstance(values, tuple)
+        a, b = opening_from_row(row), opening_from_tuple(values)
+        self.assertEqual(fields(a), fields(b))
+        self.assertEqual(a.deadline, b.deadline)
+        (row,), (values,) = list(self.db.iter_students()), list(self.db.iter_students(as_tuples=True))
+        self.assertEqual(fields(student_from_row(row)), fields(student_from_tuple(values)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import inspect
+import tempfile
+import unittest
+from database import connection
+from database.db_manager import DBManager
+
+STUDENT = {
+    "student_id": "S001", "name": "Test Student", "mobile_number": "+966501234567",
+    "email": "s@uni.edu", "gpa": 4.0, "specialization": "Software Engineering",
+    "preferred_locations": "Riyadh;Jeddah", "skills": "python,sql",
+}
+OPENING = {
+    "company_email": "hr@co.com", "opening_name": "Intern",
+    "specialization": "Software Engineering", "location": "Riyadh",
+    "stipend": 1500, "required_skills": "python", "required_gpa": 3.0,
+    "priority": "location", "deadline": "2030-01-01T00:00:00.000",
+}
+
+# One representative call per public DBManager method. A new public method
+# must be added here, otherwise test_every_method_is_covered fails.
+CALLS = {
+    "insert_user": lambda db: db.insert_user(
+        {"email": "new@co.com", "hashed_password": "x", "role": "company"}),
+    "get_user": lambda db: db.get_user("hr@co.com"),
+    "update_password": lambda db: db.update_password("hr@co.com", "y"),
+    "insert_opening": lambda db: db.insert_opening(OPENING),
+    "get_openings_by_company": lambda db: db.get_openings_by_company("hr@co.com", after=1,
+                                                                     limit=50),
+    "get_opening_by_id": lambda db: db.get_opening_by_id(1),
+    "get_openings_by_specialization":
+        lambda db: db.get_openings_by_specialization("Software Engineering"),
+    "get_openings_requiring_skill": lambda db: db.get_openings_requiring_skill("python"),
+    "iter_matching_openings": lambda db: list(db.iter_matching_openings(
+        "Software Engineering", 3.5, ["Riyadh", "Jeddah"], open_only=True, limit=20)),
+    "iter_openings": lambda db: list(db.iter_openings()),
+    "get_openings_version": lambda db: db.get_openings_version(),
+    "update_opening": lambda db: db.update_opening(1, OPENING),
+    "delete_opening": lambda db: db.delete_opening(999),
+    "insert_student": lambda db: db.insert_student(dict(STUDENT, student_id="S002",
+                                                        email="t@uni.edu")),
+    "get_student_by_email": lambda db: db.get_student_by_email("s@uni.edu"),
+    "get_students_by_specialization":
+        lambda db: db.get_students_by_specialization("Software Engineering"),
+    "get_students_preferring_location":
+        lambda db: db.get_students_preferring_location("Riyadh"),
+    "iter_students": lambda db: list(db.iter_students()),
+    "update_student": lambda db: db.update_student("s@uni.edu", STUDENT),
+    "apply_to_opening": lambda db: db.apply_to_opening("s@uni.edu", 1),
+    "cancel_application": lambda db: db.cancel_application("s@uni.edu", 1),
+    "insert_students_bulk": lambda db: db.insert_students_bulk(
+        [dict(STUDENT, student_id="S003", email="u@uni.edu")]),
+    "insert_openings_bulk": lambda db: db.insert_openings_bulk([OPENING]),
+    "apply_bulk": lambda db: db.apply_bulk([{"student_email": "s@uni.edu", "opening_id": 1}]),
+    "save_allocation": lambda db: db.save_allocation({"s@uni.edu": 1, "t@uni.edu": None}),
+    "get_allocation_for_student": lambda db: db.get_allocation_for_student("s@uni.edu"),
+    "get_allocated_students": lambda db: db.get_allocated_students(1, round_id=1),
+    "get_applicants_by_opening": lambda db: db.get_applicants_by_opening(1),
+    "get_last_change": lambda db: db.get_last_change(),
+    "get_changes": lambda db: db.get_changes(0, limit=100),
+    "prune_changes": lambda db: db.prune_changes(10),
+    "get_data_versions": lambda db: db.get_data_versions(["openings", "students"]),
+    "get_applied_opening_ids": lambda db: db.get_applied_opening_ids("a@uni.edu"),
+    "get_applicants_among": lambda db: db.get_applicants_among(1, ["s@uni.edu", "t@uni.edu"]),
+    "get_ranked_applicants": lambda db: db.get_ranked_applicants(1, after=(1, -3.5, "a"), limit=50),
+    "get_ranked_applicants_by_company":
+        lambda db: db.get_ranked_applicants_by_company("hr@co.com"),
+    "log_access": lambda db: db.log_access("hr@co.com"),
+    "log_session": lambda db: (db.log_session("hr@co.com", login=True),
+                               db.log_session("hr@co.com", login=False)),
+}
+# Methods that run no SQL of their own
+NO_SQL = {"close", "get_data_version"}  # get_data_version only reads a pragma
+# Whole-table loads for batch jobs, where a scan is the right plan
+FULL_SCAN_OK = {"iter_openings", "iter_students"}
+
+
+# Runs EXPLAIN QUERY PLAN on every statement a DBManager method issues and
+# fails if SQLite would answer any of them with a full table scan.
+class TestQueryPlans(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = DBManager(os.path.join(self.tmp.name, "ams.db"))
+        self.db.insert_user({"email": "hr@co.com", "hashed_password": "x", "role": "company"})
+        self.db.insert_student(STUDENT)
+        self.db.insert_opening(OPENING)
+
+    def tearDown(self):
+        connection.close_all()
+        self.tmp.cleanup()
+
+    def statements_for(self, name):
+        statements = []
+        self.db.conn.set_trace_callback(statements.append)
+        try:
+            CALLS[name](self.db)
+        finally:
+            self.db.conn.set_trace_callback(None)
+        return [s for s in statements
+                if s.split()[0].upper() in ("SELECT", "UPDATE", "DELETE", "INSERT")]
+
+    def test_every_method_is_covered(self):
+        public = {n for n, _ in inspect.getmembers(DBManager, inspect.isfunction)
+                  if not n.startswith("_")}
+        self.assertEqual(public - NO_SQL, set(CALLS))
+
+    def test_no_full_table_scans(self):
+        for name in sorted(CALLS):
+            with self.subTest(method=name):
+                statements = self.statements_for(name)
+                self.assertTrue(statements, f"{name} issued no SQL")
+                if name in FULL_SCAN_OK:
+                    continue
+                for sql in statements:
+                    plan = [r[3] for r in self.db.conn.execute("EXPLAIN QUERY PLAN " + sql)]
+                    scans = [step for step in plan if step.startswith("SCAN")]
+                    self.assertEqual(scans, [], f"{name}: {sql}")
+
+    # A later page of ranked applicants seeks to its cursor in the stored
+    # order instead of ranking and sorting every applicant again
+    def test_ranked_page_seeks(self):
+        for name in ("get_ranked_applicants", "get_ranked_applicants_by_company"):
+            for sql in self.statements_for(name):
+                plan = [r[3] for r in self.db.conn.execute("EXPLAIN QUERY PLAN " + sql)]
+                self.assertFalse([step for step in plan if "TEMP B-TREE" in step], sql)
+        plan = " | ".join(r[3] for r in self.db.conn.execute(
+            "EXPLAIN QUERY PLAN " + self.statements_for("get_ranked_applicants")[0]))
+        self.assertIn("(sort_rank,neg_gpa,student_email)>(?,?,?)", plan)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import random
+import tempfile
+import unittest
+from database import connection
+from models.ranking import ApplicantRanking
+from test_matching import random_openings, random_students
+
+
+def expected_ranking(opening, students):
+    """The order ApplicantsWindow used to build in Python (ties by email)."""
+    eligible = [s for s in sorted(students, key=lambda s: s.email)
+                if s.gpa >= opening.required_gpa and opening.location in s.preferred_locations]
+    eligible.sort(key=lambda s: -s.gpa)
+    if opening.priority == 'location':
+        eligible.sort(key=lambda s: s.preferred_locations.index(opening.location))
+    return [s.email for s in eligible]
+
+
+# Test cases for SQL-side applicant ranking
+class TestApplicantRanking(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.ranking = ApplicantRanking(os.path.join(self.tmp.name, "ams.db"))
+        db = self.ranking.db
+        rng = random.Random(3)
+        self.openings = random_openings(rng, 12)
+        self.students = random_students(rng, 80)
+        for o in self.openings:
+            db.insert_opening(self.opening_row(o))
+            o.opening_id += 1  # AUTOINCREMENT ids start at 1
+        for s in self.students:
+            db.insert_student(self.student_row(s))
+        self.applied = {o.opening_id: rng.sample(self.students, 30) for o in self.openings}
+        db.apply_bulk({"student_email": s.email, "opening_id": oid}
+                      for oid, group in self.applied.items() for s in group)
+
+    def tearDown(self):
+        connection.close_all()
+        self.tmp.cleanup()
+
+    @staticmethod
+    def opening_row(o):
+        return {"company_email": "hr@co.com" if o.opening_id % 3 else "other@co.com",
+                "opening_name": o.name, "specialization": o.specialization,
+                "location": o.location, "stipend": o.stipend, "required_gpa": o.required_gpa,
+                "priority": o.priority, "deadline": "2030-01-01T00:00:00"}
+
+    @staticmethod
+    def student_row(s):
+        return {"student_id": s.student_id, "name": s.name, "mobile_number": "+966501234567",
+                "email": s.email, "gpa": s.gpa, "specialization": s.specialization,
+                "preferred_locations": ";".join(s.preferred_locations), "skills": ""}
+
+    def assert_all_ranked(self):
+        for o in self.openings:
+            expected = expected_ranking(o, self.applied[o.opening_id])
+            ranked = [r['email'] for r in self.ranking.iter_ranked(o.opening_id, page_size=4)]
+            self.assertEqual(ranked, expected)
+
+    # Pages follow each other without gaps or repeats, in window order
+    def test_keyset_pages(self):
+        self.assert_all_ranked()
+        rows, after = self.ranking.page(self.openings[0].opening_id, limit=1000)
+        self.assertIsNone(after)
+
+    # The batch mode ranks every opening of one company in a single query
+    def test_rank_company(self):
+        ranked = self.ranking.rank_company("hr@co.com")
+        expected = {o.opening_id: expected_ranking(o, self.applied[o.opening_id])
+                    for o in self.openings if (o.opening_id - 1) % 3}
+        self.assertEqual({oid: [r['email'] for r in rows] for oid, rows in ranked.items()},
+                         {oid: emails for oid, emails in expected.items() if emails})
+
+    # The stored ranks follow edits to students, openings and applications
+    def test_ranks_follow_edits(self):
+        db = self.ranking.db
+        rng = random.Random(4)
+        for s in rng.sample(self.students, 20):
+            s.gpa = round(rng.uniform(2.0, 5.0), 2)
+            s.preferred_locations = list(reversed(s.preferred_locations))
+            db.update_student(s.email, self.student_row(s))
+        for o in rng.sample(self.openings, 4):
+            row = self.opening_row(o)
+            o.priority = "gpa" if o.priority == "location" else "location"
+            o.required_gpa = 2.5
+            o.location = self.students[0].preferred_locations[0]
+            db.update_opening(o.opening_id, dict(row, priority=o.priority,
+                                                 required_gpa=o.required_gpa, location=o.location))
+        for o in self.openings[:3]:
+            best = expected_ranking(o, self.applied[o.opening_id])[0]
+            gone = next(s for s in self.applied[o.opening_id] if s.email == best)
+            self.applied[o.opening_id].remove(gone)
+            db.cancel_application(gone.email, o.opening_id)
+            if self.students[0] not in self.applied[o.opening_id]:
+                self.applied[o.opening_id].append(self.students[0])
+                db.apply_to_opening(self.students[0].email, o.opening_id)
+        self.assert_all_ranked()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import io
+import subprocess
+import tempfile
+import unittest
+from utils.startup import StartupProfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+# Test cases for the startup path and its timing report
+class TestStartup(unittest.TestCase):
+
+    # Showing the entry window loads none of the heavy subsystems
+    def test_entry_window_imports_stay_light(self):
+        code = ("import sys, main, gui.entry_window, utils.logger, utils.notifications\n"
+                "print(' '.join(m for m in ('jinja2', 'bcrypt', 'smtplib', 'urllib.request',"
+                " 'concurrent.futures', 'database.db_manager', 'models.matching', 'numpy')"
+                " if m in sys.modules))")
+        with tempfile.TemporaryDirectory() as cwd:
+            out = subprocess.run([sys.executable, "-c", code], cwd=cwd, capture_output=True,
+                                 text=True, check=True,
+                                 env=dict(os.environ, PYTHONPATH=ROOT)).stdout
+            self.assertEqual(out.strip(), "")
+            self.assertFalse(os.path.exists(os.path.join(cwd, "logs")))
+
+    # Imports are timed with their nesting, phases in order
+    def test_profile_report(self):
+        if "xml.dom.minidom" in sys.modules:
+            self.skipTest("already imported")
+        profile = StartupProfile()
+        profile.install()
+        try:
+            with profile.phase("load"):
+                __import__("xml.dom.minidom")
+        finally:
+            profile.uninstall()
+        names = [entry[0] for entry in profile.imports]
+        self.assertEqual(names[0], "xml.dom.minidom")
+        self.assertTrue(all(entry[3] > 0 for entry in profile.imports[1:]))
+        out = io.StringIO()
+        profile.report(out, min_ms=0)
+        self.assertIn("load", out.getvalue())
+        self.assertIn("xml.dom.minidom", out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
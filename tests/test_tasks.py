@@ -0,0 +1,69 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import threading
+import time
+import unittest
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt6.QtWidgets import QApplication, QWidget
+    from gui.tasks import TaskRunner
+except ImportError:
+    QApplication = None
+
+
+def wait_until(app, condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    return condition()
+
+
+# Test cases for the background task runner used by the windows
+@unittest.skipUnless(QApplication, "PyQt6 not installed")
+class TestTaskRunner(unittest.TestCase):
+
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication([])
+        self.window = QWidget()
+        self.runner = TaskRunner(self.window)
+        self.busy = []
+        self.runner.busy_changed.connect(self.busy.append)
+
+    # Work runs off the GUI thread; its result comes back on it
+    def test_result_delivered_on_gui_thread(self):
+        results = []
+        self.runner.submit(lambda x: (x * 2, threading.get_ident()), 21,
+                           on_done=lambda r: results.append((r, threading.get_ident())))
+        self.assertTrue(wait_until(self.app, lambda: results))
+        (value, worker), gui = results[0]
+        self.assertEqual(value, 42)
+        self.assertNotEqual(worker, gui)
+        self.assertEqual(gui, threading.get_ident())
+        self.assertEqual(self.busy, [True, False])
+
+    # Closing the window drops results that arrive afterwards
+    def test_close_cancels(self):
+        release = threading.Event()
+        results = []
+        task = self.runner.submit(release.wait, on_done=results.append)
+        self.window.close()
+        self.assertTrue(task.cancelled)
+        self.assertFalse(self.runner.busy)
+        release.set()
+        self.runner.pool.waitForDone(5000)
+        self.app.processEvents()
+        self.assertEqual(results, [])
+
+    # Exceptions are handed to on_error
+    def test_errors(self):
+        errors = []
+        self.runner.submit(lambda: 1 / 0, on_error=errors.append)
+        self.assertTrue(wait_until(self.app, lambda: errors))
+        self.assertIsInstance(errors[0], ZeroDivisionError)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+# utils/auth.py
+"""
+Password hashing with a bcrypt cost fitted to this machine.
+
+    auth = auth_service()
+    ok, new_hash = auth.verify(password, user["hashed_password"])
+    if ok and new_hash:
+        db.update_password(email, new_hash)   # stored under the old policy
+
+The cost is calibrated on first use (main.py starts that in the background
+right after the first paint): one hash at CALIBRATION_COST is timed and
+the highest cost whose estimated hash time, doubling per step, stays within
+`target_seconds` is picked, clamped to [min_cost, max_cost].
+
+verify() reports a new hash when the stored one is weaker than the current
+cost or above max_cost. Stronger hashes within the range are kept, so
+machines of different speed sharing one database do not rehash each
+other's passwords back and forth.
+
+At most `max_workers` bcrypt calls run at once, whichever threads make
+them; the rest wait their turn, so a login storm cannot take every core.
+stats() reports the cost and recent hashing latencies.
+"""
+
+import math
+import os
+import threading
+import time
+from collections import deque
+from typing import Optional, Tuple
+
+from utils.encryption import check_password, hash_cost, hash_password
+
+CALIBRATION_COST = 8
+
+
+class AuthService:
+    """Bounded, calibrated bcrypt hashing with latency metrics. Thread-safe."""
+
+    def __init__(self, target_seconds: float = 0.25, min_cost: int = 10,
+                 max_cost: int = 14, max_workers: int = None, window: int = 256):
+        self.target_seconds = target_seconds
+        self.min_cost = min_cost
+        self.max_cost = max_cost
+        # half the cores, so logins never starve everything else
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self._lock = threading.Lock()
+        self._cost = None
+        self._samples = {"hash": deque(maxlen=window), "verify": deque(maxlen=window)}
+        self.rehashed = 0
+
+    @property
+    def cost(self) -> int:
+        """The bcrypt cost new hashes get (calibrated on first use)."""
+        if self._cost is None:
+            self.calibrate()
+        return self._cost
+
+    def calibrate(self) -> int:
+        """Time one cheap hash and fit the cost to target_seconds."""
+        with self._lock:
+            if self._cost is None:
+                with self._slots:
+                    start = time.perf_counter()
+                    hash_password("calibration", CALIBRATION_COST)
+                    seconds = time.perf_counter() - start
+                steps = math.floor(math.log2(self.target_seconds / seconds)) if seconds > 0 else 0
+                self._cost = min(max(CALIBRATION_COST + steps, self.min_cost), self.max_cost)
+        return self._cost
+
+    def hash(self, password: str) -> str:
+        """Hash `password` at the current cost."""
+        cost = self.cost
+        return self._timed("hash", hash_password, password, cost)
+
+    def verify(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """
+        Check `password` against `hashed`. Returns (matches, new hash or
+        None); the new hash is only made for a correct password whose
+        stored hash needs_rehash().
+        """
+        if not self._timed("verify", check_password, password, hashed):
+            return False, None
+        if not self.needs_rehash(hashed):
+            return True, None
+        new_hash = self.hash(password)
+        with self._lock:
+            self.rehashed += 1
+        return True, new_hash
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """True if `hashed` was made under another cost policy."""
+        cost = hash_cost(hashed)
+        return cost < self.cost or cost > self.max_cost
+
+    def _timed(self, op, fn, *args):
+        queued = time.perf_counter()
+        with self._slots:
+            start = time.perf_counter()
+            result = fn(*args)
+            end = time.perf_counter()
+        with self._lock:
+            self._samples[op].append((start - queued, end - start))
+        return result
+
+    def stats(self) -> dict:
+        """
+        The current cost and, per operation ("hash", "verify"), the count,
+        mean, p95 and max of the last `window` bcrypt times and the mean
+        time spent waiting for a free slot, all in milliseconds.
+        """
+        with self._lock:
+            samples = {op: list(s) for op, s in self._samples.items()}
+            result = {"cost": self._cost, "max_workers": self.max_workers,
+                      "rehashed": self.rehashed}
+        for op, pairs in samples.items():
+            times = sorted(seconds for _, seconds in pairs)
+            n = len(times)
+            result[op] = {
+                "count": n,
+                "mean_ms": sum(times) / n * 1000 if n else 0.0,
+                "p95_ms": times[int(0.95 * (n - 1))] * 1000 if n else 0.0,
+                "max_ms": times[-1] * 1000 if n else 0.0,
+                "wait_ms": sum(wait for wait, _ in pairs) / n * 1000 if n else 0.0,
+            }
+        return result
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def auth_service() -> AuthService:
+    """The AuthService the application shares."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = AuthService()
+        return _service
@@ -1,9 +1,16 @@
 import bcrypt  # Library for hashing and verifying passwords securely
 
-# Hash a plain-text password using bcrypt
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+# bcrypt's own default cost (2^12 rounds)
+DEFAULT_COST = 12
+
+# Hash a plain-text password using bcrypt at the given cost
+def hash_password(password: str, cost: int = DEFAULT_COST) -> str:
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(cost)).decode()
 
 # Check if a plain-text password matches the hashed password
 def check_password(password: str, hashed: str) -> bool:
     return bcrypt.checkpw(password.encode(), hashed.encode())
+
+# The cost a hash was made with ("$2b$12$..." -> 12)
+def hash_cost(hashed: str) -> int:
+    return int(hashed.split("$")[2])
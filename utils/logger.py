@@ -1,23 +1,42 @@
 import logging
 import os
 
-# Ensure logs/ directory exists
-os.makedirs("logs", exist_ok=True)
+_configured = False
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("logs/app.log"),
-        logging.StreamHandler()
-    ]
-)
 
-logger = logging.getLogger("AMSLogger")
+def get_logger():
+    """
+    Return the "AMSLogger" logger, creating logs/ and the handlers on the
+    first call rather than when this module is imported.
+    """
+    global _configured
+    if not _configured:
+        # Ensure logs/ directory exists
+        os.makedirs("logs", exist_ok=True)
+
+        # Configure logging
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.FileHandler("logs/app.log"),
+                logging.StreamHandler()
+            ]
+        )
+        _configured = True
+    return logging.getLogger("AMSLogger")
+
+
+def __getattr__(name):
+    # `from utils.logger import logger` keeps working and configures on use
+    if name == "logger":
+        return get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Example usage
 if __name__ == "__main__":
+    logger = get_logger()
     logger.info("Logging is configured correctly.")
     logger.warning("This is a warning.")
     logger.error("This is an error log.")
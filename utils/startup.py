@@ -0,0 +1,105 @@
+# utils/startup.py
+"""
+Startup timing for `python main.py --profile-startup`.
+
+StartupProfile times every module imported after install() (total time,
+including the modules it imports, and self time) and the named phases
+main() wraps in phase(), then prints both once the first window has been
+painted. Only the standard library is used here, so the profiler itself
+adds next to nothing to what it measures.
+"""
+
+import builtins
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StartupProfile:
+    """Import and phase timings, measured from construction."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self.phases = []    # (name, seconds)
+        self.imports = []   # [module, total seconds, self seconds, depth], in import order
+        self._stack = []    # child time of each import in progress
+        self._import = None
+
+    def install(self):
+        """Start timing imports (no-op when disabled)."""
+        if not self.enabled or self._import is not None:
+            return
+        self._import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def uninstall(self):
+        if self._import is not None:
+            builtins.__import__ = self._import
+            self._import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Only first imports cost anything; later ones are a sys.modules hit
+        if level or name in sys.modules:
+            return self._import(name, globals, locals, fromlist, level)
+        entry = [name, 0.0, 0.0, len(self._stack)]
+        self.imports.append(entry)
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._import(name, globals, locals, fromlist, level)
+        finally:
+            total = time.perf_counter() - start
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += total
+            entry[1:3] = total, total - children
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the enclosed block as one named startup phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.enabled:
+                self.phases.append((name, time.perf_counter() - start))
+
+    def mark(self, name: str):
+        """Record the time from construction to now as phase `name`."""
+        if self.enabled:
+            self.phases.append((name, time.perf_counter() - self.start))
+
+    def report(self, file=None, min_ms: float = 1.0):
+        """
+        Print the phases in order, then the imports that took at least
+        `min_ms` in import order, indented under the module importing them.
+        """
+        if not self.enabled:
+            return
+        file = file or sys.stderr
+        print("startup phases (ms):", file=file)
+        for name, seconds in self.phases:
+            print(f"  {seconds * 1000:9.1f}  {name}", file=file)
+        print(f"imports (ms; {len(self.imports)} modules, those over {min_ms} ms):", file=file)
+        print(f"  {'total':>9}  {'self':>9}  module", file=file)
+        for name, total, own, depth in self.imports:
+            if total * 1000 >= min_ms:
+                print(f"  {total * 1000:9.1f}  {own * 1000:9.1f}  {'  ' * depth}{name}", file=file)
+
+
+def on_first_paint(widget, callback):
+    """Call `callback()` once, right after `widget` is first painted."""
+    from PyQt6.QtCore import QEvent, QObject, QTimer
+
+    class _Watcher(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint:
+                widget.removeEventFilter(self)
+                # after this paint event has been handled
+                QTimer.singleShot(0, callback)
+            return False
+
+    watcher = _Watcher(widget)
+    widget.installEventFilter(watcher)
+    return watcher